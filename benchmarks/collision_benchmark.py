@@ -0,0 +1,147 @@
+"""
+Benchmark de la fase estrecha de colisiones.
+
+Reparte muchos enemigos y coleccionables (imágenes y formas del juego, girando
+y cayendo con FallingStore) alrededor de los jugadores y mide por frame
+pygame.sprite.spritecollide con cada callback: collide_mask con las máscaras
+de las imágenes completas (línea base, copias sin forma registrada),
+collide_hull y collide_swept. También mide el coste de una pareja que se toca
+y el de una que pasa el descarte por rectángulos pero no se toca.
+
+Uso:
+    python benchmarks/collision_benchmark.py [--count 400] [--frames 200] [--players 2]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame  # noqa: E402
+from makeuprain.config import SCREEN_WIDTH, SCREEN_HEIGHT, ASSET_PATHS, CollisionConfig, CollectibleConfig  # noqa: E402
+from makeuprain.core.clock import GameClock  # noqa: E402
+from makeuprain.entities import (  # noqa: E402
+    Player, Enemy, Collectible, FallingStore, register_hull, collide_hull, collide_swept
+)
+from makeuprain.utils import asset_manager  # noqa: E402
+
+# (nombre, usa las formas registradas, callback)
+CALLBACKS = (
+    ('collide_mask', False, pygame.sprite.collide_mask),
+    ('collide_hull', True, collide_hull),
+    ('collide_swept', True, collide_swept),
+)
+
+
+def _load_images() -> dict:
+    images = {}
+    for kind in ('player', 'enemy', 'collectible'):
+        images[kind] = asset_manager.load_image(ASSET_PATHS[kind])
+        register_hull(images[kind], CollisionConfig.HULLS[kind])
+    return images
+
+
+def _build_scene(images: dict, count: int, player_count: int, clock: GameClock):
+    """Jugadores, almacén y grupo, siempre en las mismas posiciones."""
+    random.seed(1)
+    players = []
+    for index in range(player_count):
+        x = SCREEN_WIDTH * (index + 1) // (player_count + 1)
+        player = Player(x, SCREEN_HEIGHT - 150, images['player'], clock, player_id=index + 1)
+        player.motion = (6, 0)  # Movimiento lateral para la colisión continua
+        players.append(player)
+    store = FallingStore()
+    group = _spawn(count, images, players, store)
+    return players, store, group
+
+
+def _spawn(count: int, images: dict, players: list, store: FallingStore) -> pygame.sprite.Group:
+    """Entidades en una franja alrededor de los jugadores: casi todas llegan a la fase estrecha."""
+    group = pygame.sprite.Group()
+    for i in range(count):
+        player = players[i % len(players)]
+        x = player.rect.centerx + random.randint(-80, 80)
+        y = player.rect.centery + random.randint(-80, 80)
+        speed = random.uniform(2.0, 8.0)
+        if i % 2:
+            entity = Enemy(x, y, images['enemy'], speed)
+            store.add(entity, speed, spin=entity.rotation)
+        else:
+            entity = Collectible(x, y, images['collectible'], speed)
+            store.add(entity, speed, phase=entity.phase, bob=CollectibleConfig.BOB_AMPLITUDE)
+        group.add(entity)
+    return group
+
+
+def _time_pairs(callback, pairs: list, repeat: int = 20) -> float:
+    """Microsegundos por llamada sobre una lista de parejas."""
+    if not pairs:
+        return float('nan')
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for a, b in pairs:
+            callback(a, b)
+    return (time.perf_counter() - start) / (repeat * len(pairs)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=400, help='Enemigos y coleccionables alrededor de los jugadores')
+    parser.add_argument('--frames', type=int, default=200, help='Frames medidos')
+    parser.add_argument('--players', type=int, default=2, help='Jugadores')
+    args = parser.parse_args()
+    
+    pygame.display.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    images = _load_images()
+    clock = GameClock()
+    # Copias sin forma registrada: las entidades usan la máscara de la imagen completa
+    plain_images = {kind: image.copy() for kind, image in images.items()}
+    scenes = {
+        True: _build_scene(images, args.count, args.players, clock),
+        False: _build_scene(plain_images, args.count, args.players, clock),
+    }
+    
+    print(f"{args.count} entidades alrededor de {args.players} jugadores, {args.frames} frames")
+    print(f"{'callback':<16}{'ms/frame':>10}{'impactos':>10}")
+    for name, hulls, callback in CALLBACKS:
+        players, store, group = scenes[hulls]
+        start_y = store.y.copy()
+        store.angle[:] = 0.0
+        elapsed = 0.0
+        hits = 0
+        for _ in range(args.frames):
+            # Mismo recorrido para cada callback: caen y giran, pero vuelven a la franja
+            store.y[:] = start_y
+            store.step()
+            start = time.perf_counter()
+            for player in players:
+                hits += len(pygame.sprite.spritecollide(player, group, False, callback))
+            elapsed += time.perf_counter() - start
+        print(f"{name:<16}{elapsed / args.frames * 1000:>8.3f}ms{hits:>10}")
+    
+    # Coste por pareja: las que se tocan y las que solo pasan el descarte por rectángulos
+    # (clasificadas con las máscaras completas; las dos escenas tienen las mismas posiciones)
+    pairs = {True: ([], []), False: ([], [])}
+    plain_players, _, plain_group = scenes[False]
+    hull_players, _, hull_group = scenes[True]
+    for plain_player, hull_player in zip(plain_players, hull_players):
+        for plain_entity, hull_entity in zip(plain_group.sprites(), hull_group.sprites()):
+            if plain_player.rect.colliderect(plain_entity.rect):
+                index = 0 if pygame.sprite.collide_mask(plain_player, plain_entity) else 1
+                pairs[False][index].append((plain_player, plain_entity))
+                pairs[True][index].append((hull_player, hull_entity))
+    touching, near = pairs[False]
+    print(f"\n{'callback':<16}{'se tocan':>12}{'cerca':>12}   ({len(touching)} y {len(near)} parejas)")
+    for name, hulls, callback in CALLBACKS:
+        touching, near = pairs[hulls]
+        print(f"{name:<16}{_time_pairs(callback, touching):>10.2f}us{_time_pairs(callback, near):>10.2f}us")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark del movimiento de entidades que caen.
+
+Compara Sprite.update() por entidad con el paso vectorizado de FallingStore.
+
+Uso:
+    python benchmarks/falling_benchmark.py [--count 2000] [--frames 300]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+
+import pygame  # noqa: E402
+from makeuprain.config import SCREEN_WIDTH, SCREEN_HEIGHT, CollectibleConfig  # noqa: E402
+from makeuprain.entities import Enemy, Collectible, FallingStore  # noqa: E402
+
+
+def _spawn(count: int, image: pygame.Surface, group: pygame.sprite.Group, store: FallingStore = None):
+    for i in range(count):
+        # Velocidades bajas para que ninguna entidad salga durante la medición
+        x = random.randint(0, SCREEN_WIDTH - image.get_width())
+        y = random.randint(-SCREEN_HEIGHT * 4, 0)
+        speed = random.uniform(0.5, 1.0)
+        cls = Enemy if i % 2 else Collectible
+        entity = cls(x, y, image, speed)
+        group.add(entity)
+        if store is not None:
+            if cls is Enemy:
+                store.add(entity, speed, spin=entity.rotation)
+            else:
+                store.add(entity, speed, phase=entity.phase, bob=CollectibleConfig.BOB_AMPLITUDE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=2000, help='Entidades simultáneas')
+    parser.add_argument('--frames', type=int, default=300, help='Frames simulados')
+    args = parser.parse_args()
+    
+    pygame.display.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    image = pygame.Surface((35, 35), pygame.SRCALPHA)
+    
+    random.seed(1)
+    group = pygame.sprite.Group()
+    _spawn(args.count, image, group)
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        group.update()
+    per_sprite = (time.perf_counter() - start) / args.frames
+    
+    random.seed(1)
+    group = pygame.sprite.Group()
+    store = FallingStore()
+    _spawn(args.count, image, group, store)
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        store.step()
+    vectorized = (time.perf_counter() - start) / args.frames
+    
+    print(f"{args.count} entidades, {args.frames} frames")
+    print(f"Sprite.update() por entidad: {per_sprite * 1000:7.3f} ms/frame")
+    print(f"FallingStore.step():         {vectorized * 1000:7.3f} ms/frame")
+    print(f"Aceleración: {per_sprite / vectorized:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,132 @@
+"""
+Benchmark del retardo entrada-pantalla.
+
+Un hilo inyecta pulsaciones (KEYDOWN) en la cola de eventos en instantes
+aleatorios, cada una con la hora a la que se envió, y se mide el tiempo
+hasta el flip del primer frame que la leyó. Se compara el orden de frame
+normal (entrada, lógica, dibujo, espera, flip) con PacingConfig.LATE_LATCH
+(espera, entrada, lógica, dibujo, flip), cada uno en un proceso nuevo.
+También se muestran las cotas que mide el propio juego para las mismas
+pulsaciones (input_to_present_ms e input_to_present_max_ms).
+
+Uso:
+    python benchmarks/latency_benchmark.py [--seconds 5] [--work-ms 0] [--headless]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODES = ('normal', 'late_latch')
+
+# Código ejecutado en el proceso hijo: partida en marcha con pulsaciones inyectadas
+CHILD_CODE = """
+import json, random, sys, threading, time
+import pygame
+from makeuprain.config import PacingConfig, QualityConfig
+mode, seconds, work_ms = sys.argv[1], float(sys.argv[2]), float(sys.argv[3])
+PacingConfig.LATE_LATCH = mode == 'late_latch'
+QualityConfig.ENABLED = False
+from makeuprain.core.game_manager import GameManager
+from makeuprain.core.instrumentation import instrumentation
+game = GameManager()
+game.change_scene('game')
+
+# Trabajo extra por frame (simula una escena más pesada)
+update = game.current_scene.update
+def heavy_update():
+    update()
+    end = time.perf_counter() + work_ms / 1000
+    while time.perf_counter() < end:
+        pass
+game.current_scene.update = heavy_update
+
+# Pulsaciones leídas en el frame actual (hora de envío)
+pending, latencies = [], []
+poll = game.input.poll
+def timed_poll(events):
+    pending.extend(event.sent for event in events if event.type == pygame.KEYDOWN and hasattr(event, 'sent'))
+    return poll(events)
+game.input.poll = timed_poll
+presented = game.pacer.presented
+def timed_presented():
+    presented()
+    now = time.perf_counter()
+    latencies.extend((now - sent) * 1000 for sent in pending)
+    pending.clear()
+game.pacer.presented = timed_presented
+
+running = True
+def inject():
+    random.seed(1)
+    while running:
+        time.sleep(random.uniform(0.02, 0.05))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F1, sent=time.perf_counter()))
+injector = threading.Thread(target=inject, daemon=True)
+injector.start()
+
+end = time.perf_counter() + seconds
+while time.perf_counter() < end and game.running:
+    game.run_frame(pace=True)
+running = False
+histograms = instrumentation.histograms
+print(json.dumps({
+    'latencies': latencies,
+    'lower': histograms['input_to_present_ms'].summary(),
+    'upper': histograms['input_to_present_max_ms'].summary(),
+}))
+"""
+
+
+def _child_env(headless: bool) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    if headless:
+        env.setdefault('SDL_VIDEODRIVER', 'dummy')
+        env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    return env
+
+
+def _run_mode(mode: str, args) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE, mode, str(args.seconds), str(args.work_ms)],
+        capture_output=True, text=True, cwd=ROOT_DIR, env=_child_env(args.headless)
+    )
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(f"El modo {mode} falló:\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seconds', type=float, default=5.0, help='Duración de cada modo')
+    parser.add_argument('--work-ms', type=float, default=0.0, help='Trabajo extra por frame en ms')
+    parser.add_argument('--headless', action='store_true', help='Sin ventana (SDL_VIDEODRIVER=dummy)')
+    args = parser.parse_args()
+    
+    print(f"{args.seconds:.0f} s por modo, {args.work_ms:.1f} ms de trabajo extra por frame")
+    print(f"{'modo':<14}{'n':>6}{'media':>10}{'p50':>10}{'p95':>10}{'máx':>10}")
+    reports = {}
+    for mode in MODES:
+        reports[mode] = report = _run_mode(mode, args)
+        times = sorted(report['latencies'])
+        if not times:
+            print(f"{mode:<14}{0:>6}  sin pulsaciones medidas")
+            continue
+        print(
+            f"{mode:<14}{len(times):>6}{statistics.mean(times):>8.2f}ms{times[len(times) // 2]:>8.2f}ms"
+            f"{times[int(len(times) * 0.95)]:>8.2f}ms{times[-1]:>8.2f}ms"
+        )
+    print("\nCotas medidas por el juego (desde la lectura / desde la lectura anterior):")
+    for mode, report in reports.items():
+        print(f"{mode:<14}{report['lower']}")
+        print(f"{'':<14}{report['upper']}")
+
+
+if __name__ == '__main__':
+    main()
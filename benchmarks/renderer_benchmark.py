@@ -0,0 +1,104 @@
+"""
+Benchmark de los backends de dibujo.
+
+Dibuja la misma escena de juego (mismas entidades, partículas y HUD) con
+cada backend de RenderConfig en un proceso nuevo y compara el tiempo por
+frame de begin_frame + render + end_frame + present. Cada backend crea su
+propia ventana, por eso se mide en procesos separados.
+
+Uso:
+    python benchmarks/renderer_benchmark.py [--frames 300] [--enemies 60] [--particles 300] [--headless]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BACKENDS = ('software', 'texture')
+
+# Código ejecutado en el proceso hijo: monta la escena y mide solo el dibujo
+CHILD_CODE = """
+import json, random, sys, time
+from makeuprain.config import RenderConfig, QualityConfig, Colors, SCREEN_WIDTH, SCREEN_HEIGHT
+from makeuprain.entities import create_particle_burst
+backend, frames, enemies, particles = sys.argv[1], int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4])
+RenderConfig.BACKEND = backend
+QualityConfig.ENABLED = False
+from makeuprain.core.game_manager import GameManager
+game = GameManager()
+game.change_scene('game')
+scene = game.current_scene
+scene.transition_alpha = 0
+
+# Escena fija: la misma en todos los backends
+random.seed(1)
+scene.pending.clear()
+for kind, count in (('enemy', enemies), ('collectible', enemies // 2)):
+    for _ in range(count):
+        # Quietas en pantalla: solo giran y flotan
+        x = random.randint(0, SCREEN_WIDTH - 60)
+        y = random.randint(0, SCREEN_HEIGHT - 60)
+        scene._activate(kind, x, y, 0.0)
+scene.particles = create_particle_burst(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, Colors.PINK, particles)
+
+renderer = game.renderer
+times = []
+for _ in range(frames):
+    scene.falling.step()  # Rotación y flotación cambian cada frame
+    scene.game_manager.score_system.update()
+    start = time.perf_counter()
+    renderer.begin_frame(Colors.DARK_BG)
+    scene.render(renderer)
+    renderer.end_frame()
+    renderer.present()
+    times.append((time.perf_counter() - start) * 1000)
+print(json.dumps({'backend': renderer.name, 'times': times}))
+"""
+
+
+def _child_env(headless: bool) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    if headless:
+        env.setdefault('SDL_VIDEODRIVER', 'dummy')
+        env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    return env
+
+
+def _run_backend(backend: str, args) -> dict:
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE, backend, str(args.frames), str(args.enemies), str(args.particles)],
+        capture_output=True, text=True, cwd=ROOT_DIR, env=_child_env(args.headless)
+    )
+    for line in reversed(result.stdout.splitlines()):
+        if line.startswith('{'):
+            return json.loads(line)
+    raise RuntimeError(f"El backend {backend} falló:\n{result.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--frames', type=int, default=300, help='Frames dibujados por backend')
+    parser.add_argument('--enemies', type=int, default=60, help='Enemigos en pantalla (y la mitad de coleccionables)')
+    parser.add_argument('--particles', type=int, default=300, help='Partículas en pantalla')
+    parser.add_argument('--headless', action='store_true', help='Sin ventana (SDL_VIDEODRIVER=dummy)')
+    args = parser.parse_args()
+    
+    print(f"{args.frames} frames, {args.enemies} enemigos, {args.particles} partículas")
+    print(f"{'backend':<22}{'media':>10}{'p50':>10}{'p95':>10}{'máx':>10}")
+    for backend in BACKENDS:
+        report = _run_backend(backend, args)
+        times = sorted(report['times'][10:])  # Sin los primeros frames (subida de texturas)
+        label = backend if report['backend'] == backend else f"{backend} -> {report['backend']}"
+        print(
+            f"{label:<22}{statistics.mean(times):>8.2f}ms{times[len(times) // 2]:>8.2f}ms"
+            f"{times[int(len(times) * 0.95)]:>8.2f}ms{times[-1]:>8.2f}ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
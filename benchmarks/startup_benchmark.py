@@ -0,0 +1,102 @@
+"""
+Benchmark de arranque de Makeup Rain.
+
+Mide dos cosas en procesos nuevos (arranque en frío):
+    1. Informe estilo ``python -X importtime`` de los módulos más costosos.
+    2. Tiempo hasta el primer flip (desde que se lanza el intérprete).
+
+Uso:
+    python benchmarks/startup_benchmark.py [--runs 5] [--top 15] [--headless]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Código ejecutado en el proceso hijo: construye el juego y dibuja un frame
+CHILD_CODE = """
+import json, time
+from makeuprain.core.game_manager import GameManager
+game = GameManager()
+game.run_frame()
+flip_wall = time.time()
+game.run_frame()  # El segundo frame inicializa el mixer
+marks = dict(game.startup.marks)
+marks['mixer_init'] = game.mixer_loader.elapsed
+print(json.dumps({'flip_wall': flip_wall, 'marks': marks}))
+"""
+
+
+def _child_env(headless: bool) -> dict:
+    env = dict(os.environ)
+    env['PYTHONPATH'] = ROOT_DIR + os.pathsep + env.get('PYTHONPATH', '')
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    if headless:
+        env.setdefault('SDL_VIDEODRIVER', 'dummy')
+        env.setdefault('SDL_AUDIODRIVER', 'dummy')
+    return env
+
+
+def import_time_report(top: int, headless: bool) -> list:
+    """Ejecuta -X importtime y devuelve los módulos con mayor tiempo acumulado."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import makeuprain.core.game_manager'],
+        capture_output=True, text=True, env=_child_env(headless), cwd=ROOT_DIR
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append((int(cumulative_us), int(self_us), name.strip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def time_to_first_flip(runs: int, headless: bool) -> list:
+    """Lanza el juego varias veces y mide el tiempo hasta el primer flip."""
+    samples = []
+    for _ in range(runs):
+        launch = time.time()
+        result = subprocess.run(
+            [sys.executable, '-c', CHILD_CODE],
+            capture_output=True, text=True, env=_child_env(headless), cwd=ROOT_DIR
+        )
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr)
+        data = json.loads(result.stdout.strip().splitlines()[-1])
+        data['first_flip_total'] = data['flip_wall'] - launch
+        samples.append(data)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=5, help='Repeticiones del arranque en frío')
+    parser.add_argument('--top', type=int, default=15, help='Módulos a mostrar en el informe de imports')
+    parser.add_argument('--headless', action='store_true', help='Usar drivers SDL dummy (sin ventana ni audio)')
+    args = parser.parse_args()
+    
+    print("=== Imports más costosos (-X importtime, acumulado) ===")
+    for cumulative_us, self_us, name in import_time_report(args.top, args.headless):
+        print(f"{cumulative_us / 1000:9.2f} ms  (propio {self_us / 1000:7.2f} ms)  {name}")
+    
+    print(f"\n=== Tiempo hasta el primer flip ({args.runs} ejecuciones) ===")
+    samples = time_to_first_flip(args.runs, args.headless)
+    totals = [sample['first_flip_total'] * 1000 for sample in samples]
+    print(f"Total (lanzamiento -> flip): mediana {statistics.median(totals):.1f} ms, "
+          f"mín {min(totals):.1f} ms, máx {max(totals):.1f} ms")
+    
+    print("\nMarcas internas (mediana, desde GameManager.__init__):")
+    for name in samples[0]['marks']:
+        values = [sample['marks'][name] * 1000 for sample in samples if name in sample['marks']]
+        print(f"{statistics.median(values):9.2f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,13 +6,21 @@ Juego arcade de recolección mejorado con arquitectura profesional.
 __version__ = '2.0.0'
 __author__ = 'Camilandia20'
 
-from .core.game_manager import GameManager
 
 
 def run():
     """Punto de entrada principal del juego."""
+    from .core.game_manager import GameManager
     game = GameManager()
     game.run()
 
 
+def __getattr__(name):
+    # Importación diferida: pygame y las escenas solo se cargan al usarse
+    if name == 'GameManager':
+        from .core.game_manager import GameManager
+        return GameManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = ['run', 'GameManager']
@@ -19,6 +19,33 @@ GAME_TITLE = "Makeup Rain ✨"
 FULLSCREEN = False  # Cambiar a True para pantalla completa
 RESIZABLE = True    # Permite redimensionar la ventana
 
+# ===== RITMO DE FRAMES =====
+class PacingConfig:
+    MODE = 'low_jitter'   # 'low_jitter' (sleep + espera activa) o 'power_saving' (solo sleep)
+    SPIN_MARGIN_MS = 2.0  # ms antes del plazo en que se pasa de sleep a espera activa
+    VSYNC = False         # Sincronizar el flip con el refresco (si el backend lo permite)
+    ASYNC_LOOP = False    # Bucle principal sobre asyncio (corrutinas de E/S en el tiempo libre)
+    LATE_LATCH = False    # Dormir antes de leer la entrada (menos retardo entrada-pantalla, algo más de variación)
+    LATCH_MARGIN_MS = 1.0  # Con vsync y LATE_LATCH: margen sobre el p95 del trabajo de frame
+
+# ===== REPOSO (FRAME RATE ADAPTATIVO) =====
+class IdleConfig:
+    ENABLED = True              # Bajar el ritmo en escenas estáticas y con la ventana en segundo plano
+    UNFOCUSED_FPS = 10          # Frame rate con la ventana sin foco
+    MINIMIZED_FPS = 2           # Frame rate con la ventana minimizada
+    STATIC_WAIT_MS = 1000       # Escena estática: espera máxima a un evento (las tareas siguen avanzando)
+    ASYNC_POLL_MS = 50          # Bucle asyncio: cada cuánto se miran los eventos en reposo
+    AMBIENT_TIMEOUT_S = 20.0    # Sin entrada durante este tiempo, las animaciones decorativas se detienen
+    PAUSE_ON_FOCUS_LOSS = True  # Pausar la partida al perder el foco
+
+# ===== BACKEND DE DIBUJO =====
+class RenderConfig:
+    BACKEND = 'software'     # 'software' (blits + escalado en CPU) o 'texture' (pygame._sdl2: texturas de SDL)
+    ACCELERATED = -1         # Backend de texturas: -1 = el mejor disponible, 1 = GPU, 0 = renderer por software de SDL
+    SCALE_QUALITY = '1'      # Filtro al escalar texturas a la ventana: '0' = píxeles, '1' = lineal
+    SOFTWARE_SCALE_QUALITY = '0'  # Filtro con el renderer por software de SDL (el lineal rota en CPU con suavizado)
+    OVERLAY_GAP_ROWS = 16    # Backend de texturas: filas vacías que separan dos zonas del lienzo que se suben por separado
+
 # ===== COLORES (Paleta moderna y vibrante) =====
 class Colors:
     # Paleta principal
@@ -60,6 +87,7 @@ class PlayerConfig:
     SPEED = 5.5
     START_LIVES = 3
     INVULNERABILITY_TIME = 1000  # ms después de recibir daño
+    BLINK_INTERVAL = 5 / 60      # Segundos entre cambios del parpadeo de invulnerabilidad
     SIZE_SCALE = 1.0  # Escala de la imagen del jugador
     
     # Controles para jugadores
@@ -72,6 +100,26 @@ class PlayerConfig:
     PLAYER1_TINT = (100, 200, 255)  # Azul claro
     PLAYER2_TINT = (255, 100, 200)  # Rosa
 
+# ===== ENTRADA =====
+class InputConfig:
+    # Teclas de cada acción lógica (se precalculan en tablas al arrancar)
+    KEYMAP = {
+        'p1_left': PlayerConfig.PLAYER1_LEFT,
+        'p1_right': PlayerConfig.PLAYER1_RIGHT,
+        'p2_left': PlayerConfig.PLAYER2_LEFT,
+        'p2_right': PlayerConfig.PLAYER2_RIGHT,
+        'pause': [pygame.K_p],
+        'back': [pygame.K_ESCAPE],
+    }
+    GAMEPADS = True           # Mandos: el primero controla al jugador 1 y el segundo al jugador 2
+    GAMEPAD_DEADZONE = 0.5    # Inclinación mínima del stick para moverse
+    GAMEPAD_BUTTONS = {       # Botones (numeración de SDL, mando tipo Xbox)
+        'pause': [7],         # Start
+        'back': [6],          # Back / Select
+    }
+    RECORD_PATH = None        # Graba la entrada de cada frame en este archivo
+    PLAYBACK_PATH = None      # Reproduce la entrada grabada (o guionizada) de este archivo
+
 # ===== ENEMIGOS =====
 class EnemyConfig:
     SPEED_MIN = 1.5
@@ -86,6 +134,7 @@ class CollectibleConfig:
     INITIAL_COUNT = 20
     SPAWN_MULTIPLIER = 5  # Cuántos items por nivel
     POINTS_VALUE = 50
+    BOB_AMPLITUDE = 30.0  # Desplazamiento horizontal máximo de la flotación (px)
 
 # ===== SISTEMA DE PUNTUACIÓN =====
 class ScoreConfig:
@@ -101,6 +150,97 @@ class ScoreConfig:
 class GameConfig:
     DIFFICULTY_INTERVAL = 1500  # frames entre aumentos de dificultad
     MAX_PARTICLES = 100         # Límite de partículas en pantalla
+    ACTIVATION_MARGIN = 40      # px sobre la pantalla en los que una entidad pendiente se activa
+    DRAW_MARGIN = 20            # px extra del viewport al descartar dibujos (rotaciones)
+    HUD_HEIGHT = 140            # Alto de la superficie cacheada del HUD (cabe el panel de dos jugadores)
+
+# ===== TAREAS EN SEGUNDO PLANO =====
+class JobConfig:
+    MAX_BUDGET_MS = 4.0      # Tiempo máximo por frame para tareas en segundo plano
+    SAFETY_MS = 1.5          # Margen que se deja libre antes del plazo del frame
+    MAX_SKIPPED_FRAMES = 30  # Frames que una tarea espera a que su paso quepa (después avanza en un frame sin juego activo)
+    FIRST_STEP_MS = 1.0      # Coste estimado del primer paso de una tarea sin estimación propia
+    SPAWN_BATCH = 4          # Entidades generadas por paso al empezar una ronda (HIGH: al menos un lote por frame)
+
+# ===== RECOLECTOR DE BASURA =====
+class GCConfig:
+    ENABLED = True                          # Aplicar la política (las pausas se miden siempre)
+    GAMEPLAY_MODE = 'relaxed'               # 'relaxed' (umbrales altos), 'disable' o 'default'
+    GAMEPLAY_THRESHOLDS = (1000, 20, 1000)  # Umbrales de gc.set_threshold durante el juego
+    MAX_PENDING_ALLOCATIONS = 50000         # Con 'disable': recolectar la generación 0 al superarlo
+    REPORT_MS = 2.0                         # Registrar como evento las pausas más largas
+
+# ===== TELEMETRÍA =====
+class TelemetryConfig:
+    ENABLED = True                  # Escribir los eventos de juego en disco (se registran siempre en memoria)
+    DIR = os.path.join(BASE_DIR, 'telemetry')
+    BUFFER_EVENTS = 8192            # Eventos en el anillo de memoria (si el escritor no da abasto, se pierden los más antiguos)
+    FLUSH_INTERVAL_S = 1.0          # Cada cuánto vacía el anillo el hilo escritor
+    MAX_FILE_BYTES = 1024 * 1024    # Tamaño a partir del cual se rota el archivo
+    BACKUPS = 3                     # Archivos rotados que se conservan (.1 es el más reciente)
+    RETRY_S = 10.0                  # Tras un error de escritura (disco lleno...) se descarta durante este tiempo
+    SPIKE_MS = 1000 / FPS           # Frames con más trabajo que esto se registran como pico
+
+# ===== SERVIDOR DE MÉTRICAS =====
+class MetricsConfig:
+    ENABLED = False                 # Servir métricas en formato Prometheus (kioscos, pruebas de rendimiento)
+    HOST = '127.0.0.1'              # Solo local: un recolector en la misma máquina
+    PORT = 9464                     # 0 = puerto libre cualquiera
+    SOCKET_PATH = None              # Ruta de un socket Unix (sustituye a HOST y PORT)
+    PREFIX = 'makeuprain'           # Prefijo de los nombres de métrica
+    QUANTILES = (0.5, 0.95, 0.99)   # Percentiles de las muestras recientes de cada histograma
+
+# ===== CALIDAD ADAPTATIVA =====
+class QualityConfig:
+    ENABLED = True          # Ajustar la calidad según el tiempo de frame medido
+    START_TIER = 0          # Nivel inicial (0 = máxima calidad)
+    WINDOW = 90             # Frames de tiempo de trabajo que se evalúan juntos
+    PERCENTILE = 90         # Percentil del tiempo de trabajo comparado con el presupuesto
+    DOWNGRADE_LOAD = 0.85   # Bajar de nivel si supera este % del presupuesto del frame
+    UPGRADE_LOAD = 0.45     # Subir de nivel si queda por debajo (histéresis)
+    HOLD_FRAMES = 180       # Frames sin cambios tras cada transición
+    # Niveles de mayor a menor calidad
+    TIERS = [
+        {'name': 'alta', 'max_particles': 100, 'particle_scale': 1.0, 'rotation': True,
+         'scaler': 'smooth', 'star_density': 1.0, 'floating_texts': 12},
+        {'name': 'media', 'max_particles': 60, 'particle_scale': 0.6, 'rotation': True,
+         'scaler': 'smooth', 'star_density': 0.6, 'floating_texts': 8},
+        {'name': 'baja', 'max_particles': 30, 'particle_scale': 0.35, 'rotation': False,
+         'scaler': 'fast', 'star_density': 0.3, 'floating_texts': 4},
+        {'name': 'mínima', 'max_particles': 12, 'particle_scale': 0.2, 'rotation': False,
+         'scaler': 'fast', 'star_density': 0.0, 'floating_texts': 2},
+    ]
+
+# ===== PROCESOS (SIMULACIÓN / RENDER) =====
+class ProcessConfig:
+    SPLIT_SIMULATION = False  # Simulación en un proceso aparte; la ventana solo dibuja
+    START_METHOD = 'spawn'    # Método de multiprocessing (spawn funciona igual en todas las plataformas)
+    JOIN_TIMEOUT = 1.0        # Segundos de espera al cerrar el proceso de simulación
+    READ_RETRIES = 3          # Reintentos si una instantánea se reescribe mientras se lee
+
+# ===== COLISIONES =====
+class CollisionConfig:
+    # Forma por asset de ASSET_PATHS: 'circle', 'capsule', 'polygon', 'rect' o 'mask'.
+    # Se puede añadir un parámetro: ('polygon', vértices máximos) o ('mask', factor de reducción)
+    HULLS = {
+        'player': ('polygon', 8),
+        'enemy': 'capsule',
+        'collectible': 'circle',
+    }
+    # Colisión continua: prueba el recorrido del frame completo (velocidades altas)
+    SWEPT = True
+
+# ===== FONDO DE ESTRELLAS (PARALLAX) =====
+class StarfieldConfig:
+    # Capas de fondo a frente: (estrellas, velocidad px/frame, radio, brillo)
+    LAYERS = [
+        (70, 0.25, 1, 90),
+        (40, 0.6, 1, 160),
+        (18, 1.2, 2, 235),
+    ]
+    DENSITY = 1.0  # Multiplicador de estrellas por capa
+    SPEED = 1.0    # Multiplicador de velocidad de scroll
+    SEED = 2025    # Semilla para que el cielo sea siempre el mismo
 
 # ===== SISTEMA DE RONDAS =====
 class RoundConfig:
@@ -119,14 +259,35 @@ class RoundConfig:
     ENEMY_MAX_ON_SCREEN_BASE = 8
     COLLECTIBLE_SPAWN_BASE_FRAMES = 30  # ~0.5s entre items base
     COLLECTIBLE_MAX_ON_SCREEN_BASE = 10
+    ENEMY_SPAWN_MIN_FRAMES = 10
+    COLLECTIBLE_SPAWN_MIN_FRAMES = 8
+    
+    # Oleadas diseñadas por ronda: {ronda: ((segundo, patrón de SpawnConfig.PATTERNS, repetir cada s o 0), ...)}
+    WAVES = {}
+    
+    # Definición de rondas opcional (JSON, ver core.round_table); sin archivo se usan estos valores
+    DEFINITIONS_FILE = os.path.join(ASSETS_DIR, 'data', 'rounds.json')
     
     # Recompensas
     ROUND_CLEAR_BONUS = 500     # Bonus por completar ronda
     TIME_BONUS_PER_SECOND = 10  # Bonus por tiempo restante
     
     # Visual
-    ROUND_TRANSITION_TIME = 3.0  # Segundos de pantalla de transición
+    ROUND_TRANSITION_TIME = 2.0  # Segundos de pantalla de transición
     
+# ===== LÍNEA DE TIEMPO DE APARICIONES =====
+class SpawnConfig:
+    SEED = None          # Semilla de las apariciones (None = una al azar por partida)
+    CHUNK_SECONDS = 30   # Segundos de goteo y oleadas generados de una vez (se amplía bajo demanda)
+    # Patrones de oleada: carriles en fracción del ancho útil, retardo por carril
+    # en frames y factor sobre la velocidad media del tipo en la ronda
+    PATTERNS = {
+        'row': {'kind': 'enemy', 'lanes': (0.1, 0.3, 0.5, 0.7, 0.9), 'delays': (0, 0, 0, 0, 0), 'speed': 1.0},
+        'v': {'kind': 'enemy', 'lanes': (0.1, 0.3, 0.5, 0.7, 0.9), 'delays': (24, 12, 0, 12, 24), 'speed': 1.0},
+        'sweep': {'kind': 'enemy', 'lanes': (0.0, 0.2, 0.4, 0.6, 0.8, 1.0), 'delays': (0, 10, 20, 30, 40, 50), 'speed': 1.2},
+        'shower': {'kind': 'collectible', 'lanes': (0.2, 0.35, 0.5, 0.65, 0.8), 'delays': (0, 8, 16, 24, 32), 'speed': 0.9},
+    }
+
 # ===== MODOS DE JUEGO =====
 class GameMode:
     SINGLE_PLAYER = 1
@@ -136,6 +297,23 @@ class GameMode:
 class AudioConfig:
     MUSIC_VOLUME = 0.6
     SFX_VOLUME = 0.7
+    FREQUENCY = 44100
+    SIZE = -16              # Muestras de 16 bits con signo
+    CHANNELS = 2
+    BUFFER = 512            # Muestras por bloque del mixer (~12 ms a 44.1 kHz; menos = menos latencia)
+    VOICES = 12             # Canales fijos para efectos (si no hay libre se roba una voz)
+    PITCH_STEPS = (1.0, 1.06, 1.12, 1.19, 1.26, 1.33)  # Variantes de tono (el pickup sube con el combo)
+    VOLUME_STEPS = (0.6, 1.0)                          # Variantes de volumen
+    # Efectos: archivo opcional en assets/sounds; si no existe se sintetiza
+    # (onda, frecuencia inicial -> final en Hz, duración en s). La prioridad
+    # decide qué voz se puede robar cuando todos los canales están ocupados.
+    SFX = {
+        'pickup': {'file': 'pickup.wav', 'wave': 'sine', 'freq': (880, 1320), 'duration': 0.10, 'volume': 0.5, 'priority': 1},
+        'combo': {'file': 'combo.wav', 'wave': 'square', 'freq': (660, 1320), 'duration': 0.25, 'volume': 0.3, 'priority': 2},
+        'hit': {'file': 'hit.wav', 'wave': 'noise', 'freq': (400, 80), 'duration': 0.25, 'volume': 0.7, 'priority': 3},
+        'death': {'file': 'death.wav', 'wave': 'square', 'freq': (440, 55), 'duration': 0.8, 'volume': 0.5, 'priority': 4},
+        'round_clear': {'file': 'round_clear.wav', 'wave': 'square', 'freq': (523, 1047), 'duration': 0.5, 'volume': 0.4, 'priority': 3},
+    }
     
 # ===== ASSETS PATHS =====
 ASSET_PATHS = {
@@ -1,6 +1,25 @@
 """
 __init__.py para el paquete core.
 """
-from .game_manager import GameManager
+from .instrumentation import Instrumentation, Histogram, instrumentation
+from .clock import GameClock
+from .frame_pacer import FramePacer
+from .quality import QualityGovernor
+from .gc_policy import GCPolicy
+from .jobs import JobScheduler, JobPriority, Job
+from .renderer import Renderer, SurfaceRenderer, SoftwareRenderer, TextureRenderer, create_renderer
+from .input import Action, InputSnapshot, InputSystem, InputRecorder, InputPlayback
+from .audio import AudioEngine, SoundBank, VoicePool
+from .round_table import RoundTable, RoundParams, load_round_table
+from .telemetry import Telemetry, EventType, telemetry
 
-__all__ = ['GameManager']
+
+def __getattr__(name):
+    # Importación diferida para no cargar todas las escenas al importar core
+    if name == 'GameManager':
+        from .game_manager import GameManager
+        return GameManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+__all__ = ['GameManager', 'GameClock', 'FramePacer', 'QualityGovernor', 'GCPolicy', 'JobScheduler', 'JobPriority', 'Job', 'Renderer', 'SurfaceRenderer', 'SoftwareRenderer', 'TextureRenderer', 'create_renderer', 'Action', 'InputSnapshot', 'InputSystem', 'InputRecorder', 'InputPlayback', 'AudioEngine', 'SoundBank', 'VoicePool', 'RoundTable', 'RoundParams', 'load_round_table', 'Telemetry', 'EventType', 'telemetry', 'Instrumentation', 'Histogram', 'instrumentation']
@@ -0,0 +1,262 @@
+"""
+Motor de audio de baja latencia.
+- El mixer se abre con un buffer pequeño (AudioConfig.BUFFER) en segundo plano.
+- La música se carga una sola vez: la pausa usa pause/unpause y reiniciar la
+  partida rebobina el stream en lugar de volver a abrir el archivo.
+- Los efectos se precargan en bancos con sus variantes de tono y volumen ya
+  calculadas con NumPy (pygame.sndarray): reproducir no crea objetos Sound.
+- Los efectos suenan en un grupo fijo de canales con robo de voces.
+Sin mixer (sin dispositivo de audio o en el proceso de simulación) todo es
+no-op, pero los efectos pedidos se siguen contando (ver cue_counts).
+"""
+import time
+from typing import Dict, Generator, List, Optional
+
+import numpy
+import pygame
+
+from ..config import AudioConfig
+from ..utils import asset_manager
+from .instrumentation import Instrumentation, instrumentation
+
+# Orden fijo de los efectos (índices de cue_counts en la memoria compartida)
+SFX_NAMES = tuple(AudioConfig.SFX)
+
+
+def _synthesize(spec: dict, rate: int) -> numpy.ndarray:
+    """Efecto sintetizado (mono, float en [-1, 1]): barrido de frecuencia con envolvente."""
+    count = int(spec['duration'] * rate)
+    t = numpy.arange(count) / rate
+    start, end = spec['freq']
+    # Barrido exponencial: la fase es la integral de la frecuencia
+    ratio = end / start
+    if ratio == 1:
+        phase = 2 * numpy.pi * start * t
+    else:
+        k = numpy.log(ratio) / spec['duration']
+        phase = 2 * numpy.pi * start * (numpy.exp(k * t) - 1) / k
+    
+    wave = spec['wave']
+    if wave == 'square':
+        samples = numpy.sign(numpy.sin(phase)) * 0.6
+    elif wave == 'noise':
+        # Ruido modulado por el barrido: golpe con tono. Ruido por hash (determinista y
+        # sin crear un generador de numpy.random, cuya primera llamada cuesta ~15 ms)
+        noise = (numpy.sin(numpy.arange(count) * 12.9898) * 43758.5453) % 1.0 * 2 - 1
+        samples = noise * (0.5 + 0.5 * numpy.sin(phase))
+    else:
+        samples = numpy.sin(phase)
+    
+    # Ataque de 5 ms y caída exponencial (sin clics al empezar ni al terminar)
+    attack = max(1, int(0.005 * rate))
+    envelope = numpy.exp(-4 * t / spec['duration'])
+    envelope[:attack] *= numpy.linspace(0, 1, attack)
+    envelope[-attack:] *= numpy.linspace(1, 0, attack)
+    return samples * envelope
+
+
+def _load_samples(filename: str) -> Optional[numpy.ndarray]:
+    """Muestras de un archivo de assets/sounds (mono, float), o None si no existe."""
+    if asset_manager.find_sound(filename) is None:
+        return None
+    sound = asset_manager.load_sound(filename)
+    if sound is None:
+        return None
+    samples = pygame.sndarray.array(sound).astype(numpy.float32)
+    if samples.ndim > 1:
+        samples = samples.mean(axis=1)
+    return samples / 32768
+
+
+class SoundBank:
+    """Variantes precalculadas de un efecto: sounds[tono][volumen]."""
+    
+    def __init__(self, name: str, priority: int):
+        self.name = name
+        self.priority = priority
+        self.sounds: List[List[pygame.mixer.Sound]] = []
+    
+    def add_pitch(self, samples: numpy.ndarray, pitch: float, channels: int):
+        """Añade las variantes de volumen de un tono (remuestreo lineal: más agudo = más corto)."""
+        length = max(1, int(len(samples) / pitch))
+        shifted = numpy.interp(numpy.arange(length) * pitch, numpy.arange(len(samples)), samples)
+        row = []
+        for volume in AudioConfig.VOLUME_STEPS:
+            pcm = numpy.clip(shifted * volume * 32767, -32768, 32767).astype(numpy.int16)
+            if channels > 1:
+                pcm = numpy.ascontiguousarray(numpy.repeat(pcm[:, None], channels, axis=1))
+            row.append(pygame.sndarray.make_sound(pcm))
+        self.sounds.append(row)
+    
+    def get(self, pitch: int = 0, volume: int = -1) -> pygame.mixer.Sound:
+        """Variante por índices de AudioConfig.PITCH_STEPS y VOLUME_STEPS (se recortan al rango)."""
+        row = self.sounds[max(0, min(pitch, len(self.sounds) - 1))]
+        return row[volume] if -len(row) <= volume < len(row) else row[-1]
+
+
+class VoicePool:
+    """
+    Canales fijos para efectos. Si todos suenan, se roba el de menor prioridad
+    (y entre iguales el más antiguo); si todos son más prioritarios, el efecto
+    nuevo se descarta.
+    """
+    
+    def __init__(self, count: int, metrics: Instrumentation = instrumentation):
+        pygame.mixer.set_num_channels(count)
+        self.channels = [pygame.mixer.Channel(index) for index in range(count)]
+        self.started = [0.0] * count
+        self.priorities = [0] * count
+        self.metrics = metrics
+    
+    def play(self, sound: pygame.mixer.Sound, priority: int) -> bool:
+        """Reproduce en un canal libre o robado. Retorna False si se descartó."""
+        index = None
+        for candidate, channel in enumerate(self.channels):
+            if not channel.get_busy():
+                index = candidate
+                break
+        if index is None:
+            index = min(range(len(self.channels)), key=lambda i: (self.priorities[i], self.started[i]))
+            if self.priorities[index] > priority:
+                self.metrics.increment('sfx_dropped')
+                return False
+            self.metrics.increment('sfx_stolen')
+        
+        # Channel.play corta lo que estuviera sonando en ese canal
+        self.channels[index].play(sound)
+        self.started[index] = time.perf_counter()
+        self.priorities[index] = priority
+        self.metrics.increment('sfx_played')
+        return True
+
+
+class AudioEngine:
+    """Música persistente y efectos precargados sobre un grupo fijo de canales."""
+    
+    def __init__(self, metrics: Instrumentation = instrumentation):
+        self.metrics = metrics
+        self.ready = False
+        self.banks: Dict[str, SoundBank] = {}
+        self.voices: Optional[VoicePool] = None
+        # Efectos pedidos desde el inicio (también sin mixer: los lee el render en modo separado)
+        self.cue_counts = [0] * len(SFX_NAMES)
+        self._cue_index = {name: index for index, name in enumerate(SFX_NAMES)}
+        
+        # Música: archivo cargado y estado del stream ('stopped', 'playing', 'paused')
+        self.music_file: Optional[str] = None
+        self.music_state = 'stopped'
+        self._music_failed = set()
+        # Petición de música pendiente mientras el mixer se inicializa
+        self._pending_music: Optional[str] = None
+        self._pending_paused = False
+    
+    def on_mixer_ready(self):
+        """Reserva los canales de efectos y aplica la música pedida antes de tiempo."""
+        self.ready = True
+        self.voices = VoicePool(AudioConfig.VOICES, self.metrics)
+        filename, self._pending_music = self._pending_music, None
+        paused, self._pending_paused = self._pending_paused, False
+        if filename is not None:
+            # Pedida y pausada antes de tiempo: se carga y queda en pausa para resume_music()
+            self.play_music(filename)
+            if paused:
+                self.pause_music()
+    
+    def build_banks(self) -> Generator:
+        """
+        Tarea cooperativa (ver JobScheduler): carga o sintetiza cada efecto y
+        calcula un tono por paso. Un banco se usa cuando está completo.
+        """
+        if not self.ready:
+            return
+        rate, _, channels = pygame.mixer.get_init()
+        for name, spec in AudioConfig.SFX.items():
+            samples = _load_samples(spec['file'])
+            if samples is None:
+                samples = _synthesize(spec, rate)
+            samples = samples * spec['volume'] * AudioConfig.SFX_VOLUME
+            yield
+            bank = SoundBank(name, spec['priority'])
+            for pitch in AudioConfig.PITCH_STEPS:
+                bank.add_pitch(samples, pitch, channels)
+                yield
+            self.banks[name] = bank
+    
+    # ----- Efectos -----
+    
+    def play(self, name: str, pitch: int = 0, volume: int = -1) -> bool:
+        """
+        Reproduce un efecto precargado sin bloquear ni crear objetos.
+
+        Args:
+            name: Efecto de AudioConfig.SFX
+            pitch: Índice de AudioConfig.PITCH_STEPS
+            volume: Índice de AudioConfig.VOLUME_STEPS
+        """
+        self.cue_counts[self._cue_index[name]] += 1
+        bank = self.banks.get(name)
+        if bank is None or self.voices is None:
+            return False
+        return self.voices.play(bank.get(pitch, volume), bank.priority)
+    
+    # ----- Música -----
+    
+    def play_music(self, filename: str, restart: bool = True):
+        """
+        Reproduce la música (se carga solo la primera vez). Con restart=False
+        una música en pausa continúa donde estaba.
+        """
+        if not self.ready:
+            self._pending_music = filename
+            self._pending_paused = False
+            return
+        if filename in self._music_failed:
+            return
+        if filename != self.music_file:
+            path = asset_manager.find_sound(filename)
+            try:
+                if path is None:
+                    raise FileNotFoundError(filename)
+                pygame.mixer.music.load(path)
+            except (pygame.error, FileNotFoundError) as e:
+                # No reintentar en cada partida
+                self._music_failed.add(filename)
+                print(f"⚠️ No se pudo cargar música {filename}: {e}")
+                return
+            self.music_file = filename
+            self.music_state = 'stopped'
+        
+        try:
+            if self.music_state == 'paused' and not restart:
+                pygame.mixer.music.unpause()
+            else:
+                pygame.mixer.music.set_volume(AudioConfig.MUSIC_VOLUME)
+                pygame.mixer.music.play(-1)
+            self.music_state = 'playing'
+        except pygame.error:
+            pass
+    
+    def pause_music(self):
+        """Pausa la música sin descargarla."""
+        if not self.ready:
+            self._pending_paused = True
+            return
+        if self.music_state == 'playing':
+            pygame.mixer.music.pause()
+            self.music_state = 'paused'
+    
+    def resume_music(self):
+        """Continúa la música pausada."""
+        if not self.ready:
+            self._pending_paused = False
+            return
+        if self.music_state == 'paused':
+            pygame.mixer.music.unpause()
+            self.music_state = 'playing'
+    
+    def stop_music(self):
+        """Detiene la música (sigue cargada; la próxima reproducción empieza desde el principio)."""
+        self._pending_music = None
+        if self.ready and self.music_state != 'stopped':
+            pygame.mixer.music.stop()
+            self.music_state = 'stopped'
@@ -0,0 +1,36 @@
+"""
+Reloj de la simulación.
+El tiempo simulado avanza un paso fijo (1/FPS) por cada tick de lógica, no
+con el reloj de pared: la pausa lo detiene y una simulación sin ventana,
+acelerada o reproduciendo una grabación da los mismos temporizadores, bonus
+y parpadeos que a tiempo real. El tiempo real (perf_counter) queda para la
+instrumentación.
+"""
+import time
+
+from ..config import FPS
+
+
+class GameClock:
+    """Tiempo simulado en segundos, avanzado por el bucle de juego."""
+    
+    def __init__(self, rate: int = FPS):
+        self.step = 1.0 / rate
+        self.ticks = 0
+    
+    def tick(self, count: int = 1):
+        """Avanza el tiempo simulado `count` pasos (lo llama la escena que simula)."""
+        self.ticks += count
+    
+    def now(self) -> float:
+        """Segundos simulados desde que se creó el reloj."""
+        return self.ticks * self.step
+    
+    def since(self, start: float) -> float:
+        """Segundos simulados transcurridos desde `start` (un valor anterior de now())."""
+        return self.now() - start
+    
+    @staticmethod
+    def real() -> float:
+        """Reloj de pared monótono (medidas de rendimiento, nunca lógica del juego)."""
+        return time.perf_counter()
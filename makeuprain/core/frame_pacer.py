@@ -0,0 +1,190 @@
+"""
+Control del ritmo de frames.
+Sustituye a pygame.time.Clock.tick: espera hasta una fecha límite absoluta
+por frame (sin acumular deriva) combinando sleep y espera activa, y registra
+el intervalo entre frames, los plazos incumplidos y el retardo entrada-pantalla.
+
+pygame no da la hora de llegada de cada evento, así que el retardo se acota:
+un evento leído en este frame llegó entre la lectura anterior y esta. Se
+registran las dos cotas hasta el flip del primer frame que lo refleja.
+"""
+import asyncio
+import time
+from typing import Optional
+
+from .instrumentation import Instrumentation, instrumentation
+
+# Retardos en ms para el retardo entrada-pantalla (hasta varios frames)
+INPUT_BOUNDS_MS = (2, 4, 8, 12, 16, 20, 25, 33, 50, 67, 100, 150, 250)
+
+
+class FramePacer:
+    """
+    Espera entre frames con dos modos:
+    - 'low_jitter': duerme hasta `spin_margin_ms` antes del plazo y termina
+      con espera activa (más CPU, entrega muy regular).
+    - 'power_saving': solo duerme (menos CPU, más variación entre frames).
+    Con vsync activo el propio flip marca el ritmo y el pacer solo mide.
+    """
+    
+    MODES = ('low_jitter', 'power_saving')
+    
+    def __init__(
+        self,
+        fps: int,
+        mode: str = 'low_jitter',
+        spin_margin_ms: float = 2.0,
+        metrics: Instrumentation = instrumentation
+    ):
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de ritmo desconocido: {mode}")
+        self.period = 1.0 / fps
+        self.base_fps = fps
+        self.fps_target = fps
+        self.mode = mode
+        self.spin_margin = spin_margin_ms / 1000
+        self.vsync = False
+        self.metrics = metrics
+        self.next_deadline: Optional[float] = None
+        self.last_present: Optional[float] = None
+        self.input_time: Optional[float] = None
+        self.input_window_start: Optional[float] = None
+        self.missed = 0
+        self.resuming = False
+        
+        self.interval_ms = metrics.histogram('frame_interval_ms')
+        self.wake_error_ms = metrics.histogram('pacer_wake_error_ms', (0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8))
+        self.input_to_present_ms = metrics.histogram('input_to_present_ms', INPUT_BOUNDS_MS)
+        self.input_to_present_max_ms = metrics.histogram('input_to_present_max_ms', INPUT_BOUNDS_MS)
+    
+    def set_fps(self, fps: int):
+        """Cambia el frame rate objetivo a partir del siguiente plazo."""
+        if fps == self.fps_target:
+            return
+        self.fps_target = fps
+        self.period = 1.0 / fps
+        self.next_deadline = None
+    
+    @property
+    def throttled(self) -> bool:
+        """True si el objetivo está por debajo del frame rate normal (reposo)."""
+        return self.fps_target < self.base_fps
+    
+    def resume(self):
+        """
+        Tras un reposo bloqueante: el siguiente frame se muestra sin esperar y
+        el hueco no cuenta como intervalo entre frames ni como plazo incumplido.
+        """
+        self.next_deadline = None
+        self.last_present = None
+        self.resuming = True
+    
+    def mark_input(self, timestamp: Optional[float] = None, previous_poll: Optional[float] = None):
+        """
+        Anota que este frame leyó entrada del usuario.
+
+        Args:
+            timestamp: Instante en que se recogieron los eventos (cota inferior)
+            previous_poll: Lectura anterior; el evento pudo llegar justo después (cota superior)
+        """
+        if self.input_time is None:
+            self.input_time = time.perf_counter() if timestamp is None else timestamp
+            self.input_window_start = previous_poll
+    
+    def presented(self):
+        """Llamar justo después de pygame.display.flip()."""
+        now = time.perf_counter()
+        if self.last_present is not None:
+            self.interval_ms.observe((now - self.last_present) * 1000)
+        self.last_present = now
+        if self.input_time is not None:
+            self.input_to_present_ms.observe((now - self.input_time) * 1000)
+            if self.input_window_start is not None:
+                self.input_to_present_max_ms.observe((now - self.input_window_start) * 1000)
+            self.input_time = self.input_window_start = None
+    
+    def _next_deadline(self, lead: float = 0.0) -> Optional[float]:
+        """Plazo del frame actual, o None si no hay que esperar (vsync o plazo incumplido)."""
+        now = time.perf_counter()
+        if self.resuming:
+            self.resuming = False
+            self.next_deadline = now + self.period
+            return None
+        if self.vsync and not self.throttled:
+            # El flip ya bloqueó hasta el refresco de pantalla; con `lead` se
+            # despierta ese tiempo antes del siguiente refresco estimado
+            self.next_deadline = None
+            if lead <= 0 or self.last_present is None:
+                return None
+            deadline = self.last_present + self.refresh_period() - lead
+            return deadline if now < deadline else None
+        if self.next_deadline is None:
+            self.next_deadline = now + self.period
+        deadline = self.next_deadline
+        
+        if now > deadline:
+            # Frame demasiado largo: no intentar recuperar el tiempo perdido
+            self.missed += 1
+            self.metrics.increment('missed_deadlines')
+            self.next_deadline = now + self.period
+            return None
+        return deadline
+    
+    def _finish_wait(self, deadline: float):
+        """Espera activa hasta el plazo (modo low_jitter) y registra el error de despertar."""
+        if self.mode == 'low_jitter':
+            while time.perf_counter() < deadline:
+                pass
+        woke = time.perf_counter()
+        self.wake_error_ms.observe(max(0.0, woke - deadline) * 1000)
+        self.next_deadline = None if self.vsync and not self.throttled else deadline + self.period
+    
+    def _sleep_time(self, deadline: float) -> float:
+        """Segundos que se pueden dormir antes de pasar a la espera activa."""
+        remaining = deadline - time.perf_counter()
+        if self.mode == 'low_jitter':
+            remaining -= self.spin_margin
+        return remaining
+    
+    def refresh_period(self) -> float:
+        """Periodo de refresco con vsync: la mediana de los intervalos medidos."""
+        if len(self.interval_ms.recent) < 10:
+            return self.period
+        return self.interval_ms.percentile(50) / 1000
+    
+    def wait(self, lead: float = 0.0):
+        """
+        Espera hasta el plazo del siguiente frame.
+
+        Args:
+            lead: Solo con vsync: segundos antes del refresco en que despertar (entrada tardía)
+        """
+        deadline = self._next_deadline(lead)
+        if deadline is None:
+            return
+        remaining = self._sleep_time(deadline)
+        if remaining > 0:
+            time.sleep(remaining)
+        self._finish_wait(deadline)
+    
+    async def wait_async(self, lead: float = 0.0):
+        """
+        Como wait(), pero el tiempo de sueño cede el control al bucle de asyncio
+        para que las corrutinas pendientes avancen hasta el plazo.
+        """
+        deadline = self._next_deadline(lead)
+        if deadline is None:
+            # Ceder igualmente una vez para que las corrutinas no se queden sin turno
+            await asyncio.sleep(0)
+            return
+        remaining = self._sleep_time(deadline)
+        await asyncio.sleep(max(0.0, remaining))
+        self._finish_wait(deadline)
+    
+    @property
+    def fps(self) -> float:
+        """FPS medidos sobre los intervalos recientes."""
+        recent = self.interval_ms.recent
+        if not recent:
+            return 0.0
+        return 1000 * len(recent) / sum(recent)
@@ -1,20 +1,108 @@
 """
 Game Manager - Controla el flujo del juego y las escenas.
 """
+import asyncio
+import time
 import pygame
-from typing import Dict
-from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, Colors, FULLSCREEN, RESIZABLE
-from ..scenes import MenuScene, GameScene, GameOverScene
+from typing import Callable, Coroutine, Dict, Optional
+from ..config import (
+    FPS, GAME_TITLE, Colors, FULLSCREEN, RESIZABLE,
+    ASSET_PATHS, PacingConfig, JobConfig, ProcessConfig, RenderConfig, InputConfig, IdleConfig,
+    TelemetryConfig, MetricsConfig
+)
 from ..ui import ScoreSystem
+from ..utils import asset_manager, gradient_cache_info
+from .startup import StartupProfiler, MixerLoader
+from .frame_pacer import FramePacer
+from .quality import QualityGovernor
+from .gc_policy import GCPolicy
+from .jobs import JobScheduler, JobPriority
+from .renderer import create_renderer
+from .input import InputSystem, InputPlayback
+from .audio import AudioEngine
+from .clock import GameClock
+from .instrumentation import instrumentation
+from .telemetry import telemetry, EventType
+
+# Eventos que cuentan como entrada del usuario para medir el retardo entrada-pantalla
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+# Fases del frame con tiempo propio (histogramas phase_<fase>_ms)
+FRAME_PHASES = ('input', 'update', 'render', 'present', 'jobs')
+PHASE_BOUNDS_MS = (0.25, 0.5, 1, 2, 4, 8, 12, 16, 25, 50)
+
+# Eventos que cuentan como actividad (reanudan las animaciones decorativas)
+ACTIVITY_EVENTS = INPUT_EVENTS + (pygame.MOUSEMOTION, pygame.MOUSEWHEEL, pygame.JOYBUTTONDOWN, pygame.JOYAXISMOTION)
+
+
+def _create_menu_scene(game_manager):
+    from ..scenes.menu_scene import MenuScene
+    return MenuScene(game_manager)
+
+
+def _create_game_scene(game_manager):
+    if ProcessConfig.SPLIT_SIMULATION:
+        from ..scenes.remote_game_scene import RemoteGameScene
+        return RemoteGameScene(game_manager)
+    from ..scenes.game_scene import GameScene
+    return GameScene(game_manager)
+
+
+def _create_gameover_scene(game_manager):
+    from ..scenes.gameover_scene import GameOverScene
+    return GameOverScene(game_manager)
 
 
 class GameManager:
     """Gestor principal del juego."""
     
+    # Fábricas de escenas: cada escena (y su módulo) se crea al usarse por primera vez
+    SCENE_FACTORIES: Dict[str, Callable] = {
+        'menu': _create_menu_scene,
+        'game': _create_game_scene,
+        'gameover': _create_gameover_scene,
+    }
+    
     def __init__(self):
-        # Inicializar Pygame
-        pygame.init()
-        pygame.mixer.init()
+        self.startup = StartupProfiler()
+        
+        # Política del GC: medir desde el arranque, congelar tras construir escenas
+        self.gc_policy = GCPolicy()
+        self.gc_policy.install()
+        
+        # Inicializar solo los subsistemas que necesita la primera escena
+        pygame.display.init()
+        pygame.font.init()
+        self.startup.mark('pygame_init')
+        
+        # El mixer se inicializa después del primer frame (puede tardar cientos de ms)
+        self.mixer_loader = MixerLoader()
+        self.audio = AudioEngine()
+        
+        # Ritmo de frames (sustituye a pygame.time.Clock)
+        self.pacer = FramePacer(FPS, PacingConfig.MODE, PacingConfig.SPIN_MARGIN_MS)
+        
+        # Calidad visual adaptada al tiempo de frame medido
+        self.quality = QualityGovernor(FPS)
+        self.work_ms = instrumentation.histogram('frame_work_ms')
+        self.phase_ms = {
+            phase: instrumentation.histogram(f'phase_{phase}_ms', PHASE_BOUNDS_MS) for phase in FRAME_PHASES
+        }
+        
+        # Lectura de entrada anterior (cota superior del retardo entrada-pantalla)
+        self.last_poll: Optional[float] = None
+        
+        # Estado de la ventana y última actividad del usuario (frame rate adaptativo)
+        self.focused = True
+        self.minimized = False
+        self.last_activity = time.perf_counter()
+        
+        # Tareas cooperativas repartidas en el tiempo libre de cada frame
+        self.jobs = JobScheduler()
+        self._save_job = None
+        
+        # Bucle de asyncio para corrutinas de las escenas (se crea al usarse)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Configurar pantalla con opciones
         flags = 0
@@ -23,108 +111,394 @@ class GameManager:
         elif RESIZABLE:
             flags = pygame.RESIZABLE
         
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
-        pygame.display.set_caption(GAME_TITLE)
+        # Ventana y backend de dibujo (superficie virtual escalada en CPU o texturas de SDL)
+        self.renderer = create_renderer(RenderConfig.BACKEND, GAME_TITLE, flags, PacingConfig.VSYNC)
+        self.pacer.vsync = self.renderer.vsync
+        self.startup.mark('display_ready')
         
-        # Surface virtual para el juego (resolución fija)
-        self.game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Entrada: una instantánea de acciones por frame (teclado, mandos o grabación)
+        self.input = InputSystem()
+        if InputConfig.PLAYBACK_PATH:
+            self.input.play(InputPlayback.load(InputConfig.PLAYBACK_PATH))
+        if InputConfig.RECORD_PATH:
+            self.input.start_recording(InputConfig.RECORD_PATH)
         
-        # Reloj para FPS
-        self.clock = pygame.time.Clock()
+        # Reloj de la simulación (lo avanza la escena de juego) y puntuación global
+        self.clock = GameClock(FPS)
+        self.score_system = ScoreSystem(self.clock)
         
-        # Sistema de puntuación global
-        self.score_system = ScoreSystem()
+        # Telemetría: los eventos llevan el tick de este reloj; un hilo los escribe en disco
+        telemetry.clock = self.clock
+        telemetry.start('game')
         
         # Modo de juego (1 = Single, 2 = Coop)
         self.game_mode = 1
         
-        # Escenas
-        self.scenes: Dict[str, object] = {
-            'menu': MenuScene(self),
-            'game': GameScene(self),
-            'gameover': GameOverScene(self)
-        }
+        # Escenas ya construidas (el resto se crea bajo demanda)
+        self.scenes: Dict[str, object] = {}
         
-        self.current_scene = self.scenes['menu']
+        self.scene_name = 'menu'
+        self.current_scene = self.get_scene('menu')
         self.current_scene.on_enter()
+        self.input.subscribe(self.current_scene.EVENT_TYPES)
+        self.startup.mark('first_scene_ready')
+        
+        # Precargar las imágenes del juego mientras se muestra el menú
+        self.jobs.submit(self._prewarm_images(), JobPriority.NORMAL, 'prewarm_images')
         
         # Estado
         self.running = True
+        self.frame_count = 0
+        
+        # Métricas para un recolector local (Prometheus), servidas desde su propio hilo
+        self.metrics_server = None
+        if MetricsConfig.ENABLED:
+            from .metrics_server import MetricsServer
+            self.metrics_server = MetricsServer(self.metrics_text)
+            if self.metrics_server.start():
+                print(f"📈 Métricas en {self.metrics_server.address}")
+    
+    def get_scene(self, scene_name: str):
+        """Devuelve la escena indicada, creándola si aún no existe."""
+        scene = self.scenes.get(scene_name)
+        if scene is None:
+            scene = self.SCENE_FACTORIES[scene_name](self)
+            self.scenes[scene_name] = scene
+            # Lo recién construido (superficies, fuentes, pools) vive toda la partida.
+            # La primera escena se congela tras el primer flip para no retrasarlo.
+            if 'first_flip' in self.startup.marks:
+                self.gc_policy.freeze(f'scene_{scene_name}')
+        return scene
     
     def change_scene(self, scene_name: str):
         """Cambia a una nueva escena."""
-        if scene_name in self.scenes:
+        if scene_name in self.SCENE_FACTORIES:
             self.current_scene.on_exit()
-            self.current_scene = self.scenes[scene_name]
+            self.scene_name = scene_name
+            self.current_scene = self.get_scene(scene_name)
+            # La pantalla está en negro: buen momento para recolectar
+            self.gc_policy.idle('scene_change')
             self.current_scene.on_enter()
+            self.input.subscribe(self.current_scene.EVENT_TYPES)
     
     def run(self):
-        """Bucle principal del juego."""
+        """Bucle principal del juego (bloqueante o sobre asyncio según PacingConfig.ASYNC_LOOP)."""
         try:
-            while self.running:
-                # Eventos
-                events = pygame.event.get()
-                for event in events:
-                    if event.type == pygame.QUIT:
-                        self.running = False
-                    elif event.type == pygame.KEYDOWN:
-                        # F11 para alternar pantalla completa
-                        if event.key == pygame.K_F11:
-                            self._toggle_fullscreen()
-                    elif event.type == pygame.VIDEORESIZE:
-                        # Manejar redimensionamiento
-                        self.screen = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
-                
-                # Actualizar escena actual
-                self.current_scene.handle_events(events)
-                self.current_scene.update()
-                
-                # Dibujar en la superficie virtual
-                self.game_surface.fill(Colors.DARK_BG)
-                self.current_scene.draw(self.game_surface)
-                
-                # Escalar y centrar la superficie en la pantalla real
-                self._scale_and_draw()
-                
-                # Actualizar pantalla
-                pygame.display.flip()
-                self.clock.tick(FPS)
+            if PacingConfig.ASYNC_LOOP:
+                # Mismo bucle que create_task, por si ya hay corrutinas programadas
+                if self.loop is None:
+                    self.loop = asyncio.new_event_loop()
+                self.loop.run_until_complete(self.run_async())
+            else:
+                while self.running:
+                    self.run_frame(pace=True)
         
         except SystemExit:
             pass
         finally:
+            # Terminar lo pendiente (incluido guardar el récord) antes de salir
+            self.current_scene.on_exit()
+            self._queue_high_score_save()
+            self.jobs.flush()
+            self._close_loop()
+            self.input.close()
+            telemetry.close()
+            if self.metrics_server is not None:
+                self.metrics_server.close()
+            self.gc_policy.uninstall()
             pygame.quit()
     
-    def _scale_and_draw(self):
-        """Escala y centra la superficie del juego en la pantalla."""
-        screen_width, screen_height = self.screen.get_size()
+    async def run_async(self):
+        """
+        Bucle principal como tarea de asyncio: entre el dibujo y el flip de cada
+        frame se duerme hasta el plazo cediendo el control, así las corrutinas de
+        E/S (create_task) avanzan en el tiempo libre sin bloquear frames.
+        """
+        while self.running:
+            if PacingConfig.LATE_LATCH:
+                await self.pacer.wait_async(self._latch_lead())
+                self.prepare_frame(pace=True, background=False)
+                self.present_frame()
+                self._run_background(pace=True)
+            else:
+                self.prepare_frame(pace=True)
+                await self.pacer.wait_async()
+                self.present_frame()
+            if self._can_idle():
+                await self._idle_wait_async()
+    
+    def run_frame(self, pace: bool = False):
+        """
+        Ejecuta un frame completo: eventos, lógica, dibujo y flip.
+        Con pace=True espera al plazo del frame justo antes del flip, para que
+        la entrega sea regular aunque el trabajo del frame varíe. Con
+        PacingConfig.LATE_LATCH la espera va al principio: la entrada se lee
+        justo antes de update y el frame se muestra en cuanto está dibujado.
+        """
+        if pace and PacingConfig.LATE_LATCH:
+            self.pacer.wait(self._latch_lead())
+            self.prepare_frame(pace, background=False)
+            self.present_frame()
+            self._run_background(pace)
+        else:
+            self.prepare_frame(pace)
+            if pace:
+                self.pacer.wait()
+            self.present_frame()
+        if pace and self._can_idle():
+            self._idle_wait()
+    
+    def fast_forward(self, ticks: int):
+        """
+        Simula `ticks` pasos de la escena actual sin dibujar ni esperar (pruebas,
+        grabaciones, herramientas). Los temporizadores usan el reloj simulado,
+        así que el resultado es el de `ticks` frames a tiempo real.
+        """
+        for _ in range(ticks):
+            if not self.running:
+                break
+            self.input.poll([])
+            self.current_scene.handle_events([])
+            self.current_scene.update()
+            self.jobs.flush()
+    
+    def metrics_text(self) -> str:
+        """Métricas actuales en formato Prometheus (lo llama el hilo del servidor de métricas)."""
+        from .metrics_server import format_metrics
+        return format_metrics(instrumentation, self._live_metrics())
+    
+    def _live_metrics(self) -> list:
+        """Valores que no están en el registro: FPS, escena, entidades y aciertos de cachés."""
+        intervals = list(self.pacer.interval_ms.recent)
+        fps = 1000 * len(intervals) / sum(intervals) if intervals and sum(intervals) > 0 else 0.0
+        samples = [
+            ('fps', 'gauge', {}, fps),
+            ('fps_target', 'gauge', {}, self.pacer.fps_target),
+            ('frames_total', 'counter', {}, self.frame_count),
+            ('scene', 'gauge', {'scene': self.scene_name}, 1),
+        ]
+        counters = instrumentation.counters
+        caches = {
+            'texture': (counters.get('texture_cache_hits', 0), counters.get('texture_uploads', 0)),
+            'image': tuple(asset_manager.cache_info()[key] for key in ('hits', 'misses')),
+            'gradient': tuple(gradient_cache_info()[key] for key in ('hits', 'misses')),
+        }
+        for cache, (hits, misses) in caches.items():
+            if hits + misses:
+                samples.append(('cache_hit_ratio', 'gauge', {'cache': cache}, hits / (hits + misses)))
+        samples.extend((name, 'gauge', labels, value) for name, labels, value in self.current_scene.metrics())
+        return samples
+    
+    def idle_seconds(self) -> float:
+        """Segundos desde la última actividad del usuario."""
+        return time.perf_counter() - self.last_activity
+    
+    def _can_idle(self) -> bool:
+        """La escena no cambiará hasta el próximo evento y no hay trabajo pendiente."""
+        if not IdleConfig.ENABLED or not self.running or len(self.jobs):
+            return False
+        if self.loop is not None and not self.loop.is_running() and asyncio.all_tasks(self.loop):
+            return False
+        return self.current_scene.is_static()
+    
+    def _idle_wait(self):
+        """Bloquea hasta el próximo evento (o STATIC_WAIT_MS) sin consumir CPU."""
+        start = time.perf_counter()
+        event = pygame.event.wait(IdleConfig.STATIC_WAIT_MS)
+        if event.type != pygame.NOEVENT:
+            # Devolverlo a la cola para que lo procese el siguiente frame
+            pygame.event.post(event)
+        self._end_idle(start)
+    
+    async def _idle_wait_async(self):
+        """Como _idle_wait, pero cediendo el control a las corrutinas mientras tanto."""
+        start = time.perf_counter()
+        deadline = start + IdleConfig.STATIC_WAIT_MS / 1000
+        while not pygame.event.peek() and time.perf_counter() < deadline:
+            await asyncio.sleep(IdleConfig.ASYNC_POLL_MS / 1000)
+        self._end_idle(start)
+    
+    def _end_idle(self, start: float):
+        idle_ms = (time.perf_counter() - start) * 1000
+        instrumentation.observe('idle_wait_ms', idle_ms)
+        self.pacer.resume()
+        self.last_poll = None  # El hueco no es retardo de entrada
+    
+    def _update_frame_rate(self):
+        """Frame rate reducido con la ventana minimizada o sin foco."""
+        fps = FPS
+        if IdleConfig.ENABLED:
+            if self.minimized:
+                fps = IdleConfig.MINIMIZED_FPS
+            elif not self.focused:
+                fps = IdleConfig.UNFOCUSED_FPS
+        if fps != self.pacer.fps_target:
+            self.pacer.set_fps(fps)
+            instrumentation.record_event('frame_rate', fps=fps)
+    
+    def _latch_lead(self) -> float:
+        """
+        Con vsync, segundos antes del refresco en que hay que leer la entrada:
+        el p95 del trabajo de frame reciente más un margen. Sin vsync no hace
+        falta adelantarse (el flip no espera al refresco).
+        """
+        if not self.pacer.vsync or not self.work_ms.recent:
+            return 0.0
+        return (self.work_ms.percentile(95) + PacingConfig.LATCH_MARGIN_MS) / 1000
+    
+    def prepare_frame(self, pace: bool = False, background: bool = True):
+        """
+        Eventos, lógica, dibujo y tareas en segundo plano (todo menos el flip).
+        Con background=False las tareas quedan para después del flip.
+        """
+        frame_start = time.perf_counter()
+        self.gc_policy.check()
         
-        # Calcular el ratio de aspecto
-        scale_x = screen_width / SCREEN_WIDTH
-        scale_y = screen_height / SCREEN_HEIGHT
-        scale = min(scale_x, scale_y)  # Mantener aspecto
+        # Mixer en el hilo principal, ya con el primer frame en pantalla; después,
+        # aplicar el audio pendiente
+        if 'first_flip' in self.startup.marks and not self.mixer_loader.done:
+            self.mixer_loader.init()
+        if self.mixer_loader.done and 'mixer_ready' not in self.startup.marks:
+            self.startup.mark('mixer_ready')
+            if self.mixer_loader.ready:
+                self.audio.on_mixer_ready()
+                self.jobs.submit(self.audio.build_banks(), JobPriority.NORMAL, 'sfx_banks')
         
-        # Calcular tamaño escalado
-        scaled_width = int(SCREEN_WIDTH * scale)
-        scaled_height = int(SCREEN_HEIGHT * scale)
+        # Eventos
+        events = pygame.event.get()
+        polled = time.perf_counter()
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                self.pacer.mark_input(polled, self.last_poll)
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN:
+                # F11 para alternar pantalla completa
+                if event.key == pygame.K_F11:
+                    self.renderer.toggle_fullscreen()
+            elif event.type == pygame.VIDEORESIZE:
+                self.renderer.resize((event.w, event.h))
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                self.focused = False
+                self.current_scene.on_focus_lost()
+            elif event.type == pygame.WINDOWFOCUSGAINED:
+                self.focused = True
+            elif event.type == pygame.WINDOWMINIMIZED:
+                self.minimized = True
+            elif event.type in (pygame.WINDOWRESTORED, pygame.WINDOWMAXIMIZED):
+                self.minimized = False
+            if event.type in ACTIVITY_EVENTS:
+                self.last_activity = polled
+        self._update_frame_rate()
+        previous = self.input.snapshot
+        snapshot = self.input.poll(events)
+        if snapshot.held or snapshot.pressed:
+            self.last_activity = polled
+        if self.input.playback is None and (snapshot.pressed or snapshot.held != previous.held):
+            # Teclas y mandos mantenidos también cuentan (y sus eventos pueden estar bloqueados)
+            self.pacer.mark_input(polled, self.last_poll)
+        self.last_poll = polled
+        phase_ms = self.phase_ms
+        updating = time.perf_counter()
+        phase_ms['input'].observe((updating - frame_start) * 1000)
         
-        # Calcular posición para centrar
-        x_offset = (screen_width - scaled_width) // 2
-        y_offset = (screen_height - scaled_height) // 2
+        # Actualizar escena actual
+        self.current_scene.handle_events(events)
+        self.current_scene.update()
+        rendering = time.perf_counter()
+        phase_ms['update'].observe((rendering - updating) * 1000)
         
-        # Llenar la pantalla de negro
-        self.screen.fill(Colors.BLACK)
+        # Dibujar la escena con el backend activo
+        self.renderer.smooth = self.quality.settings['scaler'] == 'smooth'
+        self.renderer.begin_frame(Colors.DARK_BG)
+        self.current_scene.render(self.renderer)
         
-        # Escalar y dibujar la superficie del juego
-        scaled_surface = pygame.transform.smoothscale(self.game_surface, (scaled_width, scaled_height))
-        self.screen.blit(scaled_surface, (x_offset, y_offset))
+        # Escalar a la ventana real o enviar los comandos pendientes
+        self.renderer.end_frame()
+        
+        # Tiempo de trabajo del frame (sin la espera del pacer) para el gobernador
+        rendered = time.perf_counter()
+        phase_ms['render'].observe((rendered - rendering) * 1000)
+        work_ms = (rendered - frame_start) * 1000
+        self.work_ms.observe(work_ms)
+        self.quality.observe(work_ms)
+        if work_ms > TelemetryConfig.SPIKE_MS:
+            telemetry.emit(EventType.FRAME_SPIKE, int(work_ms * 1000), self.frame_count)
+        
+        if background:
+            self._run_background(pace)
     
-    def _toggle_fullscreen(self):
-        """Alterna entre modo ventana y pantalla completa."""
-        flags = pygame.display.get_surface().get_flags()
-        if flags & pygame.FULLSCREEN:
-            # Cambiar a modo ventana
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
-        else:
-            # Cambiar a pantalla completa
-            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+    def _run_background(self, pace: bool):
+        """Tareas y corrutinas pendientes en el tiempo que sobra hasta el plazo del frame."""
+        start = time.perf_counter()
+        self._run_jobs(pace)
+        
+        # Bucle de corrutinas propio (modo bloqueante): una vuelta sin esperar
+        if self.loop is not None and not self.loop.is_running():
+            self._pump_loop()
+        self.phase_ms['jobs'].observe((time.perf_counter() - start) * 1000)
+    
+    def present_frame(self):
+        """Muestra el frame dibujado."""
+        start = time.perf_counter()
+        self.renderer.present()
+        self.phase_ms['present'].observe((time.perf_counter() - start) * 1000)
+        self.pacer.presented()
+        self.frame_count += 1
+        if 'first_flip' not in self.startup.marks:
+            self.startup.mark('first_flip')
+            self.gc_policy.freeze('startup')
+    
+    def create_task(self, coroutine: Coroutine, name: Optional[str] = None) -> asyncio.Task:
+        """
+        Programa una corrutina (E/S no bloqueante, esperas...) en el hilo del juego.
+        Con el bucle asyncio avanza mientras se espera el plazo de cada frame; con el
+        bucle bloqueante, GameManager da una vuelta a un bucle propio en cada frame.
+        """
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+        task = self.loop.create_task(coroutine, name=name)
+        task.add_done_callback(self._report_task_error)
+        return task
+    
+    @staticmethod
+    def _report_task_error(task: asyncio.Task):
+        if not task.cancelled() and task.exception() is not None:
+            print(f"⚠️ Error en la corrutina {task.get_name()}: {task.exception()}")
+    
+    def _pump_loop(self):
+        """Ejecuta los callbacks listos del bucle propio y sondea la E/S sin bloquear."""
+        self.loop.call_soon(self.loop.stop)
+        self.loop.run_forever()
+    
+    def _close_loop(self):
+        """Cancela las corrutinas pendientes del bucle propio y lo cierra."""
+        if self.loop is None or self.loop.is_running() or self.loop.is_closed():
+            return
+        pending = asyncio.all_tasks(self.loop)
+        for task in pending:
+            task.cancel()
+        if pending:
+            self.loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self.loop.close()
+    
+    def _run_jobs(self, pace: bool):
+        """Avanza las tareas pendientes sin que el frame pase de su plazo (salvo el paso de las HIGH)."""
+        self._queue_high_score_save()
+        budget_ms = JobConfig.MAX_BUDGET_MS
+        if pace and self.pacer.next_deadline is not None:
+            slack_ms = (self.pacer.next_deadline - time.perf_counter()) * 1000 - JobConfig.SAFETY_MS
+            budget_ms = min(budget_ms, slack_ms)
+        self.jobs.run(budget_ms, allow_overrun=not self.current_scene.in_gameplay())
+    
+    def _queue_high_score_save(self):
+        """Encola el guardado del récord si cambió y no hay otro guardado pendiente."""
+        if self.score_system.high_score_dirty and (self._save_job is None or self._save_job.done):
+            self._save_job = self.jobs.submit(self.score_system.save_high_score, JobPriority.LOW, 'save_high_score')
+    
+    def _prewarm_images(self):
+        """Tarea: carga una imagen por paso para que la primera partida no espere al disco."""
+        for filename in ASSET_PATHS.values():
+            if filename.endswith('.png'):
+                asset_manager.load_image(filename)
+                yield
@@ -0,0 +1,117 @@
+"""
+Política del recolector de basura (GC) para el bucle de juego.
+Congela los objetos de larga vida tras construir escenas, relaja o desactiva
+la recolección automática durante el juego activo y recolecta en momentos
+sin acción (transiciones, pausa, cambios de escena). Registra la duración de
+cada recolección para poder atribuir tirones al GC.
+"""
+import gc
+import time
+from typing import Optional
+
+from ..config import GCConfig
+from .instrumentation import Instrumentation, instrumentation
+
+GC_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 100)
+
+
+class GCPolicy:
+    """Controla cuándo recolecta el GC de CPython y mide cada pausa."""
+    
+    def __init__(self, mode: str = GCConfig.GAMEPLAY_MODE, metrics: Instrumentation = instrumentation):
+        if mode not in ('relaxed', 'disable', 'default'):
+            raise ValueError(f"Modo de GC desconocido: {mode}")
+        self.mode = mode
+        self.metrics = metrics
+        self.default_thresholds = gc.get_threshold()
+        self.in_gameplay = False
+        self.pause_ms = metrics.histogram('gc_pause_ms', GC_BOUNDS_MS)
+        self._started: Optional[float] = None
+        self._reason = 'auto'
+        self._installed = False
+    
+    def install(self):
+        """Empieza a medir todas las recolecciones."""
+        if not self._installed:
+            gc.callbacks.append(self._on_gc)
+            self._installed = True
+    
+    def uninstall(self):
+        """Deja de medir y restaura la configuración por defecto del GC."""
+        if self._installed:
+            gc.callbacks.remove(self._on_gc)
+            self._installed = False
+        self.leave_gameplay()
+    
+    def _on_gc(self, phase: str, info: dict):
+        if phase == 'start':
+            self._started = time.perf_counter()
+            return
+        if self._started is None:
+            return
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        self._started = None
+        generation = info['generation']
+        self.pause_ms.observe(elapsed_ms)
+        self.metrics.increment(f'gc_collections_gen{generation}')
+        if generation == 2 or elapsed_ms >= GCConfig.REPORT_MS:
+            self.metrics.record_event(
+                'gc',
+                generation=generation,
+                ms=round(elapsed_ms, 2),
+                collected=info['collected'],
+                reason=self._reason,
+                gameplay=self.in_gameplay
+            )
+    
+    def _collect(self, reason: str, generation: int = 2):
+        self._reason = reason
+        try:
+            gc.collect(generation)
+        finally:
+            self._reason = 'auto'
+    
+    def freeze(self, reason: str = 'startup'):
+        """
+        Recolecta y mueve los objetos supervivientes a la generación permanente:
+        escenas, superficies y cachés ya construidos dejan de recorrerse en
+        cada recolección completa.
+        """
+        if not GCConfig.ENABLED:
+            return
+        self._collect(reason)
+        gc.freeze()
+        self.metrics.set_gauge('gc_frozen_objects', gc.get_freeze_count())
+    
+    def enter_gameplay(self):
+        """Juego activo: relaja o desactiva la recolección automática."""
+        if not GCConfig.ENABLED or self.in_gameplay:
+            return
+        self.in_gameplay = True
+        if self.mode == 'disable':
+            gc.disable()
+        elif self.mode == 'relaxed':
+            gc.set_threshold(*GCConfig.GAMEPLAY_THRESHOLDS)
+    
+    def leave_gameplay(self):
+        """Restaura la recolección automática por defecto."""
+        if not self.in_gameplay:
+            return
+        self.in_gameplay = False
+        gc.set_threshold(*self.default_thresholds)
+        gc.enable()
+    
+    def idle(self, reason: str):
+        """Momento sin acción (transición, pausa, cambio de escena): recolecta ahora."""
+        if not GCConfig.ENABLED:
+            return
+        self.leave_gameplay()
+        self._collect(reason)
+    
+    def check(self):
+        """
+        Llamar una vez por frame. Con el GC desactivado, recolecta solo la
+        generación joven (barata) si se acumulan demasiadas asignaciones.
+        """
+        if self.in_gameplay and self.mode == 'disable' and gc.get_count()[0] > GCConfig.MAX_PENDING_ALLOCATIONS:
+            self._collect('safety', 0)
@@ -0,0 +1,226 @@
+"""
+Entrada por frame.
+Una vez por frame se toma una instantánea de teclado y mandos y se reduce a
+una máscara de bits de acciones lógicas mediante tablas precalculadas; los
+jugadores y las escenas solo consultan esa máscara. Los tipos de evento que
+la escena activa no usa se bloquean en la cola de SDL.
+
+El mismo formato de instantánea (frame, acciones mantenidas, acciones
+pulsadas) sirve para grabar partidas y para reproducir entrada guionizada:
+un archivo de texto con una línea "frame mantenidas pulsadas" (hexadecimal)
+por cada frame en el que algo cambia.
+"""
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+import pygame
+from ..config import InputConfig
+
+RECORDING_HEADER = '# makeuprain input v1: frame held pressed (hex)'
+
+
+class Action:
+    """Bits de las acciones lógicas."""
+    P1_LEFT = 1 << 0
+    P1_RIGHT = 1 << 1
+    P2_LEFT = 1 << 2
+    P2_RIGHT = 1 << 3
+    PAUSE = 1 << 4
+    BACK = 1 << 5
+    
+    NAMES = {
+        'p1_left': P1_LEFT,
+        'p1_right': P1_RIGHT,
+        'p2_left': P2_LEFT,
+        'p2_right': P2_RIGHT,
+        'pause': PAUSE,
+        'back': BACK,
+    }
+    
+    # Izquierda / derecha de cada jugador (índice = player_id - 1)
+    PLAYER_MOVES = ((P1_LEFT, P1_RIGHT), (P2_LEFT, P2_RIGHT))
+
+
+class InputSnapshot(NamedTuple):
+    """Entrada de un frame."""
+    frame: int
+    held: int     # Acciones mantenidas
+    pressed: int  # Acciones que empezaron en este frame
+    
+    def encode(self) -> str:
+        """Línea del formato de grabación."""
+        return f"{self.frame} {self.held:x} {self.pressed:x}"
+    
+    @classmethod
+    def decode(cls, line: str) -> 'InputSnapshot':
+        frame, held, pressed = line.split()
+        return cls(int(frame), int(held, 16), int(pressed, 16))
+
+
+class InputRecorder:
+    """Escribe las instantáneas en las que cambia la entrada."""
+    
+    def __init__(self, path: str):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write(RECORDING_HEADER + '\n')
+        self.last_held = 0
+    
+    def write(self, snapshot: InputSnapshot):
+        if snapshot.held != self.last_held or snapshot.pressed:
+            self.file.write(snapshot.encode() + '\n')
+            self.last_held = snapshot.held
+    
+    def close(self):
+        self.file.close()
+
+
+class InputPlayback:
+    """Entrada grabada o guionizada: las acciones se mantienen hasta la siguiente línea."""
+    
+    def __init__(self, snapshots: Iterable[InputSnapshot]):
+        self.snapshots: List[InputSnapshot] = sorted(snapshots)
+        self.cursor = 0
+        self.held = 0
+    
+    @classmethod
+    def load(cls, path: str) -> 'InputPlayback':
+        with open(path, encoding='utf-8') as file:
+            return cls(
+                InputSnapshot.decode(line) for line in file
+                if line.strip() and not line.startswith('#')
+            )
+    
+    @property
+    def finished(self) -> bool:
+        return self.cursor >= len(self.snapshots)
+    
+    def get(self, frame: int) -> InputSnapshot:
+        """Instantánea del frame indicado (los frames deben pedirse en orden)."""
+        pressed = 0
+        snapshots = self.snapshots
+        while self.cursor < len(snapshots) and snapshots[self.cursor].frame <= frame:
+            entry = snapshots[self.cursor]
+            self.held = entry.held
+            if entry.frame == frame:
+                pressed |= entry.pressed
+            self.cursor += 1
+        return InputSnapshot(frame, self.held, pressed)
+
+
+class InputSystem:
+    """Lee la entrada una vez por frame y la expone como máscara de acciones."""
+    
+    # Eventos que solo llegan si la escena activa los pide (el resto llega siempre)
+    OPTIONAL_EVENTS = (
+        pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+        pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING,
+        pygame.JOYAXISMOTION, pygame.JOYHATMOTION, pygame.JOYBALLMOTION, pygame.JOYBUTTONUP,
+        pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+    )
+    
+    def __init__(self, keymap: Dict[str, List[int]] = InputConfig.KEYMAP, gamepads: bool = InputConfig.GAMEPADS):
+        # Tablas precalculadas: (tecla, bit) para el sondeo y tecla -> bits para KEYDOWN
+        self.key_table: List[Tuple[int, int]] = []
+        self.key_actions: Dict[int, int] = {}
+        for name, keys in keymap.items():
+            for key in keys:
+                self.key_table.append((key, Action.NAMES[name]))
+                self.key_actions[key] = self.key_actions.get(key, 0) | Action.NAMES[name]
+        self.button_actions: Dict[int, int] = {}
+        for name, buttons in InputConfig.GAMEPAD_BUTTONS.items():
+            for button in buttons:
+                self.button_actions[button] = self.button_actions.get(button, 0) | Action.NAMES[name]
+        
+        self.gamepads = gamepads
+        self.joysticks: List[pygame.joystick.JoystickType] = []
+        if gamepads:
+            pygame.joystick.init()
+            self._refresh_gamepads()
+        
+        self.frame = 0
+        self.snapshot = InputSnapshot(0, 0, 0)
+        self.recorder: Optional[InputRecorder] = None
+        self.playback: Optional[InputPlayback] = None
+    
+    def subscribe(self, event_types: Iterable[int]):
+        """Bloquea los eventos opcionales que la escena activa no usa."""
+        wanted = set(event_types)
+        pygame.event.set_allowed([event_type for event_type in self.OPTIONAL_EVENTS if event_type in wanted])
+        pygame.event.set_blocked([event_type for event_type in self.OPTIONAL_EVENTS if event_type not in wanted])
+    
+    def poll(self, events: list) -> InputSnapshot:
+        """Toma la instantánea del frame (llamar una vez, tras pygame.event.get())."""
+        if self.playback is not None:
+            return self._set(self.playback.get(self.frame + 1))
+        
+        held = self._read_keyboard()
+        if self.joysticks:
+            held |= self._read_gamepads()
+        
+        # Flancos de subida más pulsaciones cortas que empiezan y acaban dentro del frame
+        pressed = held & ~self.snapshot.held
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                pressed |= self.key_actions.get(event.key, 0)
+            elif event.type == pygame.JOYBUTTONDOWN:
+                pressed |= self.button_actions.get(event.button, 0)
+            elif event.type in (pygame.JOYDEVICEADDED, pygame.JOYDEVICEREMOVED) and self.gamepads:
+                self._refresh_gamepads()
+        return self._set(InputSnapshot(self.frame + 1, held, pressed))
+    
+    def apply(self, held: int, pressed: int) -> InputSnapshot:
+        """Instantánea recibida de otra fuente (p. ej. el proceso de render)."""
+        return self._set(InputSnapshot(self.frame + 1, held, pressed))
+    
+    def _set(self, snapshot: InputSnapshot) -> InputSnapshot:
+        self.frame = snapshot.frame
+        self.snapshot = snapshot
+        if self.recorder is not None:
+            self.recorder.write(snapshot)
+        return snapshot
+    
+    def _read_keyboard(self) -> int:
+        keys = pygame.key.get_pressed()
+        held = 0
+        for key, bit in self.key_table:
+            if keys[key]:
+                held |= bit
+        return held
+    
+    def _read_gamepads(self) -> int:
+        held = 0
+        deadzone = InputConfig.GAMEPAD_DEADZONE
+        for joystick, (left, right) in zip(self.joysticks, Action.PLAYER_MOVES):
+            x = joystick.get_axis(0) if joystick.get_numaxes() else 0.0
+            if joystick.get_numhats():
+                x += joystick.get_hat(0)[0]
+            if x < -deadzone:
+                held |= left
+            elif x > deadzone:
+                held |= right
+            for button, bits in self.button_actions.items():
+                if button < joystick.get_numbuttons() and joystick.get_button(button):
+                    held |= bits
+        return held
+    
+    def _refresh_gamepads(self):
+        self.joysticks = [pygame.joystick.Joystick(index) for index in range(pygame.joystick.get_count())]
+    
+    # ----- Grabación y reproducción -----
+    
+    def start_recording(self, path: str):
+        """Graba la entrada de cada frame a partir del siguiente."""
+        self.stop_recording()
+        self.recorder = InputRecorder(path)
+    
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.close()
+            self.recorder = None
+    
+    def play(self, playback: InputPlayback):
+        """Sustituye la entrada real por una grabación (los frames cuentan desde ahora)."""
+        self.frame = 0
+        self.playback = playback
+    
+    def close(self):
+        """Cierra la grabación en curso."""
+        self.stop_recording()
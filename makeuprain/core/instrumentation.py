@@ -0,0 +1,128 @@
+"""
+Instrumentación del juego: contadores, indicadores, histogramas y eventos.
+Un único registro compartido (`instrumentation`) que cualquier sistema puede
+alimentar y que se puede consultar en caliente o volcar al salir.
+"""
+import bisect
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+# Límites de cubeta por defecto (ms): finos alrededor de 16.7 ms (60 FPS)
+DEFAULT_BOUNDS_MS = (1, 2, 4, 8, 12, 14, 16, 17, 18, 20, 25, 33, 50, 100, 250)
+
+
+class Histogram:
+    """Histograma de cubetas fijas con ventana de muestras recientes para percentiles."""
+    
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS_MS, window: int = 600):
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)  # La última cubeta es +inf
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.recent: Deque[float] = deque(maxlen=window)
+    
+    def observe(self, value: float):
+        """Registra una muestra."""
+        self.buckets[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        self.recent.append(value)
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+    
+    def percentile(self, q: float) -> float:
+        """Percentil q (0-100) sobre las muestras recientes."""
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+        return ordered[index]
+    
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Cubetas acumuladas (límite superior, muestras <= límite), al estilo Prometheus."""
+        result = []
+        running = 0
+        for bound, count in zip(self.bounds + (float('inf'),), self.buckets):
+            running += count
+            result.append((bound, running))
+        return result
+    
+    def reset(self):
+        """Descarta todas las muestras."""
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = self.max = None
+        self.recent.clear()
+    
+    def summary(self) -> str:
+        """Resumen legible: media, percentiles y extremos."""
+        if not self.count:
+            return "sin muestras"
+        return (
+            f"n={self.count} media={self.mean:.2f} p50={self.percentile(50):.2f} "
+            f"p95={self.percentile(95):.2f} p99={self.percentile(99):.2f} "
+            f"min={self.min:.2f} max={self.max:.2f}"
+        )
+
+
+class Instrumentation:
+    """Registro de métricas con nombre."""
+    
+    def __init__(self, max_events: int = 256):
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.events: Deque[Tuple[float, str, dict]] = deque(maxlen=max_events)
+        self.start = time.perf_counter()
+    
+    def increment(self, name: str, amount: int = 1):
+        """Suma `amount` a un contador."""
+        self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def set_gauge(self, name: str, value: float):
+        """Fija el valor actual de un indicador."""
+        self.gauges[name] = value
+    
+    def histogram(self, name: str, bounds: Sequence[float] = DEFAULT_BOUNDS_MS) -> Histogram:
+        """Devuelve el histograma con ese nombre, creándolo si no existe."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = Histogram(bounds)
+            self.histograms[name] = histogram
+        return histogram
+    
+    def observe(self, name: str, value: float):
+        """Registra una muestra en el histograma indicado."""
+        self.histogram(name).observe(value)
+    
+    def record_event(self, kind: str, **data):
+        """Guarda un evento puntual (cambios de estado, transiciones...)."""
+        self.events.append((time.perf_counter() - self.start, kind, data))
+    
+    def report(self) -> str:
+        """Resumen legible de todas las métricas."""
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"{name}: {value}")
+        for name, value in sorted(self.gauges.items()):
+            lines.append(f"{name}: {value:.2f}")
+        for name, histogram in sorted(self.histograms.items()):
+            lines.append(f"{name}: {histogram.summary()}")
+        for elapsed, kind, data in self.events:
+            details = " ".join(f"{key}={value}" for key, value in data.items())
+            lines.append(f"[{elapsed:8.2f} s] {kind} {details}")
+        return "\n".join(lines)
+
+
+# Instancia global
+instrumentation = Instrumentation()
@@ -0,0 +1,161 @@
+"""
+Planificador cooperativo de tareas en segundo plano.
+Las tareas son generadores: cada `yield` marca un punto en el que se puede
+interrumpir. El planificador avanza las tareas pendientes (por prioridad)
+mientras quede presupuesto de tiempo en el frame, repartiendo el trabajo
+pesado (spawns, precarga, guardado) entre varios frames.
+"""
+import heapq
+import itertools
+import time
+import types
+from typing import Callable, Generator, List, Optional, Tuple, Union
+
+from ..config import JobConfig
+from .instrumentation import Instrumentation, instrumentation
+
+STEP_BOUNDS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16)
+
+Task = Union[Generator, Callable[[], object]]
+
+
+class JobPriority:
+    HIGH = 0     # Afecta al juego en curso (spawns de ronda)
+    NORMAL = 10  # Precarga de assets y cachés
+    LOW = 20     # Persistencia (high score)
+
+
+class Job:
+    """Tarea reanudable registrada en el planificador."""
+    
+    def __init__(self, generator: Generator, priority: int, name: str, cost_ms: float):
+        self.generator = generator
+        self.priority = priority
+        self.name = name
+        self.done = False
+        self.cancelled = False
+        self.error: Optional[BaseException] = None
+        self.steps = 0
+        self.last_step_ms = cost_ms  # Estimación del coste del siguiente paso
+        self.skipped_frames = 0
+    
+    def cancel(self):
+        """Cancela la tarea y cierra su generador."""
+        if not self.done:
+            self.cancelled = True
+            self.done = True
+            self.generator.close()
+
+
+def _call_once(func: Callable[[], object]) -> Generator:
+    func()
+    yield
+
+
+class JobScheduler:
+    """Cola de prioridad de tareas cooperativas con presupuesto por frame."""
+    
+    def __init__(self, metrics: Instrumentation = instrumentation):
+        self._heap: List[Tuple[int, int, Job]] = []
+        self._counter = itertools.count()
+        self.metrics = metrics
+        self.step_ms = metrics.histogram('job_step_ms', STEP_BOUNDS_MS)
+    
+    def submit(
+        self,
+        task: Task,
+        priority: int = JobPriority.NORMAL,
+        name: Optional[str] = None,
+        cost_ms: Optional[float] = None
+    ) -> Job:
+        """
+        Encola una tarea. Una función normal se ejecuta entera en un único paso.
+
+        Args:
+            task: Generador (cada yield es un punto de pausa) o función sin argumentos
+            priority: Menor valor = se ejecuta antes (ver JobPriority)
+            name: Nombre para métricas y depuración
+            cost_ms: Coste estimado del primer paso (por defecto JobConfig.FIRST_STEP_MS)
+        """
+        generator = task if isinstance(task, types.GeneratorType) else _call_once(task)
+        if cost_ms is None:
+            cost_ms = JobConfig.FIRST_STEP_MS
+        job = Job(generator, priority, name or getattr(task, '__name__', 'job'), cost_ms)
+        heapq.heappush(self._heap, (priority, next(self._counter), job))
+        return job
+    
+    def run(self, budget_ms: float, allow_overrun: bool = False) -> int:
+        """
+        Avanza las tareas pendientes sin pasar del presupuesto. Un paso solo se
+        inicia si su coste estimado (el del paso anterior) cabe en lo que queda;
+        si el de una tarea no cabe se prueba con las siguientes, así una tarea
+        pesada no bloquea a las pequeñas de menor prioridad. Las tareas
+        JobPriority.HIGH afectan al juego en curso: avanzan al menos un paso por
+        frame aunque no quede presupuesto.
+
+        Args:
+            budget_ms: Tiempo disponible en este frame (puede ser 0 o negativo)
+            allow_overrun: Frame sin juego activo (menú, pausa, transición): una
+                tarea que lleva JobConfig.MAX_SKIPPED_FRAMES sin caber avanza un
+                paso aunque se pase del presupuesto. En juego solo se pasan las
+                de prioridad HIGH.
+
+        Returns:
+            Número de pasos ejecutados.
+        """
+        end = time.perf_counter() + budget_ms / 1000
+        steps = 0
+        forced = False
+        for _, _, job in sorted(self._heap):
+            ran = False
+            while not job.done:
+                remaining_ms = (end - time.perf_counter()) * 1000
+                if remaining_ms <= 0 or job.last_step_ms > remaining_ms:
+                    if ran:
+                        break
+                    # No cabe: las HIGH dan su paso del frame; el resto solo si lleva
+                    # demasiado esperando y el frame lo permite
+                    if job.priority > JobPriority.HIGH:
+                        if forced or not allow_overrun or job.skipped_frames < JobConfig.MAX_SKIPPED_FRAMES:
+                            break
+                        forced = True
+                self._step(job)
+                steps += 1
+                ran = True
+            if not ran and not job.done:
+                job.skipped_frames += 1
+        if steps and time.perf_counter() > end:
+            self.metrics.increment('job_budget_overruns')
+        
+        # Retirar las tareas terminadas o canceladas
+        if any(job.done for _, _, job in self._heap):
+            self._heap = [entry for entry in self._heap if not entry[2].done]
+            heapq.heapify(self._heap)
+        self.metrics.set_gauge('jobs_pending', len(self._heap))
+        return steps
+    
+    def _step(self, job: Job):
+        start = time.perf_counter()
+        try:
+            next(job.generator)
+        except StopIteration:
+            job.done = True
+        except Exception as e:
+            job.done = True
+            job.error = e
+            print(f"⚠️ Error en la tarea {job.name}: {e}")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        job.steps += 1
+        job.last_step_ms = elapsed_ms
+        job.skipped_frames = 0
+        self.step_ms.observe(elapsed_ms)
+    
+    def flush(self):
+        """Completa todas las tareas pendientes sin límite de tiempo (al salir)."""
+        while self._heap:
+            _, _, job = heapq.heappop(self._heap)
+            while not job.done:
+                self._step(job)
+    
+    def __len__(self) -> int:
+        return sum(1 for _, _, job in self._heap if not job.done)
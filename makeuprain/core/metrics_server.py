@@ -0,0 +1,257 @@
+"""
+Servidor de métricas para recolectores locales (formato de texto de Prometheus).
+Opcional (MetricsConfig.ENABLED): escucha en un puerto TCP local o en un
+socket Unix desde un hilo propio y, en cada petición, formatea el registro de
+instrumentación más los valores en vivo que aporta el GameManager (FPS,
+escena, entidades, cachés...). El bucle de frames no espera nunca al
+servidor: solo se leen contadores y copias de las muestras recientes.
+
+    curl -s http://127.0.0.1:9464/metrics
+    curl -s --unix-socket /tmp/makeuprain.sock http://localhost/metrics
+
+Para leerlas sin curl (también sirve para comprobar el servidor):
+
+    python -m makeuprain.core.metrics_server [--host 127.0.0.1] [--port 9464] [--socket ruta]
+"""
+import argparse
+import os
+import re
+import socket
+import socketserver
+import stat
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..config import MetricsConfig
+from .instrumentation import Instrumentation, instrumentation
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Un valor en vivo: (nombre, tipo 'gauge' o 'counter', etiquetas, valor)
+Sample = Tuple[str, str, Dict[str, str], float]
+
+
+def _clean(name: str) -> str:
+    """Nombre válido de métrica de Prometheus."""
+    return re.sub(r'[^a-zA-Z0-9_:]', '_', name)
+
+
+def _number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if value != value:
+        return 'NaN'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def format_metrics(
+    metrics: Instrumentation = instrumentation,
+    live: Iterable[Sample] = (),
+    prefix: str = MetricsConfig.PREFIX,
+    quantiles: Iterable[float] = MetricsConfig.QUANTILES
+) -> str:
+    """
+    Texto de exposición de Prometheus con el registro y los valores en vivo.
+
+    Contadores -> <prefijo>_<nombre>_total, indicadores -> <prefijo>_<nombre>,
+    histogramas -> cubetas acumuladas, _sum y _count, más los percentiles de
+    las muestras recientes en <prefijo>_recent_ms{histogram=..., quantile=...}.
+    Se puede llamar desde cualquier hilo: solo copia los registros.
+    """
+    families: Dict[str, Tuple[str, List[str]]] = {}
+    
+    def add(name: str, kind: str, labels: Dict[str, str], value: float, suffix: str = ''):
+        family = f"{prefix}_{_clean(name)}"
+        lines = families.setdefault(family, (kind, []))[1]
+        lines.append(f"{family}{suffix}{_labels(labels)} {_number(value)}")
+    
+    for name, value in sorted(list(metrics.counters.items())):
+        add(f"{name}_total", 'counter', {}, value)
+    for name, value in sorted(list(metrics.gauges.items())):
+        add(name, 'gauge', {}, value)
+    
+    for name, histogram in sorted(list(metrics.histograms.items())):
+        running = 0
+        for bound, count in zip(histogram.bounds + (float('inf'),), list(histogram.buckets)):
+            running += count
+            add(name, 'histogram', {'le': _number(bound)}, running, '_bucket')
+        add(name, 'histogram', {}, histogram.total, '_sum')
+        add(name, 'histogram', {}, running, '_count')
+        if histogram.recent:
+            for q in quantiles:
+                add('recent_ms', 'gauge', {'histogram': name, 'quantile': str(q)}, histogram.percentile(q * 100))
+    
+    for name, kind, labels, value in live:
+        add(name, kind, labels, value)
+    
+    text = []
+    for family, (kind, lines) in families.items():
+        text.append(f"# TYPE {family} {kind}")
+        text.extend(lines)
+    return "\n".join(text) + "\n"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """GET /metrics (o /) con las métricas actuales."""
+    
+    server_version = 'makeuprain-metrics'
+    timeout = 5  # Un cliente lento no deja colgado el hilo del servidor
+    
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/', '/metrics'):
+            self.send_error(404)
+            return
+        try:
+            body = self.server.collect().encode('utf-8')
+        except Exception as e:
+            self.send_error(500, str(e))
+            return
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPE)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # Sin una línea en la consola del juego por cada lectura
+
+
+class _TCPServer(socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+# En Windows no hay sockets Unix: solo TCP
+_UnixServer = getattr(socketserver, 'UnixStreamServer', None)
+
+
+class MetricsServer:
+    """Servidor HTTP mínimo en un hilo daemon que sirve `collect()`."""
+    
+    def __init__(
+        self,
+        collect: Callable[[], str],
+        host: str = MetricsConfig.HOST,
+        port: int = MetricsConfig.PORT,
+        socket_path: Optional[str] = MetricsConfig.SOCKET_PATH
+    ):
+        """
+        Args:
+            collect: Devuelve el texto de las métricas (se llama desde el hilo del servidor)
+            host, port: Dirección TCP (port 0 = uno libre)
+            socket_path: Socket Unix en lugar de TCP
+        """
+        self.collect = collect
+        self.host = host
+        self.port = port
+        self.socket_path = socket_path
+        self.server: Optional[socketserver.BaseServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> bool:
+        """Abre el socket y empieza a servir. Devuelve False (con un aviso) si no se pudo."""
+        if self.server is not None:
+            return True
+        try:
+            if self.socket_path:
+                if _UnixServer is None:
+                    raise OSError("los sockets Unix no están disponibles en este sistema")
+                self._remove_stale_socket()
+                server = _UnixServer(self.socket_path, _Handler)
+            else:
+                server = _TCPServer((self.host, self.port), _Handler)
+        except OSError as e:
+            print(f"⚠️ No se pudo abrir el servidor de métricas en {self.address}: {e}")
+            return False
+        server.collect = self.collect
+        self.server = server
+        self._thread = threading.Thread(
+            target=server.serve_forever, kwargs={'poll_interval': 0.25}, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        return True
+    
+    def _remove_stale_socket(self):
+        """Borra el socket de una ejecución anterior (nunca un archivo normal)."""
+        try:
+            if stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+                os.remove(self.socket_path)
+        except FileNotFoundError:
+            pass
+    
+    @property
+    def address(self) -> str:
+        """Dirección en la que escucha (con el puerto real si se pidió el 0)."""
+        if self.socket_path:
+            return self.socket_path
+        port = self.server.server_address[1] if self.server is not None else self.port
+        return f"{self.host}:{port}"
+    
+    def close(self):
+        """Deja de servir y libera el socket."""
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self.server = None
+        self._thread = None
+        if self.socket_path:
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+
+
+def scrape(host: str = MetricsConfig.HOST, port: int = MetricsConfig.PORT,
+           socket_path: Optional[str] = None, timeout: float = 2.0) -> str:
+    """Cliente mínimo: pide /metrics y devuelve el cuerpo (TCP o socket Unix)."""
+    if socket_path:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(timeout)
+        connection.connect(socket_path)
+    else:
+        connection = socket.create_connection((host, port), timeout)
+    with connection:
+        connection.sendall(b"GET /metrics HTTP/1.0\r\nHost: localhost\r\n\r\n")
+        chunks = []
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    head, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+    status = head.split(b"\r\n", 1)[0].decode('latin-1')
+    if " 200 " not in status:
+        raise OSError(f"Respuesta inesperada: {status}")
+    return body.decode('utf-8')
+
+
+def main(argv: Optional[List[str]] = None):
+    """Muestra las métricas de una partida en marcha."""
+    parser = argparse.ArgumentParser(description='Lee las métricas de una partida en marcha')
+    parser.add_argument('--host', default=MetricsConfig.HOST, help='Dirección TCP')
+    parser.add_argument('--port', type=int, default=MetricsConfig.PORT, help='Puerto TCP')
+    parser.add_argument('--socket', default=MetricsConfig.SOCKET_PATH, help='Socket Unix (en lugar de TCP)')
+    args = parser.parse_args(argv)
+    
+    try:
+        print(scrape(args.host, args.port, args.socket), end='')
+    except OSError as e:
+        print(f"❌ No se pudieron leer las métricas: {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
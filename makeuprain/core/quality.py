@@ -0,0 +1,73 @@
+"""
+Gobernador de calidad adaptativo.
+Compara el tiempo de trabajo de cada frame con el presupuesto del frame rate
+objetivo y sube o baja entre los niveles de QualityConfig.TIERS, con
+histéresis para que el nivel no oscile.
+"""
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from ..config import QualityConfig
+from .instrumentation import Instrumentation, instrumentation
+
+
+class QualityGovernor:
+    """Elige el nivel de calidad visual a partir del tiempo de frame medido."""
+    
+    def __init__(
+        self,
+        fps: int,
+        tiers: Optional[List[Dict[str, Any]]] = None,
+        metrics: Instrumentation = instrumentation
+    ):
+        self.tiers = tiers or QualityConfig.TIERS
+        self.budget_ms = 1000 / fps
+        self.metrics = metrics
+        self.enabled = QualityConfig.ENABLED
+        self.tier = min(QualityConfig.START_TIER, len(self.tiers) - 1)
+        self.samples: Deque[float] = deque(maxlen=QualityConfig.WINDOW)
+        self.hold = QualityConfig.HOLD_FRAMES  # Frames sin cambios tras arrancar o cambiar de nivel
+        self.metrics.set_gauge('quality_tier', self.tier)
+    
+    @property
+    def settings(self) -> Dict[str, Any]:
+        """Parámetros del nivel actual."""
+        return self.tiers[self.tier]
+    
+    def observe(self, work_ms: float) -> bool:
+        """
+        Registra el tiempo de trabajo de un frame (sin contar la espera del pacer).
+
+        Returns:
+            True si el nivel cambió en este frame.
+        """
+        self.samples.append(work_ms)
+        if self.hold > 0:
+            self.hold -= 1
+            return False
+        if not self.enabled or len(self.samples) < self.samples.maxlen:
+            return False
+        
+        # Percentil alto: los picos son los que hacen perder frames
+        ordered = sorted(self.samples)
+        load = ordered[int(len(ordered) * QualityConfig.PERCENTILE / 100)] / self.budget_ms
+        if load > QualityConfig.DOWNGRADE_LOAD and self.tier < len(self.tiers) - 1:
+            return self._set_tier(self.tier + 1, load)
+        if load < QualityConfig.UPGRADE_LOAD and self.tier > 0:
+            return self._set_tier(self.tier - 1, load)
+        return False
+    
+    def _set_tier(self, tier: int, load: float) -> bool:
+        previous = self.tier
+        self.tier = tier
+        self.samples.clear()
+        self.hold = QualityConfig.HOLD_FRAMES
+        self.metrics.set_gauge('quality_tier', tier)
+        self.metrics.increment('quality_transitions')
+        self.metrics.record_event(
+            'quality_tier',
+            previous=self.tiers[previous]['name'],
+            current=self.tiers[tier]['name'],
+            load=round(load, 2)
+        )
+        return True
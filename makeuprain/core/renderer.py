@@ -0,0 +1,361 @@
+"""
+Backends de dibujo.
+Las escenas envían sus operaciones (sprites, rotaciones, transparencias,
+rellenos) a un Renderer en coordenadas de la resolución virtual:
+
+- SoftwareRenderer: blits sobre una superficie virtual y escalado en CPU
+  a la ventana (el comportamiento clásico de pygame).
+- TextureRenderer: cada superficie se sube una vez como textura
+  (pygame._sdl2.video) y se dibuja con copias del renderer de SDL, que
+  también rota, aplica la transparencia y escala a la ventana. Sin GPU usa
+  el renderer por software de SDL.
+
+Lo que no son sprites (texto, paneles, pygame.draw) se dibuja libremente en
+canvas(), una superficie que el backend de texturas sube por capas (solo las
+zonas en las que se dibujó).
+"""
+import os
+import weakref
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy
+import pygame
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, Colors, RenderConfig
+from .instrumentation import Instrumentation, instrumentation
+
+Color = Sequence[int]
+Dest = Sequence[int]  # (x, y) o pygame.Rect (se usa la esquina superior izquierda)
+
+
+class Renderer(ABC):
+    """Interfaz común de los backends de dibujo."""
+    
+    name = 'base'
+    vsync = False
+    smooth = True  # Escalado suave a la ventana (lo fija el gobernador de calidad)
+    size: Tuple[int, int] = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    
+    def get_rect(self) -> pygame.Rect:
+        """Rectángulo de la resolución virtual."""
+        return pygame.Rect((0, 0), self.size)
+    
+    @abstractmethod
+    def begin_frame(self, color: Color):
+        """Empieza un frame limpiando con un color de fondo."""
+    
+    @abstractmethod
+    def blit(self, surface: pygame.Surface, dest: Dest, alpha: int = 255):
+        """Dibuja una superficie con transparencia global opcional."""
+    
+    @abstractmethod
+    def blit_rotated(self, surface: pygame.Surface, center: Tuple[int, int], angle: float, alpha: int = 255):
+        """Dibuja una superficie rotada (grados, antihorario) alrededor de su centro."""
+    
+    @abstractmethod
+    def fill(self, color: Color, rect: Optional[pygame.Rect] = None):
+        """Rellena un rectángulo (toda la pantalla si es None); admite alfa en el color."""
+    
+    @abstractmethod
+    def canvas(self) -> pygame.Surface:
+        """Superficie para dibujo libre (texto, paneles, pygame.draw) sobre lo ya enviado."""
+    
+    def forget(self, surface: pygame.Surface):
+        """Descarta lo cacheado de una superficie que se ha redibujado en el sitio."""
+    
+    def end_frame(self):
+        """Termina el dibujo del frame (escalado, comandos pendientes)."""
+    
+    def present(self):
+        """Muestra el frame terminado."""
+    
+    def resize(self, size: Tuple[int, int]):
+        """La ventana cambió de tamaño."""
+    
+    def toggle_fullscreen(self):
+        """Alterna entre ventana y pantalla completa."""
+
+
+class SurfaceRenderer(Renderer):
+    """Dibuja directamente sobre una superficie de pygame."""
+    
+    name = 'surface'
+    
+    def __init__(self, surface: pygame.Surface):
+        self.surface = surface
+        self.size = surface.get_size()
+        self._overlays: Dict[Tuple[int, int], pygame.Surface] = {}
+    
+    def begin_frame(self, color: Color):
+        self.surface.fill(color)
+    
+    def blit(self, surface: pygame.Surface, dest: Dest, alpha: int = 255):
+        if alpha >= 255:
+            self.surface.blit(surface, dest)
+            return
+        # Alfa temporal sobre la superficie compartida (más barato que copiarla)
+        previous = surface.get_alpha()
+        surface.set_alpha(alpha)
+        self.surface.blit(surface, dest)
+        surface.set_alpha(previous)
+    
+    def blit_rotated(self, surface: pygame.Surface, center: Tuple[int, int], angle: float, alpha: int = 255):
+        rotated = pygame.transform.rotate(surface, angle)
+        if alpha < 255:
+            rotated.set_alpha(alpha)
+        self.surface.blit(rotated, rotated.get_rect(center=center))
+    
+    def fill(self, color: Color, rect: Optional[pygame.Rect] = None):
+        if len(color) < 4 or color[3] >= 255:
+            self.surface.fill(color[:3], rect)
+            return
+        rect = pygame.Rect(rect) if rect is not None else self.surface.get_rect()
+        overlay = self._overlays.get(rect.size)
+        if overlay is None:
+            overlay = pygame.Surface(rect.size)
+            self._overlays[rect.size] = overlay
+        overlay.fill(color[:3])
+        overlay.set_alpha(color[3])
+        self.surface.blit(overlay, rect)
+    
+    def canvas(self) -> pygame.Surface:
+        return self.surface
+
+
+class SoftwareRenderer(SurfaceRenderer):
+    """Superficie virtual escalada en CPU a la ventana de pygame.display."""
+    
+    name = 'software'
+    
+    def __init__(self, title: str, flags: int = 0, vsync: bool = False):
+        self.screen = self._open_display(flags, vsync)
+        pygame.display.set_caption(title)
+        super().__init__(pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT)))
+    
+    def _open_display(self, flags: int, vsync: bool) -> pygame.Surface:
+        """Crea la ventana, con vsync si está configurado y el backend lo admite."""
+        if vsync:
+            try:
+                # SDL solo ofrece vsync con renderer propio (SCALED)
+                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags | pygame.SCALED, vsync=1)
+                self.vsync = True
+                return screen
+            except pygame.error as e:
+                print(f"Vsync no disponible, se usa el pacer: {e}")
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), flags)
+    
+    def end_frame(self):
+        """Escala y centra la superficie del juego en la pantalla."""
+        screen_width, screen_height = self.screen.get_size()
+        if (screen_width, screen_height) == (SCREEN_WIDTH, SCREEN_HEIGHT):
+            # Mismo tamaño (ventana sin redimensionar o escalado de SDL): copia directa
+            self.screen.blit(self.surface, (0, 0))
+            return
+        
+        # Mantener el ratio de aspecto
+        scale = min(screen_width / SCREEN_WIDTH, screen_height / SCREEN_HEIGHT)
+        scaled_width = int(SCREEN_WIDTH * scale)
+        scaled_height = int(SCREEN_HEIGHT * scale)
+        
+        # Posición para centrar
+        x_offset = (screen_width - scaled_width) // 2
+        y_offset = (screen_height - scaled_height) // 2
+        
+        # Llenar la pantalla de negro
+        self.screen.fill(Colors.BLACK)
+        
+        # Escalar y dibujar la superficie del juego
+        if self.smooth:
+            scaled_surface = pygame.transform.smoothscale(self.surface, (scaled_width, scaled_height))
+        else:
+            scaled_surface = pygame.transform.scale(self.surface, (scaled_width, scaled_height))
+        self.screen.blit(scaled_surface, (x_offset, y_offset))
+    
+    def present(self):
+        pygame.display.flip()
+    
+    def resize(self, size: Tuple[int, int]):
+        # Con vsync escala SDL
+        if not self.vsync:
+            self.screen = pygame.display.set_mode(size, pygame.RESIZABLE)
+    
+    def toggle_fullscreen(self):
+        if self.vsync:
+            # Conservar el renderer con vsync: SDL escala la superficie lógica
+            pygame.display.toggle_fullscreen()
+            return
+        flags = pygame.display.get_surface().get_flags()
+        if flags & pygame.FULLSCREEN:
+            # Cambiar a modo ventana
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.RESIZABLE)
+        else:
+            # Cambiar a pantalla completa
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+
+
+class TextureRenderer(Renderer):
+    """Texturas y copias del renderer de SDL (pygame._sdl2.video)."""
+    
+    name = 'texture'
+    
+    def __init__(
+        self,
+        title: str,
+        flags: int = 0,
+        vsync: bool = False,
+        accelerated: int = RenderConfig.ACCELERATED,
+        metrics: Instrumentation = instrumentation
+    ):
+        from pygame._sdl2 import sdl2, video
+        
+        self.video = video
+        self.metrics = metrics
+        self.fullscreen = bool(flags & pygame.FULLSCREEN)
+        self.window = video.Window(
+            title,
+            size=(SCREEN_WIDTH, SCREEN_HEIGHT),
+            resizable=bool(flags & pygame.RESIZABLE),
+            fullscreen_desktop=self.fullscreen
+        )
+        # -1 = el mejor disponible: primero la GPU (así se sabe cuál se obtuvo)
+        self.accelerated = accelerated != 0
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=int(self.accelerated), vsync=vsync)
+        except (pygame.error, sdl2.error) as e:
+            if not self.accelerated:
+                self.window.destroy()
+                raise pygame.error(str(e)) from e
+            # Sin GPU: el renderer por software de SDL
+            print(f"Renderer acelerado no disponible, se usa el de software de SDL: {e}")
+            self.renderer = video.Renderer(self.window, accelerated=0, vsync=vsync)
+            self.accelerated = False
+        self.vsync = vsync
+        # Filtro de las texturas (SDL lo lee al crear cada una). El renderer por software
+        # suaviza en CPU cada copia rotada: ahí se usa el de píxeles
+        os.environ.setdefault(
+            'SDL_RENDER_SCALE_QUALITY',
+            RenderConfig.SCALE_QUALITY if self.accelerated else RenderConfig.SOFTWARE_SCALE_QUALITY
+        )
+        # SDL escala la resolución virtual a la ventana manteniendo el aspecto
+        self.renderer.logical_size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        
+        # Una textura por superficie; se libera cuando la superficie desaparece
+        self.textures: 'weakref.WeakKeyDictionary[pygame.Surface, object]' = weakref.WeakKeyDictionary()
+        
+        # Lienzo de dibujo libre: se sube como textura al enviar el siguiente sprite
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay_texture = video.Texture(self.renderer, (SCREEN_WIDTH, SCREEN_HEIGHT), streaming=True)
+        self.overlay_texture.blend_mode = pygame.BLENDMODE_BLEND
+        self.overlay_dirty = False
+        self.overlay_gap = RenderConfig.OVERLAY_GAP_ROWS
+    
+    def texture(self, surface: pygame.Surface):
+        """Textura de una superficie (se sube la primera vez que se dibuja)."""
+        texture = self.textures.get(surface)
+        if texture is None:
+            texture = self.video.Texture.from_surface(self.renderer, surface)
+            self.textures[surface] = texture
+            self.metrics.increment('texture_uploads')
+            self.metrics.set_gauge('textures_cached', len(self.textures))
+        else:
+            self.metrics.increment('texture_cache_hits')
+        return texture
+    
+    def forget(self, surface: pygame.Surface):
+        self.textures.pop(surface, None)
+    
+    def _overlay_areas(self) -> List[pygame.Rect]:
+        """Rectángulos del lienzo con algo dibujado (bandas de filas separadas por huecos vacíos)."""
+        # Vista (ancho, alto) de los píxeles: 0 = transparente sin dibujar
+        pixels = pygame.surfarray.pixels2d(self.overlay)
+        rows = numpy.flatnonzero(pixels.any(axis=0))
+        areas = []
+        if len(rows):
+            # Cortes donde el hueco entre filas dibujadas supera overlay_gap
+            breaks = numpy.flatnonzero(numpy.diff(rows) > self.overlay_gap)
+            for top, bottom in zip(rows[numpy.r_[0, breaks + 1]], rows[numpy.r_[breaks, len(rows) - 1]]):
+                columns = numpy.flatnonzero(pixels[:, top:bottom + 1].any(axis=1))
+                areas.append(pygame.Rect(
+                    int(columns[0]), int(top), int(columns[-1] - columns[0] + 1), int(bottom - top + 1)
+                ))
+        del pixels  # Desbloquea la superficie
+        return areas
+    
+    def _flush_overlay(self):
+        """Compone lo dibujado en el lienzo antes de seguir enviando sprites."""
+        if not self.overlay_dirty:
+            return
+        self.overlay_dirty = False
+        # Solo se sube, se mezcla y se limpia lo dibujado, no el lienzo entero
+        for area in self._overlay_areas():
+            self.overlay_texture.update(self.overlay.subsurface(area), area)
+            self.overlay_texture.draw(srcrect=area, dstrect=area)
+            self.overlay.fill((0, 0, 0, 0), area)
+            self.metrics.increment('overlay_uploaded_px', area.w * area.h)
+    
+    def begin_frame(self, color: Color):
+        self.renderer.draw_color = (*color[:3], 255)
+        self.renderer.clear()
+    
+    def blit(self, surface: pygame.Surface, dest: Dest, alpha: int = 255):
+        self._flush_overlay()
+        texture = self.texture(surface)
+        dstrect = (dest[0], dest[1], texture.width, texture.height)
+        if alpha >= 255:
+            texture.draw(dstrect=dstrect)
+            return
+        texture.alpha = alpha
+        texture.draw(dstrect=dstrect)
+        texture.alpha = 255
+    
+    def blit_rotated(self, surface: pygame.Surface, center: Tuple[int, int], angle: float, alpha: int = 255):
+        self._flush_overlay()
+        texture = self.texture(surface)
+        dstrect = texture.get_rect(center=center)
+        texture.alpha = alpha
+        # SDL rota en sentido horario
+        texture.draw(dstrect=dstrect, angle=-angle)
+        texture.alpha = 255
+    
+    def fill(self, color: Color, rect: Optional[pygame.Rect] = None):
+        self._flush_overlay()
+        alpha = color[3] if len(color) > 3 else 255
+        self.renderer.draw_blend_mode = pygame.BLENDMODE_BLEND if alpha < 255 else pygame.BLENDMODE_NONE
+        self.renderer.draw_color = (*color[:3], alpha)
+        self.renderer.fill_rect(pygame.Rect(rect) if rect is not None else self.get_rect())
+    
+    def canvas(self) -> pygame.Surface:
+        self.overlay_dirty = True
+        return self.overlay
+    
+    def end_frame(self):
+        self._flush_overlay()
+    
+    def present(self):
+        self.renderer.present()
+    
+    def toggle_fullscreen(self):
+        if self.fullscreen:
+            self.window.set_windowed()
+        else:
+            self.window.set_fullscreen(desktop=True)
+        self.fullscreen = not self.fullscreen
+
+
+def create_renderer(backend: str, title: str, flags: int = 0, vsync: bool = False) -> Renderer:
+    """
+    Crea el backend de dibujo (con su ventana).
+
+    Args:
+        backend: 'software' o 'texture' (si no está disponible se usa 'software')
+        title: Título de la ventana
+        flags: Flags de pygame.display (FULLSCREEN, RESIZABLE)
+        vsync: Sincronizar con el refresco si el backend lo permite
+    """
+    if backend == 'texture':
+        try:
+            return TextureRenderer(title, flags, vsync)
+        except (ImportError, pygame.error) as e:
+            print(f"Renderer de texturas no disponible, se usa el de software: {e}")
+    elif backend != 'software':
+        raise ValueError(f"Backend de dibujo desconocido: {backend}")
+    return SoftwareRenderer(title, flags, vsync)
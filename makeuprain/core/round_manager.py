@@ -1,26 +1,37 @@
 """
 Sistema de gestión de rondas con dificultad progresiva.
+Los parámetros de cada ronda salen de una tabla precompilada (core.round_table).
 """
-import time
-from ..config import RoundConfig, EnemyConfig, CollectibleConfig
+from typing import Optional
+from ..config import RoundConfig
+from .clock import GameClock
+from .round_table import RoundTable, load_round_table
+from .telemetry import telemetry, EventType
 
 
 class RoundManager:
     """Gestiona las rondas y la dificultad progresiva del juego."""
     
-    def __init__(self):
+    def __init__(self, clock: GameClock, table: Optional[RoundTable] = None):
+        """
+        Args:
+            clock: Reloj de la simulación (el tiempo de ronda no corre en pausa)
+            table: Parámetros por ronda (por defecto, la tabla compartida)
+        """
+        self.clock = clock
+        self.table = table or load_round_table()
         self.current_round = 1
         self.items_collected_this_round = 0
         self.round_start_time = 0
         self.round_complete = False
         self.game_complete = False
-        
+    
     def start_round(self):
         """Inicia una nueva ronda."""
         self.items_collected_this_round = 0
-        self.round_start_time = time.time()
+        self.round_start_time = self.clock.now()
         self.round_complete = False
-        
+    
     def on_item_collected(self) -> bool:
         """Llamado cuando se recolecta un item. Devuelve True si se completó la ronda."""
         self.items_collected_this_round += 1
@@ -33,74 +44,74 @@ class RoundManager:
     def advance_round(self):
         """Avanza a la siguiente ronda."""
         if self.round_complete:
+            elapsed_ms = int(self.clock.since(self.round_start_time) * 1000)
+            telemetry.emit(EventType.ROUND_CLEAR, self.current_round, elapsed_ms)
             self.current_round += 1
             self.start_round()
             return True
         return False
     
+    @property
+    def current_round(self) -> int:
+        return self._current_round
+    
+    @current_round.setter
+    def current_round(self, number: int):
+        # Los parámetros de la ronda se buscan una vez al cambiar de ronda, no en cada consulta
+        self._current_round = number
+        self.params = self.table.get(number)
+    
     def get_speed_multiplier(self) -> float:
-        """Calcula el multiplicador de velocidad basado en la ronda actual."""
-        multiplier = 1.0 + (self.current_round - 1) * RoundConfig.SPEED_MULTIPLIER_PER_ROUND
-        return min(multiplier, RoundConfig.MAX_SPEED_MULTIPLIER)
-
+        """Multiplicador de velocidad de la ronda actual."""
+        return self.params.speed_multiplier
+    
     def get_items_goal(self) -> int:
-        """Objetivo de items para la ronda actual, usando secuencia configurable."""
-        idx = self.current_round - 1
-        if idx < len(RoundConfig.ITEMS_SEQUENCE):
-            return RoundConfig.ITEMS_SEQUENCE[idx]
-        # A partir del final de la secuencia, incrementar de forma lineal
-        last = RoundConfig.ITEMS_SEQUENCE[-1]
-        extra = (idx - (len(RoundConfig.ITEMS_SEQUENCE) - 1)) * RoundConfig.DEFAULT_ITEMS_INCREMENT
-        return last + extra
+        """Objetivo de items para la ronda actual."""
+        return self.params.items_goal
     
     def get_enemy_count(self) -> int:
-        """Calcula cuántos enemigos spawn en esta ronda."""
-        base_count = EnemyConfig.INITIAL_COUNT
-        return base_count + (self.current_round - 1) * RoundConfig.ENEMY_SPAWN_INCREASE
+        """Enemigos generados al empezar la ronda."""
+        return self.params.enemy_count
     
     def get_collectible_count(self) -> int:
-        """Calcula cuántos coleccionables spawn en esta ronda."""
-        base_count = CollectibleConfig.INITIAL_COUNT
-        # Aumentar coleccionables más que enemigos
-        return base_count + (self.current_round - 1) * RoundConfig.ENEMY_SPAWN_INCREASE * 2
-
+        """Coleccionables generados al empezar la ronda."""
+        return self.params.collectible_count
+    
     def get_enemy_cap(self) -> int:
-        return RoundConfig.ENEMY_MAX_ON_SCREEN_BASE + (self.current_round - 1) * RoundConfig.ENEMY_SPAWN_INCREASE
-
+        return self.params.enemy_cap
+    
     def get_collectible_cap(self) -> int:
-        return RoundConfig.COLLECTIBLE_MAX_ON_SCREEN_BASE + (self.current_round - 1) * (RoundConfig.ENEMY_SPAWN_INCREASE // 2 + 1)
-
+        return self.params.collectible_cap
+    
     def get_enemy_spawn_frames(self) -> int:
-        mult = self.get_speed_multiplier()
-        return max(10, int(RoundConfig.ENEMY_SPAWN_BASE_FRAMES / mult))
-
+        return self.params.enemy_spawn_frames
+    
     def get_collectible_spawn_frames(self) -> int:
-        mult = self.get_speed_multiplier()
-        return max(8, int(RoundConfig.COLLECTIBLE_SPAWN_BASE_FRAMES / mult))
+        return self.params.collectible_spawn_frames
     
     def get_round_bonus(self) -> int:
         """Calcula el bonus por completar la ronda."""
         bonus = RoundConfig.ROUND_CLEAR_BONUS
         
         # Bonus por tiempo si hay límite
-        if RoundConfig.ROUND_TIME_LIMIT > 0:
-            elapsed = time.time() - self.round_start_time
-            time_left = max(0, RoundConfig.ROUND_TIME_LIMIT - elapsed)
+        if self.params.time_limit > 0:
+            elapsed = self.clock.since(self.round_start_time)
+            time_left = max(0, self.params.time_limit - elapsed)
             bonus += int(time_left * RoundConfig.TIME_BONUS_PER_SECOND)
         
         return bonus
     
     def get_time_left(self) -> float:
         """Retorna el tiempo restante en la ronda (0 si no hay límite)."""
-        if RoundConfig.ROUND_TIME_LIMIT <= 0:
+        if self.params.time_limit <= 0:
             return 0
         
-        elapsed = time.time() - self.round_start_time
-        return max(0, RoundConfig.ROUND_TIME_LIMIT - elapsed)
+        elapsed = self.clock.since(self.round_start_time)
+        return max(0, self.params.time_limit - elapsed)
     
     def is_time_up(self) -> bool:
         """Verifica si se acabó el tiempo de la ronda."""
-        if RoundConfig.ROUND_TIME_LIMIT <= 0:
+        if self.params.time_limit <= 0:
             return False
         return self.get_time_left() <= 0
     
@@ -0,0 +1,163 @@
+"""
+Tabla precompilada de parámetros por ronda.
+Cada ronda se compila una sola vez en un RoundParams inmutable; las consultas
+por frame son lecturas de atributos. Las rondas posteriores a las definidas
+se añaden bajo demanda.
+
+Las definiciones salen de RoundConfig o de un JSON (RoundConfig.DEFINITIONS_FILE):
+
+    {
+        "rounds": [{"items_goal": 10}, {"items_goal": 15, "speed_multiplier": 1.2}],
+        "growth": {"items_goal": 20, "enemy_cap": 2}
+    }
+
+Cada ronda hereda la anterior más el crecimiento ("growth", por defecto el de
+RoundConfig) y después aplica sus propios valores. Los intervalos de spawn
+se derivan del multiplicador de velocidad salvo que la ronda los indique.
+Las oleadas ("waves": [[20, "row"], [30, "v", 15]]) también se heredan.
+"""
+import json
+import os
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from ..config import RoundConfig, EnemyConfig, CollectibleConfig, SpawnConfig
+
+
+class RoundParams(NamedTuple):
+    """Parámetros de una ronda (inmutables)."""
+    number: int
+    items_goal: int
+    time_limit: float           # Segundos (0 = sin límite)
+    speed_multiplier: float
+    enemy_count: int            # Entidades generadas al empezar la ronda
+    collectible_count: int
+    enemy_cap: int              # Máximo en pantalla durante el spawn continuo
+    collectible_cap: int
+    enemy_spawn_frames: int     # Frames entre spawns continuos
+    collectible_spawn_frames: int
+    waves: tuple = ()           # Oleadas diseñadas: ((segundo, patrón, repetir cada s o 0), ...)
+
+
+# Campos que puede fijar una definición (number lo pone la tabla)
+FIELDS = RoundParams._fields[1:]
+FLOAT_FIELDS = ('time_limit', 'speed_multiplier')
+NUMERIC_FIELDS = tuple(field for field in FIELDS if field != 'waves')
+
+
+def _default_growth() -> Dict[str, float]:
+    """Crecimiento por ronda equivalente a las fórmulas de RoundConfig."""
+    increase = RoundConfig.ENEMY_SPAWN_INCREASE
+    return {
+        'items_goal': RoundConfig.DEFAULT_ITEMS_INCREMENT,
+        'speed_multiplier': RoundConfig.SPEED_MULTIPLIER_PER_ROUND,
+        'enemy_count': increase,
+        'collectible_count': increase * 2,
+        'enemy_cap': increase,
+        'collectible_cap': increase // 2 + 1,
+    }
+
+
+def _first_round() -> Dict[str, float]:
+    """Valores de la ronda 1 según RoundConfig."""
+    return {
+        'items_goal': RoundConfig.ITEMS_SEQUENCE[0],
+        'time_limit': RoundConfig.ROUND_TIME_LIMIT,
+        'speed_multiplier': 1.0,
+        'enemy_count': EnemyConfig.INITIAL_COUNT,
+        'collectible_count': CollectibleConfig.INITIAL_COUNT,
+        'enemy_cap': RoundConfig.ENEMY_MAX_ON_SCREEN_BASE,
+        'collectible_cap': RoundConfig.COLLECTIBLE_MAX_ON_SCREEN_BASE,
+        'waves': (),
+    }
+
+
+def _parse_wave(wave) -> Tuple[float, str, float]:
+    """(segundo, patrón, repetir cada s) a partir de una lista o tupla de 2 o 3 elementos."""
+    at, pattern, *every = wave
+    if pattern not in SpawnConfig.PATTERNS:
+        raise ValueError(f"Patrón de oleada desconocido: {pattern}")
+    return float(at), pattern, float(every[0]) if every else 0.0
+
+
+class RoundTable:
+    """Parámetros compilados por ronda, ampliados bajo demanda."""
+    
+    def __init__(self, rounds: Optional[List[dict]] = None, growth: Optional[dict] = None):
+        """
+        Args:
+            rounds: Valores por ronda, empezando por la 1 (campos de RoundParams)
+            growth: Incremento por ronda de cada campo al heredar de la anterior
+        """
+        if rounds is None:
+            rounds = [{'items_goal': goal} for goal in RoundConfig.ITEMS_SEQUENCE]
+            for number, waves in sorted(RoundConfig.WAVES.items()):
+                while len(rounds) < number:
+                    rounds.append({})
+                rounds[number - 1]['waves'] = waves
+        self.definitions = [self._validate(row) for row in rounds]
+        self.growth = self._validate(_default_growth() if growth is None else growth)
+        if 'waves' in self.growth:
+            raise ValueError("Las oleadas no tienen crecimiento")
+        self.rows: List[RoundParams] = []
+    
+    @staticmethod
+    def _validate(row: dict) -> dict:
+        unknown = set(row) - set(FIELDS)
+        if unknown:
+            raise ValueError(f"Campos de ronda desconocidos: {', '.join(sorted(unknown))}")
+        return dict(row)
+    
+    @classmethod
+    def from_file(cls, path: str) -> 'RoundTable':
+        """Tabla a partir de un JSON con las claves 'rounds' y 'growth' (opcional)."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data.get('rounds', []), data.get('growth'))
+    
+    def get(self, number: int) -> RoundParams:
+        """Parámetros de la ronda indicada (desde 1), compilando las que falten."""
+        index = max(1, number) - 1
+        while len(self.rows) <= index:
+            self.rows.append(self._compile(len(self.rows) + 1))
+        return self.rows[index]
+    
+    def _compile(self, number: int) -> RoundParams:
+        if self.rows:
+            # Heredar la ronda anterior más el crecimiento
+            previous = self.rows[-1]
+            values = previous._asdict()
+            del values['number']
+            for field, step in self.growth.items():
+                values[field] += step
+            # El crecimiento no pasa del tope (una ronda definida por encima lo mantiene)
+            ceiling = max(RoundConfig.MAX_SPEED_MULTIPLIER, previous.speed_multiplier)
+            values['speed_multiplier'] = round(min(values['speed_multiplier'], ceiling), 6)
+        else:
+            values = _first_round()
+        
+        definition = self.definitions[number - 1] if number <= len(self.definitions) else {}
+        values.update(definition)
+        
+        speed = values['speed_multiplier']
+        if 'enemy_spawn_frames' not in definition:
+            values['enemy_spawn_frames'] = max(RoundConfig.ENEMY_SPAWN_MIN_FRAMES, int(RoundConfig.ENEMY_SPAWN_BASE_FRAMES / speed))
+        if 'collectible_spawn_frames' not in definition:
+            values['collectible_spawn_frames'] = max(RoundConfig.COLLECTIBLE_SPAWN_MIN_FRAMES, int(RoundConfig.COLLECTIBLE_SPAWN_BASE_FRAMES / speed))
+        
+        for field in NUMERIC_FIELDS:
+            values[field] = float(values[field]) if field in FLOAT_FIELDS else int(values[field])
+        values['waves'] = tuple(_parse_wave(wave) for wave in values['waves'])
+        return RoundParams(number=number, **values)
+
+
+@lru_cache(maxsize=1)
+def load_round_table() -> RoundTable:
+    """Tabla compartida: RoundConfig.DEFINITIONS_FILE si existe y es válido, si no RoundConfig."""
+    path = RoundConfig.DEFINITIONS_FILE
+    if path and os.path.exists(path):
+        try:
+            return RoundTable.from_file(path)
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            print(f"⚠️ No se pudieron cargar las rondas de {path}: {e}")
+    return RoundTable()
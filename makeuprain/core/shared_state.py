@@ -0,0 +1,180 @@
+"""
+Estado de juego compartido entre procesos (modo simulación/render separados).
+El proceso de simulación escribe cada tick una instantánea compacta en uno de
+dos buffers de un bloque de multiprocessing.shared_memory y publica cuál es el
+último completo; el proceso de render copia ese buffer (una sola copia de
+bytes) y después valida la copia con el número de secuencia del buffer
+(seqlock): si cambió durante la copia, la descarta y vuelve a leer.
+La entrada (máscaras de acciones) viaja en sentido contrario como mensajes de pocos bytes.
+"""
+import struct
+from multiprocessing import shared_memory
+from typing import Optional, Tuple
+
+import numpy
+
+from ..config import GameConfig
+from .audio import SFX_NAMES
+
+MAX_FALLING = 256  # Enemigos o coleccionables por buffer (se descartan los que sobren)
+
+# Escena a la que debe pasar el render cuando la simulación termina
+NEXT_SCENE_CODES = {None: 0, 'menu': 1, 'gameover': 2}
+NEXT_SCENE_NAMES = {code: name for name, code in NEXT_SCENE_CODES.items()}
+
+PLAYER_DTYPE = numpy.dtype([
+    ('x', numpy.int32), ('y', numpy.int32),
+    ('lives', numpy.int32), ('score', numpy.int64),
+    ('alpha', numpy.int32), ('dying', numpy.uint8), ('death_timer', numpy.int32),
+])
+
+# `value` es el ángulo (enemigos) o la fase de flotación (coleccionables)
+FALLING_DTYPE = numpy.dtype([('x', numpy.int32), ('y', numpy.int32), ('value', numpy.float32)])
+
+PARTICLE_DTYPE = numpy.dtype([
+    ('x', numpy.float32), ('y', numpy.float32), ('color', numpy.uint8, (3,)),
+    ('size', numpy.int16), ('lifetime', numpy.int16), ('max_lifetime', numpy.int16),
+])
+
+FRAME_DTYPE = numpy.dtype([
+    ('seq', numpy.uint64),  # Impar mientras se escribe
+    ('paused', numpy.uint8), ('round_transition', numpy.uint8), ('next_scene', numpy.uint8),
+    ('transition_alpha', numpy.int16),
+    ('round', numpy.int32), ('items', numpy.int32), ('round_bonus', numpy.int32),
+    ('score', numpy.int64), ('high_score', numpy.int64),
+    ('combo', numpy.int32), ('combo_timer', numpy.float32), ('multiplier', numpy.float32),
+    ('n_players', numpy.int32), ('n_enemies', numpy.int32),
+    ('n_collectibles', numpy.int32), ('n_particles', numpy.int32),
+    ('players', PLAYER_DTYPE, (2,)),
+    ('enemies', FALLING_DTYPE, (MAX_FALLING,)),
+    ('collectibles', FALLING_DTYPE, (MAX_FALLING,)),
+    ('particles', PARTICLE_DTYPE, (GameConfig.MAX_PARTICLES,)),
+    ('sfx', numpy.uint32, (len(SFX_NAMES),)),  # Efectos pedidos desde el inicio (ver core.audio)
+])
+
+CONTROL_SIZE = 64  # Índice del último buffer completo (alineado a una línea de caché)
+
+# Acciones mantenidas, acciones pulsadas (ver core.input.Action), nivel de calidad,
+# petición de pausa (la ventana perdió el foco)
+INPUT_FORMAT = '<IIB?'
+
+
+def pack_input(held: int, pressed: int, tier: int, pause: bool = False) -> bytes:
+    """Mensaje de entrada del render a la simulación."""
+    return struct.pack(INPUT_FORMAT, held, pressed, tier, pause)
+
+
+def unpack_input(message: bytes) -> Tuple[int, int, int, bool]:
+    """(acciones mantenidas, acciones pulsadas, nivel de calidad, pausa) de un mensaje de entrada."""
+    return struct.unpack(INPUT_FORMAT, message)
+
+
+class SharedFrameBuffer:
+    """Doble buffer de instantáneas de juego sobre memoria compartida."""
+    
+    def __init__(self, name: Optional[str] = None):
+        size = CONTROL_SIZE + 2 * FRAME_DTYPE.itemsize
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        self.control = numpy.ndarray((1,), dtype=numpy.uint32, buffer=self.shm.buf)
+        self.frames = numpy.ndarray((2,), dtype=FRAME_DTYPE, buffer=self.shm.buf, offset=CONTROL_SIZE)
+        if self.owner:
+            self.frames['seq'] = 0
+            self.control[0] = 0
+        self._seq = 0
+    
+    @property
+    def name(self) -> str:
+        return self.shm.name
+    
+    # ----- Escritura (proceso de simulación) -----
+    
+    def write(self, scene, next_scene: Optional[str] = None):
+        """Escribe la instantánea de una GameScene en el buffer libre y lo publica."""
+        back = 1 - int(self.control[0])
+        frame = self.frames[back]
+        self._seq += 2
+        frame['seq'] = self._seq - 1
+        
+        score_system = scene.game_manager.score_system
+        frame['paused'] = scene.paused
+        frame['round_transition'] = scene.showing_round_transition
+        frame['next_scene'] = NEXT_SCENE_CODES.get(next_scene, 0)
+        frame['transition_alpha'] = scene.transition_alpha
+        frame['round'] = scene.round_manager.current_round
+        frame['items'] = scene.round_manager.items_collected_this_round
+        frame['round_bonus'] = scene.round_bonus
+        frame['score'] = score_system.score
+        frame['high_score'] = score_system.high_score
+        frame['combo'] = score_system.combo
+        frame['combo_timer'] = score_system.combo_timer
+        frame['multiplier'] = score_system.multiplier
+        frame['sfx'] = scene.game_manager.audio.cue_counts
+        
+        players = frame['players']
+        frame['n_players'] = len(scene.players)
+        for record, player in zip(players, scene.players):
+            record['x'], record['y'] = player.rect.topleft
+            record['lives'] = player.lives
+            record['score'] = player.score
+            record['alpha'] = player.alpha
+            record['dying'] = player.dying
+            record['death_timer'] = player.death_timer
+        
+        frame['n_enemies'] = self._write_falling(frame['enemies'], scene.enemies, lambda enemy: enemy.get_angle())
+        frame['n_collectibles'] = self._write_falling(
+            frame['collectibles'], scene.collectibles,
+            lambda item: item.store.get_phase(item) if item.store is not None else item.phase
+        )
+        
+        particles = scene.particles[:GameConfig.MAX_PARTICLES]
+        frame['n_particles'] = len(particles)
+        if particles:
+            records = frame['particles']
+            records['x'][:len(particles)] = [particle.x for particle in particles]
+            records['y'][:len(particles)] = [particle.y for particle in particles]
+            records['color'][:len(particles)] = [particle.color[:3] for particle in particles]
+            records['size'][:len(particles)] = [particle.size for particle in particles]
+            records['lifetime'][:len(particles)] = [particle.lifetime for particle in particles]
+            records['max_lifetime'][:len(particles)] = [particle.max_lifetime for particle in particles]
+        
+        frame['seq'] = self._seq
+        self.control[0] = back
+    
+    @staticmethod
+    def _write_falling(records: numpy.ndarray, group, value) -> int:
+        sprites = group.sprites()[:MAX_FALLING]
+        count = len(sprites)
+        if count:
+            records['x'][:count] = [sprite.rect.x for sprite in sprites]
+            records['y'][:count] = [sprite.rect.y for sprite in sprites]
+            records['value'][:count] = [value(sprite) for sprite in sprites]
+        return count
+    
+    # ----- Lectura (proceso de render) -----
+    
+    def latest(self) -> Optional[Tuple[numpy.void, int]]:
+        """
+        Vista del último buffer publicado y su número de secuencia, o None si
+        todavía no hay ninguno completo. La simulación puede reescribirlo en
+        cualquier momento: el lector lo copia y solo usa la copia si
+        is_intact(frame, seq) sigue siendo cierto después.
+        """
+        frame = self.frames[int(self.control[0])]
+        seq = int(frame['seq'])
+        if seq == 0 or seq % 2:
+            return None
+        return frame, seq
+    
+    @staticmethod
+    def is_intact(frame: numpy.void, seq: int) -> bool:
+        """True si el buffer no se reescribió mientras se leía."""
+        return int(frame['seq']) == seq
+    
+    def close(self):
+        """Libera las vistas y el bloque (lo elimina si este proceso lo creó)."""
+        del self.control
+        del self.frames
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
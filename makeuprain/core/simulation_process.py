@@ -0,0 +1,120 @@
+"""
+Proceso de simulación para el modo de dos procesos.
+Ejecuta una GameScene sin ventana (lógica, colisiones, rondas) a ritmo fijo,
+recibe la entrada por una tubería y publica cada tick una instantánea en
+memoria compartida para el proceso de render (RemoteGameScene).
+"""
+import os
+
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, PacingConfig, JobConfig, IdleConfig
+
+
+class SimulationHost:
+    """Sustituto mínimo de GameManager para una GameScene sin ventana."""
+    
+    def __init__(self, game_mode: int, tier: int):
+        from ..ui import ScoreSystem
+        from .quality import QualityGovernor
+        from .jobs import JobScheduler
+        from .gc_policy import GCPolicy
+        from .input import InputSystem
+        from .audio import AudioEngine
+        from .clock import GameClock
+        
+        self.game_mode = game_mode
+        self.clock = GameClock()  # Lo avanza la GameScene en cada tick
+        self.score_system = ScoreSystem(self.clock)
+        # El nivel de calidad lo decide el render (donde se mide el tiempo de dibujo)
+        self.quality = QualityGovernor(FPS)
+        self.quality.enabled = False
+        self.quality.tier = tier
+        self.jobs = JobScheduler()
+        self.gc_policy = GCPolicy()
+        self.input = InputSystem(gamepads=False)  # Alimentado por los mensajes del render
+        self.audio = AudioEngine()  # Sin mixer: solo cuenta los efectos (los reproduce el render)
+        self.scenes = {}
+        self.next_scene = None
+    
+    def change_scene(self, scene_name: str):
+        """La simulación termina: el render cambia de escena al leerlo."""
+        self.next_scene = scene_name
+
+
+def simulation_main(shm_name: str, conn, game_mode: int, tier: int):
+    """
+    Punto de entrada del proceso de simulación.
+
+    Args:
+        shm_name: Nombre del bloque de memoria compartida creado por el render
+        conn: Extremo de la tubería por el que llegan los mensajes de entrada
+        game_mode: 1 = individual, 2 = cooperativo
+        tier: Nivel de calidad inicial (limita partículas y textos)
+    """
+    # Sin ventana ni audio: solo lógica
+    os.environ['SDL_VIDEODRIVER'] = 'dummy'
+    os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+    
+    import pygame
+    from ..scenes.game_scene import GameScene
+    from .frame_pacer import FramePacer
+    from .jobs import JobPriority
+    from .shared_state import SharedFrameBuffer, unpack_input
+    from .telemetry import telemetry
+    
+    pygame.display.init()
+    pygame.font.init()
+    # Las imágenes necesitan un modo de vídeo para convert_alpha()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    host = SimulationHost(game_mode, tier)
+    telemetry.clock = host.clock
+    telemetry.start('simulation')
+    buffer = SharedFrameBuffer(shm_name)
+    scene = GameScene(host)
+    host.gc_policy.install()
+    scene.on_enter()
+    pacer = FramePacer(FPS, PacingConfig.MODE, PacingConfig.SPIN_MARGIN_MS)
+    
+    try:
+        while host.next_scene is None:
+            # Entrada acumulada desde el último tick (mensaje vacío = salir)
+            held = host.input.snapshot.held
+            pressed = 0
+            pause = False
+            while conn.poll():
+                message = conn.recv_bytes()
+                if not message:
+                    return
+                held, down, host.quality.tier, pause_requested = unpack_input(message)
+                pressed |= down
+                pause |= pause_requested
+            host.input.apply(held, pressed)
+            if pause:
+                # La ventana perdió el foco: pausa y ritmo de ventana sin foco hasta que se reanude
+                scene.set_paused(True)
+                if IdleConfig.ENABLED:
+                    pacer.set_fps(IdleConfig.UNFOCUSED_FPS)
+            elif not scene.paused:
+                pacer.set_fps(FPS)
+            
+            scene.handle_events([])
+            scene.update()
+            
+            if host.score_system.high_score_dirty:
+                host.jobs.submit(host.score_system.save_high_score, JobPriority.LOW, 'save_high_score')
+                host.score_system.high_score_dirty = False
+            host.jobs.run(JobConfig.MAX_BUDGET_MS, allow_overrun=not scene.in_gameplay())
+            
+            buffer.write(scene, host.next_scene)
+            pacer.wait()
+    except (EOFError, OSError):
+        pass  # El render cerró la tubería
+    finally:
+        host.jobs.flush()
+        scene.on_exit()
+        host.gc_policy.uninstall()
+        telemetry.close()
+        buffer.close()
+        conn.close()
+        pygame.quit()
@@ -0,0 +1,63 @@
+"""
+Utilidades de arranque rápido.
+Registra marcas de tiempo del arranque e inicializa el mixer de audio
+fuera del camino crítico hasta el primer frame.
+"""
+import time
+from typing import Dict, Optional
+
+import pygame
+
+from ..config import AudioConfig
+
+
+class StartupProfiler:
+    """Registra marcas de tiempo relativas al inicio del arranque."""
+    
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.marks: Dict[str, float] = {}
+    
+    def mark(self, name: str):
+        """Guarda una marca (solo la primera vez que se alcanza)."""
+        if name not in self.marks:
+            self.marks[name] = time.perf_counter() - self.start
+    
+    def report(self) -> str:
+        """Devuelve un resumen legible de las marcas en milisegundos."""
+        lines = []
+        for name, elapsed in sorted(self.marks.items(), key=lambda item: item[1]):
+            lines.append(f"{elapsed * 1000:9.2f} ms  {name}")
+        return "\n".join(lines)
+
+
+class MixerLoader:
+    """
+    Inicializa pygame.mixer fuera del camino crítico hasta el primer frame.
+    SDL no admite abrir el audio desde otro hilo: GameManager llama a init()
+    en el hilo principal, en el frame siguiente al primero mostrado.
+    """
+    
+    def __init__(self):
+        self.done = False
+        self.error: Optional[Exception] = None
+        self.elapsed = 0.0
+    
+    def init(self):
+        """Inicializa el mixer una sola vez (puede tardar cientos de ms)."""
+        if self.done:
+            return
+        start = time.perf_counter()
+        try:
+            # Buffer pequeño: menos retardo entre pedir un efecto y oírlo
+            pygame.mixer.init(AudioConfig.FREQUENCY, AudioConfig.SIZE, AudioConfig.CHANNELS, AudioConfig.BUFFER)
+        except pygame.error as e:
+            self.error = e
+        finally:
+            self.elapsed = time.perf_counter() - start
+            self.done = True
+    
+    @property
+    def ready(self) -> bool:
+        """True si el mixer quedó inicializado correctamente."""
+        return self.done and self.error is None
@@ -0,0 +1,187 @@
+"""
+Telemetría de la partida: registro de eventos de juego en disco.
+Escenas, ScoreSystem y RoundManager emiten eventos tipados (EventType) con dos
+enteros de datos. Emitir solo añade una tupla a un anillo en memoria; un hilo
+escritor lo vacía cada TelemetryConfig.FLUSH_INTERVAL_S en líneas JSON de
+solo añadido y rota el archivo por tamaño:
+
+    {"session": "game", "pid": 1234, "started": 1760000000.0, "fps": 60, ...}
+    [17,12.503,742,"pickup",1,4]
+
+(número de secuencia, segundos reales, tick simulado, tipo, a, b). Un hueco en
+la secuencia son eventos perdidos porque el anillo se llenó. Si el disco falla
+(lleno, sin permisos...) el lote se descarta y se reintenta pasado un tiempo:
+la partida nunca espera a la escritura.
+"""
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+from ..config import FPS, TelemetryConfig
+from .clock import GameClock
+from .instrumentation import instrumentation
+
+
+class EventType:
+    """Tipos de evento (datos a, b de cada uno)."""
+    GAME_START = 1    # modo (1 o 2 jugadores), semilla de la partida
+    PICKUP = 2        # jugador, combo tras recoger
+    HIT = 3           # jugador, vidas restantes
+    DEATH = 4         # jugador, puntuación del jugador
+    COMBO_BREAK = 5   # combo perdido, puntuación total
+    ROUND_CLEAR = 6   # ronda superada, milisegundos simulados que duró
+    GAME_OVER = 7     # puntuación total, ronda alcanzada
+    PAUSE = 8
+    RESUME = 9
+    FRAME_SPIKE = 10  # microsegundos de trabajo del frame, número de frame
+    
+    NAMES = {
+        GAME_START: 'game_start', PICKUP: 'pickup', HIT: 'hit', DEATH: 'death',
+        COMBO_BREAK: 'combo_break', ROUND_CLEAR: 'round_clear', GAME_OVER: 'game_over',
+        PAUSE: 'pause', RESUME: 'resume', FRAME_SPIKE: 'frame_spike',
+    }
+
+
+# Un evento en el anillo: (secuencia, perf_counter, tick, tipo, a, b)
+Event = Tuple[int, float, int, int, int, int]
+
+
+class Telemetry:
+    """Anillo de eventos en memoria más un hilo que lo vuelca a disco."""
+    
+    def __init__(self, size: int = TelemetryConfig.BUFFER_EVENTS):
+        self.ring: Deque[Event] = deque(maxlen=size)
+        self.clock = GameClock()  # El GameManager pone el suyo (tick de cada evento)
+        self.start_time = time.perf_counter()
+        self._sequence = itertools.count()
+        self._next = 0  # Siguiente secuencia que espera el escritor
+        self.written = 0
+        self.overflowed = 0  # Perdidos porque el anillo se llenó antes de vaciarlo
+        self.failed = 0  # Perdidos por errores de escritura
+        self.name = 'telemetry'
+        self.path: Optional[str] = None
+        self._file = None
+        self._retry_at = 0.0
+        self._warned = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+    
+    def emit(self, kind: int, a: int = 0, b: int = 0):
+        """Registra un evento (camino caliente: solo una tupla en el anillo)."""
+        self.ring.append((next(self._sequence), time.perf_counter(), self.clock.ticks, kind, a, b))
+    
+    def recent(self, count: int = 20) -> List[Event]:
+        """Los últimos eventos aún en memoria (copia)."""
+        return list(self.ring)[-count:]
+    
+    def start(self, name: str = 'telemetry'):
+        """Lanza el hilo escritor (sin TelemetryConfig.ENABLED los eventos solo quedan en memoria)."""
+        if not TelemetryConfig.ENABLED or (self._thread is not None and self._thread.is_alive()):
+            return
+        self.name = name
+        self.path = os.path.join(TelemetryConfig.DIR, f"{name}.jsonl")
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+    
+    def close(self, timeout: float = 1.0):
+        """Detiene el hilo tras un último vaciado (como mucho `timeout` segundos)."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout)
+        self._thread = None
+    
+    def _run(self):
+        while not self._stop.wait(TelemetryConfig.FLUSH_INTERVAL_S):
+            self.flush()
+        self.flush()
+        if self._file is not None:
+            self._close_file()
+    
+    def _drain(self) -> List[Event]:
+        """Saca del anillo lo pendiente y cuenta los huecos de secuencia."""
+        ring = self.ring
+        batch = []
+        while ring:
+            batch.append(ring.popleft())
+        if batch:
+            self.overflowed += batch[0][0] - self._next
+            self._next = batch[-1][0] + 1
+        return batch
+    
+    def flush(self):
+        """Escribe en disco lo pendiente (lo llama el hilo escritor)."""
+        batch = self._drain()
+        if batch:
+            if time.perf_counter() < self._retry_at:
+                self.failed += len(batch)  # Aún en espera tras un error: se descarta
+            else:
+                try:
+                    self._write(batch)
+                    self.written += len(batch)
+                except OSError as e:
+                    self._on_error(e, len(batch))
+        instrumentation.set_gauge('telemetry_written', self.written)
+        instrumentation.set_gauge('telemetry_dropped', self.overflowed + self.failed)
+    
+    def _write(self, batch: List[Event]):
+        start = self.start_time
+        names = EventType.NAMES
+        lines = "".join(
+            f'[{sequence},{t - start:.3f},{tick},"{names.get(kind, kind)}",{a},{b}]\n'
+            for sequence, t, tick, kind, a, b in batch
+        )
+        if self._file is None:
+            self._open_file()
+        elif self._file.tell() + len(lines) > TelemetryConfig.MAX_FILE_BYTES:
+            self._close_file()
+            self._rotate()
+            self._open_file()
+        self._file.write(lines)
+        self._file.flush()
+    
+    def _open_file(self):
+        os.makedirs(TelemetryConfig.DIR, exist_ok=True)
+        self._file = open(self.path, 'a', encoding='utf-8')
+        # Cabecera de sesión (también al principio de cada archivo rotado)
+        header = {
+            'session': self.name, 'pid': os.getpid(), 'started': time.time(),
+            'fps': FPS, 'events': EventType.NAMES,
+        }
+        self._file.write(json.dumps(header) + "\n")
+    
+    def _close_file(self):
+        try:
+            self._file.close()
+        except OSError:
+            pass
+        self._file = None
+    
+    def _rotate(self):
+        """name.jsonl -> name.1.jsonl -> ... -> name.BACKUPS.jsonl (el más antiguo se borra)."""
+        base = self.path[:-len('.jsonl')]
+        for index in range(TelemetryConfig.BACKUPS, 0, -1):
+            source = f"{base}.{index - 1}.jsonl" if index > 1 else self.path
+            if os.path.exists(source):
+                os.replace(source, f"{base}.{index}.jsonl")
+        if TelemetryConfig.BACKUPS <= 0:
+            os.remove(self.path)
+    
+    def _on_error(self, error: OSError, count: int):
+        self.failed += count
+        self._retry_at = time.perf_counter() + TelemetryConfig.RETRY_S
+        if self._file is not None:
+            self._close_file()
+        instrumentation.increment('telemetry_write_errors')
+        if not self._warned:
+            self._warned = True
+            print(f"⚠️ No se pudo escribir la telemetría en {self.path}: {error}")
+
+
+# Instancia global
+telemetry = Telemetry()
@@ -9,6 +9,10 @@ from .game_entities import (
     Particle,
     create_particle_burst
 )
+from .collision import get_mask, register_hull, collide_hull, collide_swept
+from .pool import EntityPool
+from .falling_store import FallingStore
+from .spawn_queue import PendingSpawnQueue
 
 __all__ = [
     'Entity',
@@ -16,5 +20,12 @@ __all__ = [
     'Enemy',
     'Collectible',
     'Particle',
-    'create_particle_burst'
+    'create_particle_burst',
+    'get_mask',
+    'register_hull',
+    'collide_hull',
+    'collide_swept',
+    'EntityPool',
+    'FallingStore',
+    'PendingSpawnQueue'
 ]
@@ -0,0 +1,314 @@
+"""
+Formas de colisión (hulls) generadas a partir del canal alfa de cada imagen.
+Alternativa barata a las máscaras por píxel: círculo, cápsula, polígono
+convexo, rectángulo o máscara reducida, a elegir por asset.
+
+Cada forma se rasteriza en el marco de su imagen y se cachea por paso de
+rotación; la entidad lleva en `mask` la de su giro actual, así que la prueba
+exacta es la misma que la de pygame.sprite.collide_mask.
+"""
+import math
+import weakref
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy
+import pygame
+
+Point = Tuple[float, float]
+
+# Píxeles con alfa por encima de este umbral se consideran sólidos
+ALPHA_THRESHOLD = 127
+
+# Grados entre las máscaras cacheadas de una forma girada (error máximo: la mitad)
+ROTATION_STEP = 5.0
+
+class Hull:
+    """
+    Forma convexa con radio: la suma de Minkowski de un polígono (1 punto =
+    círculo, 2 puntos = cápsula, 3+ = polígono) y un disco de radio `radius`.
+    Los puntos son relativos al centro de la imagen, de tamaño `size`.
+    """
+    
+    def __init__(self, kind: str, points: Sequence[Point], radius: float = 0.0, size: Tuple[int, int] = (0, 0)):
+        self.kind = kind
+        self.points = [(float(x), float(y)) for x, y in points]
+        self.radius = float(radius)
+        self.size = size
+        # Máscaras por paso de rotación, rasterizadas la primera vez que se piden
+        self._masks: List[Optional[pygame.mask.Mask]] = [None] * round(360 / ROTATION_STEP)
+    
+    def world_points(self, center: Tuple[float, float], angle: float = 0.0) -> List[Point]:
+        """Transforma los puntos a coordenadas de pantalla (rotación como pygame.transform.rotate)."""
+        cx, cy = center
+        if abs(angle) <= 0.1:
+            return [(cx + x, cy + y) for x, y in self.points]
+        rad = math.radians(angle)
+        cos_a, sin_a = math.cos(rad), math.sin(rad)
+        # pygame rota en sentido antihorario con el eje Y hacia abajo
+        return [(cx + x * cos_a + y * sin_a, cy - x * sin_a + y * cos_a) for x, y in self.points]
+    
+    def mask_at(self, angle: float) -> pygame.mask.Mask:
+        """Máscara de la forma girada al paso de ROTATION_STEP más cercano."""
+        masks = self._masks
+        step = round(angle / ROTATION_STEP) % len(masks)
+        mask = masks[step]
+        if mask is None:
+            mask = masks[step] = self._rasterize(step * ROTATION_STEP)
+        return mask
+    
+    def _rasterize(self, angle: float) -> pygame.mask.Mask:
+        """
+        Dibuja el polígono ensanchado por el radio (aristas y discos en los
+        vértices) en el marco de la imagen: lo que sobresale al girar se recorta.
+        """
+        width, height = self.size
+        points = self.world_points((width / 2, height / 2), angle)
+        radius = self.radius
+        surface = pygame.Surface((width, height))
+        solid = (255, 255, 255)
+        if len(points) >= 3:
+            pygame.draw.polygon(surface, solid, points)
+        if radius > 0.0:
+            for point in points:
+                pygame.draw.circle(surface, solid, point, radius)
+            for (ax, ay), (bx, by) in _edges(points):
+                length = math.hypot(bx - ax, by - ay)
+                if length > 0.0:
+                    nx, ny = (ay - by) / length * radius, (bx - ax) / length * radius
+                    pygame.draw.polygon(
+                        surface, solid, [(ax + nx, ay + ny), (bx + nx, by + ny), (bx - nx, by - ny), (ax - nx, ay - ny)]
+                    )
+        surface.set_colorkey((0, 0, 0))
+        return pygame.mask.from_surface(surface)
+
+
+class MaskHull:
+    """Máscara reducida por un factor y vuelta a su tamaño: precisión configurable."""
+    
+    def __init__(self, mask: pygame.mask.Mask, factor: int):
+        self.kind = 'mask'
+        self.factor = max(1, int(factor))
+        width, height = mask.get_size()
+        if self.factor > 1:
+            size = (max(1, math.ceil(width / self.factor)), max(1, math.ceil(height / self.factor)))
+            mask = mask.scale(size).scale((width, height))
+        self.mask = mask
+    
+    def mask_at(self, angle: float) -> pygame.mask.Mask:
+        """La misma máscara con cualquier giro."""
+        return self.mask
+
+
+HullType = Union[Hull, MaskHull]
+
+# Máscaras compartidas por todas las entidades que usan la misma imagen
+_mask_cache: "weakref.WeakKeyDictionary[pygame.Surface, pygame.mask.Mask]" = weakref.WeakKeyDictionary()
+
+# Formas registradas por imagen (se liberan junto con la imagen)
+_hulls: "weakref.WeakKeyDictionary[pygame.Surface, HullType]" = weakref.WeakKeyDictionary()
+
+# Máscaras barridas por (máscara, desplazamiento en x, en y): acotadas por pasos
+# de rotación y velocidades; las máscaras de origen viven tanto como sus formas
+_swept_masks: Dict[Tuple[pygame.mask.Mask, int, int], Tuple[pygame.mask.Mask, int, int]] = {}
+
+
+def get_mask(image: pygame.Surface) -> pygame.mask.Mask:
+    """Devuelve la máscara de colisión de una imagen, calculándola una sola vez."""
+    mask = _mask_cache.get(image)
+    if mask is None:
+        mask = pygame.mask.from_surface(image)
+        _mask_cache[image] = mask
+    return mask
+
+
+def _solid_pixels(image: pygame.Surface) -> numpy.ndarray:
+    """Coordenadas (x, y) de los centros de píxel sólidos, relativas al centro."""
+    if image.get_flags() & pygame.SRCALPHA:
+        alpha = pygame.surfarray.array_alpha(image)
+        xs, ys = numpy.nonzero(alpha > ALPHA_THRESHOLD)
+    else:
+        width, height = image.get_size()
+        xs, ys = numpy.meshgrid(numpy.arange(width), numpy.arange(height), indexing='ij')
+        xs, ys = xs.ravel(), ys.ravel()
+    if len(xs) == 0:
+        xs, ys = numpy.array([image.get_width() // 2]), numpy.array([image.get_height() // 2])
+    coords = numpy.column_stack([xs, ys]).astype(numpy.float64) + 0.5
+    coords[:, 0] -= image.get_width() / 2
+    coords[:, 1] -= image.get_height() / 2
+    return coords
+
+
+def _convex_hull(points: Union[numpy.ndarray, Sequence[Point]]) -> List[Point]:
+    """Envolvente convexa (cadena monótona de Andrew), en orden antihorario."""
+    if isinstance(points, numpy.ndarray):
+        points = points.tolist()
+    pts = sorted(set(map(tuple, points)))
+    if len(pts) <= 2:
+        return pts
+    
+    def cross(o, a, b):
+        return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+    
+    lower: List[Point] = []
+    for p in pts:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper: List[Point] = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def _simplify_polygon(points: List[Point], max_vertices: int) -> List[Point]:
+    """Quita los vértices que menos área aportan hasta quedar en max_vertices."""
+    points = list(points)
+    while len(points) > max(3, max_vertices):
+        best_index, best_area = 0, float('inf')
+        for i in range(len(points)):
+            ax, ay = points[i - 1]
+            bx, by = points[i]
+            cx, cy = points[(i + 1) % len(points)]
+            area = abs((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+            if area < best_area:
+                best_index, best_area = i, area
+        points.pop(best_index)
+    return points
+
+
+def build_hull(image: pygame.Surface, kind: str, param: Optional[float] = None) -> HullType:
+    """
+    Genera una forma de colisión a partir del canal alfa de una imagen.
+
+    Args:
+        image: Imagen de origen
+        kind: 'circle', 'capsule', 'polygon', 'rect' o 'mask'
+        param: Vértices máximos ('polygon') o factor de reducción ('mask')
+    """
+    if kind == 'mask':
+        return MaskHull(get_mask(image), int(param or 2))
+    
+    coords = _solid_pixels(image)
+    centroid = coords.mean(axis=0)
+    
+    if kind == 'circle':
+        # Radio de área equivalente: ni muy generoso ni muy estricto
+        radius = math.sqrt(len(coords) / math.pi)
+        return Hull('circle', [tuple(centroid)], radius, image.get_size())
+    
+    if kind == 'capsule':
+        centered = coords - centroid
+        # Eje principal de la distribución de píxeles (PCA)
+        _, vectors = numpy.linalg.eigh(numpy.cov(centered.T))
+        axis = vectors[:, -1]
+        along = centered @ axis
+        across = numpy.abs(centered @ numpy.array([-axis[1], axis[0]]))
+        radius = float(numpy.percentile(across, 85))
+        # Segmento central recortado por el radio en cada extremo
+        low, high = float(along.min()) + radius, float(along.max()) - radius
+        if low > high:
+            low = high = (low + high) / 2
+        a = centroid + axis * low
+        b = centroid + axis * high
+        return Hull('capsule', [tuple(a), tuple(b)], radius, image.get_size())
+    
+    if kind == 'rect':
+        x_min, y_min = coords.min(axis=0) - 0.5
+        x_max, y_max = coords.max(axis=0) + 0.5
+        return Hull('rect', [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)], size=image.get_size())
+    
+    if kind == 'polygon':
+        # Esquinas de los píxeles sólidos para que la envolvente no quede corta
+        corners = numpy.concatenate([coords + offset for offset in ((-0.5, -0.5), (0.5, -0.5), (0.5, 0.5), (-0.5, 0.5))])
+        hull = _simplify_polygon(_convex_hull(corners), int(param or 8))
+        return Hull('polygon', hull, size=image.get_size())
+    
+    raise ValueError(f"Tipo de forma de colisión desconocido: {kind}")
+
+
+def register_hull(image: pygame.Surface, spec: Union[str, Tuple[str, float]]) -> HullType:
+    """Genera y registra la forma de colisión de una imagen según su configuración."""
+    kind, param = (spec, None) if isinstance(spec, str) else spec
+    hull = build_hull(image, kind, param)
+    _hulls[image] = hull
+    return hull
+
+
+def get_hull(image: pygame.Surface) -> Optional[HullType]:
+    """Forma registrada para una imagen (None si usa la máscara completa)."""
+    return _hulls.get(image)
+
+
+# ===== GEOMETRÍA =====
+
+def _edges(points: List[Point]):
+    if len(points) == 1:
+        return [(points[0], points[0])]
+    if len(points) == 2:
+        return [(points[0], points[1])]
+    return [(points[i - 1], points[i]) for i in range(len(points))]
+
+
+def collide_hull(sprite_a, sprite_b) -> bool:
+    """
+    Callback de colisión para pygame.sprite.spritecollide.
+    Descarta por rectángulos y prueba las máscaras como
+    pygame.sprite.collide_mask: la de cada entidad es la de su forma registrada
+    al giro actual (ver Entity.orient) o, sin forma, la de la imagen completa.
+    """
+    rect_a = sprite_a.rect
+    rect_b = sprite_b.rect
+    if not rect_a.colliderect(rect_b):
+        return False
+    return sprite_a.mask.overlap(sprite_b.mask, (rect_b.x - rect_a.x, rect_b.y - rect_a.y)) is not None
+
+
+# ===== COLISIÓN CONTINUA (BARRIDO) =====
+
+def _sweep_mask(mask: pygame.mask.Mask, dx: int, dy: int) -> Tuple[pygame.mask.Mask, int, int]:
+    """
+    Máscara que cubre `mask` en todo su recorrido desde (-dx, -dy) hasta su
+    posición; devuelve también su esquina relativa a la de `mask`.
+    """
+    width, height = mask.get_size()
+    swept = pygame.mask.Mask((width + abs(dx), height + abs(dy)))
+    left, top = min(0, -dx), min(0, -dy)
+    # Copias a un píxel como mucho entre sí: el recorrido no deja huecos
+    steps = max(abs(dx), abs(dy))
+    for step in range(steps + 1):
+        back = step / steps
+        swept.draw(mask, (round(-dx * back) - left, round(-dy * back) - top))
+    return swept, left, top
+
+
+def collide_swept(sprite_a, sprite_b) -> bool:
+    """
+    Callback de colisión continua para pygame.sprite.spritecollide.
+    Usa el desplazamiento del frame de cada sprite (`motion`): un movimiento
+    relativo rectilíneo equivale a mover B contra A fija, así que se prueba la
+    máscara de A contra la de B barrida a lo largo de ese recorrido, cacheada
+    por desplazamiento. Es un solo Mask.overlap, como collide_hull; sin
+    movimiento relativo, usa collide_hull.
+    """
+    motion_ax, motion_ay = sprite_a.motion
+    motion_bx, motion_by = sprite_b.motion
+    # Movimiento de B visto desde A (A queda fija en su posición final)
+    dx = motion_bx - motion_ax
+    dy = motion_by - motion_ay
+    if not dx and not dy:
+        return collide_hull(sprite_a, sprite_b)
+    
+    # Descarte por rectángulos: A ampliada con el recorrido de B hacia cualquier lado
+    rect_a = sprite_a.rect
+    rect_b = sprite_b.rect
+    if not rect_a.inflate(2 * abs(dx), 2 * abs(dy)).colliderect(rect_b):
+        return False
+    
+    key = (sprite_b.mask, dx, dy)
+    swept = _swept_masks.get(key)
+    if swept is None:
+        swept = _swept_masks[key] = _sweep_mask(*key)
+    swept_mask, left, top = swept
+    return sprite_a.mask.overlap(swept_mask, (rect_b.x + left - rect_a.x, rect_b.y + top - rect_a.y)) is not None
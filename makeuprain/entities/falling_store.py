@@ -0,0 +1,133 @@
+"""
+Almacén vectorizado de entidades que caen (enemigos y coleccionables).
+Guarda posiciones, velocidades, fases de flotación y rotación en arrays de
+NumPy y las avanza todas en un solo paso, con posiciones en coma flotante.
+"""
+import numpy
+from typing import List, Optional
+from ..config import SCREEN_HEIGHT
+from .collision import ROTATION_STEP
+
+# Tabla de senos por grado entero: evita trigonometría por entidad y frame
+SIN_TABLE = numpy.sin(numpy.radians(numpy.arange(360))).astype(numpy.float32)
+
+# Margen inferior a partir del cual una entidad se elimina
+CULL_MARGIN = 100
+
+
+class FallingStore:
+    """Estructura de arrays (SoA) con el estado de las entidades que caen."""
+    
+    def __init__(self, capacity: int = 64):
+        self.capacity = 0
+        self.x = numpy.zeros(0, dtype=numpy.float32)        # X base (sin flotación)
+        self.y = numpy.zeros(0, dtype=numpy.float32)
+        self.vy = numpy.zeros(0, dtype=numpy.float32)
+        self.angle = numpy.zeros(0, dtype=numpy.float32)
+        self.spin = numpy.zeros(0, dtype=numpy.float32)     # Grados por frame
+        self.turn = numpy.zeros(0, dtype=numpy.int32)       # Paso de rotación de la máscara de colisión
+        self.phase = numpy.zeros(0, dtype=numpy.int32)      # Fase de flotación (grados)
+        self.bob = numpy.zeros(0, dtype=numpy.float32)      # Amplitud de flotación (px)
+        self.alive = numpy.zeros(0, dtype=bool)
+        # Sin giro en los niveles de calidad bajos: se dibuja y colisiona derecho (lo fija la escena)
+        self.rotate = True
+        self.sprites: List[Optional[object]] = []
+        self._free_slots: List[int] = []
+        self._grow(capacity)
+    
+    def _grow(self, capacity: int):
+        """Amplía los arrays conservando el estado actual."""
+        extra = capacity - self.capacity
+        if extra <= 0:
+            return
+        for name in ('x', 'y', 'vy', 'angle', 'spin', 'turn', 'phase', 'bob', 'alive'):
+            array = getattr(self, name)
+            setattr(self, name, numpy.concatenate([array, numpy.zeros(extra, dtype=array.dtype)]))
+        self.sprites.extend([None] * extra)
+        # Los huecos nuevos se usan de menor a mayor índice
+        self._free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+    
+    def add(self, sprite, vy: float, spin: float = 0.0, phase: int = 0, bob: float = 0.0) -> int:
+        """Registra un sprite y devuelve su índice en el almacén."""
+        if not self._free_slots:
+            self._grow(max(16, self.capacity * 2))
+        slot = self._free_slots.pop()
+        phase %= 360
+        self.x[slot] = sprite.rect.x - bob * SIN_TABLE[phase]
+        self.y[slot] = sprite.rect.y
+        self.vy[slot] = vy
+        self.angle[slot] = 0.0
+        self.spin[slot] = spin
+        self.turn[slot] = 0  # Entity.reset deja la máscara sin girar
+        self.phase[slot] = phase
+        self.bob[slot] = bob
+        self.alive[slot] = True
+        self.sprites[slot] = sprite
+        sprite.store = self
+        sprite.slot = slot
+        return slot
+    
+    def remove(self, sprite):
+        """Libera el índice de un sprite (llamado desde Entity.kill)."""
+        slot = sprite.slot
+        if slot is None or self.sprites[slot] is not sprite:
+            return
+        self.alive[slot] = False
+        self.sprites[slot] = None
+        self._free_slots.append(slot)
+        sprite.store = None
+        sprite.slot = None
+    
+    def step(self):
+        """Avanza todas las entidades un frame y elimina las que salieron por abajo."""
+        alive = self.alive
+        self.y += self.vy
+        self.angle += self.spin
+        self.phase += 1
+        self.phase %= 360
+        
+        # Eliminar en bloque las que salieron de la pantalla
+        culled = numpy.flatnonzero(alive & (self.y > SCREEN_HEIGHT + CULL_MARGIN))
+        for slot in culled.tolist():
+            self.sprites[slot].kill()
+        
+        # Sincronizar los rects con las posiciones flotantes (ángulo y fase se
+        # leen del almacén al dibujar, solo para las entidades visibles)
+        slots = numpy.flatnonzero(self.alive)
+        xs = (self.x[slots] + self.bob[slots] * SIN_TABLE[self.phase[slots]]).round().astype(numpy.int32).tolist()
+        ys = self.y[slots].round().astype(numpy.int32).tolist()
+        sprites = self.sprites
+        for slot, x, y in zip(slots.tolist(), xs, ys):
+            sprites[slot].rect.topleft = (x, y)
+        
+        # Girar la máscara de colisión solo de las que cambiaron de paso de rotación
+        if self.rotate:
+            turns = numpy.rint(self.angle[slots] / ROTATION_STEP).astype(numpy.int32)
+        else:
+            turns = numpy.zeros(len(slots), dtype=numpy.int32)
+        changed = turns != self.turn[slots]
+        for slot, turn in zip(slots[changed].tolist(), turns[changed].tolist()):
+            sprites[slot].orient(turn * ROTATION_STEP)
+        self.turn[slots] = turns
+    
+    def get_angle(self, sprite) -> float:
+        """Ángulo de rotación actual de un sprite registrado (0 con el giro desactivado)."""
+        return float(self.angle[sprite.slot]) if self.rotate else 0.0
+    
+    def get_phase(self, sprite) -> int:
+        """Fase de flotación actual de un sprite registrado."""
+        return int(self.phase[sprite.slot])
+    
+    def get_speed(self, sprite) -> float:
+        """Velocidad vertical actual (px/frame) de un sprite registrado."""
+        return float(self.vy[sprite.slot])
+    
+    def set_speed(self, sprite, vy: float):
+        """Cambia la velocidad vertical de un sprite registrado."""
+        self.vy[sprite.slot] = vy
+        sprite.speed = vy
+        sprite.motion = (0, round(vy))
+    
+    def __len__(self) -> int:
+        return int(numpy.count_nonzero(self.alive))
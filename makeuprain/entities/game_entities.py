@@ -3,12 +3,17 @@ Entidades base del juego.
 Define clases para el jugador, enemigos y coleccionables.
 """
 import pygame
+import math
 import random
+from functools import lru_cache
 from typing import Tuple, Optional
 from ..config import (
     PlayerConfig, EnemyConfig, CollectibleConfig,
     SCREEN_WIDTH, SCREEN_HEIGHT, Colors
 )
+from ..core.input import Action
+from ..core.clock import GameClock
+from .collision import get_mask, get_hull
 
 
 class Entity(pygame.sprite.Sprite):
@@ -16,21 +21,50 @@ class Entity(pygame.sprite.Sprite):
     
     def __init__(self, x: float, y: float, image: pygame.Surface):
         super().__init__()
+        self.speed = 0.0
+        # Desplazamiento (dx, dy) en píxeles enteros del último frame (colisión continua)
+        self.motion = (0, 0)
+        self.pool = None  # EntityPool al que vuelve la entidad al morir
+        self.in_pool = False
+        self.store = None  # FallingStore que mueve la entidad (si lo hay)
+        self.slot = None
+        Entity.reset(self, x, y, image)
+    
+    def reset(self, x: float, y: float, image: pygame.Surface):
+        """Reinicia posición e imagen para reutilizar la instancia."""
         self.image = image
         self.rect = self.image.get_rect()
         self.rect.x = x
         self.rect.y = y
-        self.speed = 0.0
-        # Crear máscara para colisiones precisas
-        self.mask = pygame.mask.from_surface(self.image)
+        # Forma de colisión simplificada (None = usar la máscara de la imagen)
+        self.hull = get_hull(self.image)
+        # Máscara compartida para colisiones precisas: la de la forma, si la hay
+        self.mask = self.hull.mask_at(0.0) if self.hull is not None else get_mask(self.image)
+    
+    def orient(self, angle: float):
+        """Gira la máscara de colisión (la llama FallingStore al cambiar de paso de rotación)."""
+        if self.hull is not None:
+            self.mask = self.hull.mask_at(angle)
+    
+    def get_angle(self) -> float:
+        """Ángulo de rotación visual (grados) usado por las colisiones."""
+        return 0.0
+    
+    def kill(self):
+        """Elimina la entidad de sus grupos, de su almacén y la devuelve a su pool."""
+        super().kill()
+        if self.store is not None:
+            self.store.remove(self)
+        if self.pool is not None:
+            self.pool.release(self)
         
     def update(self):
         """Actualiza la entidad cada frame."""
         pass
     
-    def draw(self, surface: pygame.Surface):
-        """Dibuja la entidad en la superficie."""
-        surface.blit(self.image, self.rect)
+    def render(self, renderer):
+        """Envía la entidad al backend de dibujo."""
+        renderer.blit(self.image, self.rect)
 
 
 class Player(Entity):
@@ -41,70 +75,78 @@ class Player(Entity):
         x: float, 
         y: float, 
         image: pygame.Surface, 
+        clock: GameClock,
         player_id: int = 1,
-        controls_left: list = None,
-        controls_right: list = None,
         tint_color: Tuple[int, int, int] = None
     ):
         super().__init__(x, y, image)
+        self.clock = clock  # Reloj de la simulación (mide la invulnerabilidad)
         self.player_id = player_id
         self.speed = PlayerConfig.SPEED
+        self.prev_x = self.rect.x  # Posición al empezar el frame (colisión continua)
         self.lives = PlayerConfig.START_LIVES
         self.invulnerable = False
-        self.invulnerable_timer = 0
+        self.invulnerable_until = 0.0  # Tiempo simulado en que termina la invulnerabilidad
         self.alpha = 255
         self.score = 0  # Score individual para coop
         self.dying = False  # Animación de muerte activa
         self.death_timer = 0  # Frames de animación de muerte
         
-        # Controles personalizables
-        self.controls_left = controls_left or PlayerConfig.PLAYER1_LEFT
-        self.controls_right = controls_right or PlayerConfig.PLAYER1_RIGHT
+        # Bits de acción que mueven a este jugador (las teclas están en InputConfig.KEYMAP)
+        self.action_left, self.action_right = Action.PLAYER_MOVES[player_id - 1]
         
         # Color distintivo
         self.tint_color = tint_color
         if self.tint_color:
             self.image = self._apply_tint(image.copy(), self.tint_color)
-            # Actualizar máscara tras aplicar tinte
-            self.mask = pygame.mask.from_surface(self.image)
+            # Actualizar máscara tras aplicar tinte (la forma registrada no cambia)
+            if self.hull is None:
+                self.mask = get_mask(self.image)
         
     def _apply_tint(self, surface: pygame.Surface, color: Tuple[int, int, int]) -> pygame.Surface:
         """Aplica un tinte de color a la imagen del jugador."""
         tinted = surface.copy()
         # Crear overlay con el color deseado
-        overlay = pygame.Surface(surface.get_size()).convert_alpha()
+        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
         overlay.fill(color)
         # Usar BLEND_RGBA_MULT para aplicar el color solo donde hay píxeles
         tinted.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
         return tinted
         
-    def update(self):
-        """Actualiza el jugador basado en input."""
+    def update(self, actions: int = 0):
+        """
+        Actualiza el jugador basado en input.
+
+        Args:
+            actions: Máscara de acciones mantenidas en este frame (ver core.input.Action)
+        """
+        self.prev_x = self.rect.x
+        
         # Si está muriendo, solo actualizar timer
         if self.dying:
             self.death_timer += 1
+            self.motion = (0, 0)
             return
         
-        keys = pygame.key.get_pressed()
-        
-        # Movimiento con controles personalizados
-        if any(keys[k] for k in self.controls_left):
+        # Movimiento según las acciones del jugador
+        if actions & self.action_left:
             self.rect.x -= self.speed
-        if any(keys[k] for k in self.controls_right):
+        if actions & self.action_right:
             self.rect.x += self.speed
         
         # Mantener dentro de la pantalla
         self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
+        self.motion = (self.rect.x - self.prev_x, 0)
         
         # Actualizar invulnerabilidad
         if self.invulnerable:
-            self.invulnerable_timer -= 1
-            if self.invulnerable_timer <= 0:
+            remaining = self.invulnerable_until - self.clock.now()
+            if remaining <= 0:
                 self.invulnerable = False
                 self.alpha = 255
             else:
                 # Efecto de parpadeo
-                self.alpha = 128 if (self.invulnerable_timer // 5) % 2 == 0 else 255
+                self.alpha = 128 if int(remaining / PlayerConfig.BLINK_INTERVAL) % 2 == 0 else 255
     
     def take_damage(self):
         """El jugador recibe daño."""
@@ -114,7 +156,7 @@ class Player(Entity):
                 self.start_death_animation()
             else:
                 self.invulnerable = True
-                self.invulnerable_timer = PlayerConfig.INVULNERABILITY_TIME // (1000 / 60)
+                self.invulnerable_until = self.clock.now() + PlayerConfig.INVULNERABILITY_TIME / 1000
             return True
         return False
     
@@ -127,7 +169,7 @@ class Player(Entity):
         """Retorna True si el jugador está muerto y la animación terminó."""
         return self.dying and self.death_timer > 30  # ~0.5s de animación
     
-    def draw(self, surface: pygame.Surface):
+    def render(self, renderer):
         """Dibuja el jugador con efecto de transparencia si está invulnerable."""
         # No dibujar si ya murió completamente
         if self.is_dead():
@@ -135,79 +177,102 @@ class Player(Entity):
         
         # Fade out durante la muerte
         if self.dying:
-            fade_alpha = int(255 * (1 - self.death_timer / 30))
-            temp_image = self.image.copy()
-            temp_image.set_alpha(fade_alpha)
-            surface.blit(temp_image, self.rect)
-        elif self.alpha < 255:
-            temp_image = self.image.copy()
-            temp_image.set_alpha(self.alpha)
-            surface.blit(temp_image, self.rect)
+            renderer.blit(self.image, self.rect, int(255 * (1 - self.death_timer / 30)))
         else:
-            surface.blit(self.image, self.rect)
+            renderer.blit(self.image, self.rect, self.alpha)
 
 
 class Enemy(Entity):
     """Enemigo que cae desde arriba."""
     
-    def __init__(self, x: float, y: float, image: pygame.Surface, speed: float):
+    def __init__(self, x: float, y: float, image: pygame.Surface, speed: float, spin: Optional[float] = None):
         super().__init__(x, y, image)
+        self._reset_motion(speed, spin)
+    
+    def reset(self, x: float, y: float, image: pygame.Surface, speed: float, spin: Optional[float] = None):
+        """Reutiliza la instancia desde el pool con nuevos parámetros."""
+        super().reset(x, y, image)
+        self._reset_motion(speed, spin)
+    
+    def _reset_motion(self, speed: float, spin: Optional[float]):
         self.speed = speed
-        self.rotation = random.uniform(-2, 2)  # Rotación sutil
+        self.motion = (0, round(speed))  # Caída vertical de cada frame
+        # Rotación sutil (la fija la línea de tiempo de apariciones, si no al azar)
+        self.rotation = random.uniform(-2, 2) if spin is None else spin
         self.angle = 0
+        self.pos_y = float(self.rect.y)  # Posición con precisión subpíxel
         
     def update(self):
-        """Mueve el enemigo hacia abajo."""
-        self.rect.y += self.speed
+        """Mueve el enemigo hacia abajo (sin FallingStore)."""
+        self.pos_y += self.speed
+        self.rect.y = self.pos_y
         self.angle += self.rotation
+        self.orient(self.angle)
         
         # Eliminar si sale de la pantalla
         if self.rect.y > SCREEN_HEIGHT + 100:
             self.kill()
     
-    def draw(self, surface: pygame.Surface):
+    def get_angle(self) -> float:
+        """Ángulo actual (leído del almacén vectorizado si lo hay)."""
+        return self.store.get_angle(self) if self.store is not None else self.angle
+    
+    def render(self, renderer):
         """Dibuja el enemigo con rotación."""
-        if abs(self.angle) > 0.1:
-            rotated = pygame.transform.rotate(self.image, self.angle)
-            rotated_rect = rotated.get_rect(center=self.rect.center)
-            surface.blit(rotated, rotated_rect)
+        angle = self.get_angle()
+        if abs(angle) > 0.1:
+            renderer.blit_rotated(self.image, self.rect.center, angle)
         else:
-            surface.blit(self.image, self.rect)
+            renderer.blit(self.image, self.rect)
 
 
 class Collectible(Entity):
     """Item coleccionable (makeup)."""
     
-    def __init__(self, x: float, y: float, image: pygame.Surface, speed: float):
+    def __init__(self, x: float, y: float, image: pygame.Surface, speed: float, phase: Optional[float] = None):
         super().__init__(x, y, image)
+        self._reset_motion(speed, phase)
+    
+    def reset(self, x: float, y: float, image: pygame.Surface, speed: float, phase: Optional[float] = None):
+        """Reutiliza la instancia desde el pool con nuevos parámetros."""
+        super().reset(x, y, image)
+        self._reset_motion(speed, phase)
+    
+    def _reset_motion(self, speed: float, phase: Optional[float]):
         self.speed = speed
-        self.bob_offset = random.uniform(0, 6.28)  # Offset para animación
-        self.bob_counter = 0
+        self.motion = (0, round(speed))  # Caída vertical (la flotación lateral es despreciable)
+        # Fase de flotación en grados (la fija la línea de tiempo de apariciones, si no al azar)
+        self.phase = random.randrange(360) if phase is None else int(phase)
+        # X central de la oscilación, de modo que la posición inicial no salte
+        self.base_x = self.rect.x - CollectibleConfig.BOB_AMPLITUDE * math.sin(math.radians(self.phase))
+        self.pos_y = float(self.rect.y)
         
     def update(self):
-        """Mueve el coleccionable con animación de flotación."""
-        self.rect.y += self.speed
+        """Mueve el coleccionable con animación de flotación (sin FallingStore)."""
+        self.pos_y += self.speed
+        self.rect.y = self.pos_y
         
         # Animación de "flotación" sutil
-        self.bob_counter += 0.1
-        bob_x = pygame.math.Vector2(2 * pygame.math.Vector2(1, 0).rotate(
-            (self.bob_counter + self.bob_offset) * 10
-        ).x, 0)
-        self.rect.x += bob_x.x * 0.3
+        self.phase = (self.phase + 1) % 360
+        self.rect.x = self.base_x + CollectibleConfig.BOB_AMPLITUDE * math.sin(math.radians(self.phase))
         
         # Eliminar si sale de la pantalla
         if self.rect.y > SCREEN_HEIGHT + 100:
             self.kill()
     
-    def draw(self, surface: pygame.Surface):
+    def render(self, renderer):
         """Dibuja el coleccionable con brillo sutil."""
         # Efecto de pulso muy sutil
-        pulse = abs(pygame.math.Vector2(1, 0).rotate(self.bob_counter * 50).y)
-        alpha = int(255 - pulse * 30)
-        
-        temp_image = self.image.copy()
-        temp_image.set_alpha(alpha)
-        surface.blit(temp_image, self.rect)
+        phase = self.store.get_phase(self) if self.store is not None else self.phase
+        pulse = abs(math.sin(math.radians(phase * 5)))
+        renderer.blit(self.image, self.rect, int(255 - pulse * 30))
+
+
+@lru_cache(maxsize=128)
+def _particle_disc(size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+    surface = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, color, (size, size), size)
+    return surface
 
 
 class Particle:
@@ -236,17 +301,14 @@ class Particle:
         self.vy += 0.2  # Gravedad
         self.lifetime -= 1
         
-    def draw(self, surface: pygame.Surface):
+    def render(self, renderer):
         """Dibuja la partícula con fade out."""
         if self.lifetime > 0:
             alpha = int(255 * (self.lifetime / self.max_lifetime))
-            color = (*self.color, alpha)
             size = int(self.size * (self.lifetime / self.max_lifetime))
             if size > 0:
-                # Crear superficie temporal con transparencia
-                particle_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                pygame.draw.circle(particle_surf, color, (size, size), size)
-                surface.blit(particle_surf, (int(self.x) - size, int(self.y) - size))
+                # Círculo compartido por tamaño y color; el fade es la transparencia del blit
+                renderer.blit(_particle_disc(size, tuple(self.color)), (int(self.x) - size, int(self.y) - size), alpha)
     
     def is_dead(self) -> bool:
         """Verifica si la partícula debe ser eliminada."""
@@ -0,0 +1,54 @@
+"""
+Pools de entidades reutilizables.
+Evita crear y destruir sprites en ráfagas (por ejemplo al inicio de cada ronda).
+"""
+import pygame
+from typing import List, Type
+
+
+class EntityPool:
+    """Lista libre de entidades de un mismo tipo que se reinician en el sitio."""
+    
+    def __init__(self, entity_class: Type):
+        self.entity_class = entity_class
+        self._free: List = []
+        self.created = 0
+        self.reused = 0
+    
+    def acquire(self, x: float, y: float, image: pygame.Surface, speed: float, *args):
+        """Devuelve una entidad lista para usar (reciclada si hay alguna libre)."""
+        if self._free:
+            entity = self._free.pop()
+            entity.reset(x, y, image, speed, *args)
+            self.reused += 1
+        else:
+            entity = self.entity_class(x, y, image, speed, *args)
+            entity.pool = self
+            self.created += 1
+        entity.in_pool = False
+        return entity
+    
+    def release(self, entity):
+        """Devuelve una entidad al pool (ignorado si ya estaba libre)."""
+        if entity.in_pool:
+            return
+        entity.in_pool = True
+        self._free.append(entity)
+    
+    def release_group(self, group: pygame.sprite.Group):
+        """Vacía un grupo devolviendo todas sus entidades al pool."""
+        for entity in group.sprites():
+            entity.kill()
+    
+    def prewarm(self, count: int, image: pygame.Surface):
+        """Crea entidades por adelantado para evitar asignaciones en pleno juego."""
+        for _ in range(count - len(self._free)):
+            entity = self.entity_class(0, 0, image, 0.0)
+            entity.pool = self
+            self.created += 1
+            self.release(entity)
+    
+    @property
+    def free_count(self) -> int:
+        """Cantidad de entidades disponibles para reutilizar."""
+        return len(self._free)
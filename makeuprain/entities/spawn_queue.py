@@ -0,0 +1,68 @@
+"""
+Cola de activación diferida para entidades generadas fuera de pantalla.
+Las entidades que nacen muy por encima del viewport no se crean hasta el
+frame en que están a punto de aparecer; mientras tanto solo ocupan una
+entrada en un heap ordenado por frame de entrada.
+"""
+import heapq
+import math
+from typing import Dict, List, Optional, Tuple
+
+
+class PendingSpawnQueue:
+    """Heap de apariciones pendientes: (frame, orden, tipo, x, y, velocidad, extra)."""
+    
+    def __init__(self):
+        self._heap: List[Tuple[int, int, str, float, float, float, Optional[float]]] = []
+        self._counter = 0
+        self._counts: Dict[str, int] = {}
+    
+    def push(
+        self, kind: str, x: float, y: float, speed: float, frame: int, entry_y: float,
+        extra: Optional[float] = None
+    ) -> bool:
+        """
+        Encola una entidad si todavía está por encima de entry_y.
+
+        Args:
+            kind: Tipo de entidad ('enemy', 'collectible', ...)
+            x, y: Posición de aparición original
+            speed: Velocidad vertical en px/frame
+            frame: Frame actual
+            entry_y: Y a partir de la cual la entidad debe estar activa
+            extra: Dato propio del tipo (giro o fase) que se devuelve al activarla
+
+        Returns:
+            True si se encoló, False si debe crearse ya.
+        """
+        if y >= entry_y or speed <= 0:
+            return False
+        frames_until_entry = math.ceil((entry_y - y) / speed)
+        # Posición que tendría al llegar ese frame si se hubiera movido desde ya
+        activation_y = y + frames_until_entry * speed
+        self._counter += 1
+        heapq.heappush(self._heap, (frame + frames_until_entry, self._counter, kind, x, activation_y, speed, extra))
+        self._counts[kind] = self._counts.get(kind, 0) + 1
+        return True
+    
+    def pop_due(self, frame: int) -> List[Tuple[str, float, float, float, Optional[float]]]:
+        """Extrae las entidades cuyo frame de entrada ya llegó: (tipo, x, y, velocidad, extra)."""
+        due = []
+        heap = self._heap
+        while heap and heap[0][0] <= frame:
+            _, _, kind, x, y, speed, extra = heapq.heappop(heap)
+            self._counts[kind] -= 1
+            due.append((kind, x, y, speed, extra))
+        return due
+    
+    def count(self, kind: str) -> int:
+        """Cantidad de entidades pendientes de un tipo."""
+        return self._counts.get(kind, 0)
+    
+    def clear(self):
+        """Descarta todas las apariciones pendientes."""
+        self._heap.clear()
+        self._counts.clear()
+    
+    def __len__(self) -> int:
+        return len(self._heap)
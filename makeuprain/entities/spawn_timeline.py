@@ -0,0 +1,267 @@
+"""
+Línea de tiempo de apariciones por ronda.
+Al empezar cada ronda se generan de una vez, con un generador con semilla,
+las apariciones (frame, x, y, velocidad, giro o fase) en arrays ordenados por
+frame; en cada frame solo avanza un cursor. Cada tipo tiene tres pistas:
+- opening: la tanda inicial de la ronda (la reparte una tarea, ver GameScene)
+- stream: el goteo continuo, limitado por el tope en pantalla de la ronda
+- waves: las oleadas diseñadas (SpawnConfig.PATTERNS), sin tope
+El goteo y las oleadas se generan por bloques de SpawnConfig.CHUNK_SECONDS
+con una semilla propia por bloque: la misma semilla y ronda dan siempre la
+misma línea de tiempo, se amplíe cuando se amplíe.
+
+Para revisarla sin abrir el juego (equilibrado de rondas):
+
+    python -m makeuprain.entities.spawn_timeline --round 3 --seed 42 [--seconds 60] [--csv rondas.csv]
+"""
+import argparse
+import csv
+import sys
+from typing import Dict, List, Optional, Tuple
+
+import numpy
+
+from ..config import (
+    FPS, SCREEN_WIDTH, EnemyConfig, CollectibleConfig, SpawnConfig
+)
+
+KINDS = ('enemy', 'collectible')
+
+# Una aparición: frame relativo al inicio de la ronda, posición, velocidad en
+# px/frame y giro (enemigos, grados/frame) o fase de flotación (coleccionables)
+EVENT_DTYPE = numpy.dtype([
+    ('frame', numpy.int32), ('x', numpy.float32), ('y', numpy.float32),
+    ('speed', numpy.float32), ('extra', numpy.float32),
+])
+
+# Rango de aparición por tipo: (y más alta, velocidad mínima, velocidad máxima)
+SPAWN_RANGES = {
+    'enemy': (-500, EnemyConfig.SPEED_MIN, EnemyConfig.SPEED_MAX),
+    'collectible': (-800, CollectibleConfig.SPEED_MIN, CollectibleConfig.SPEED_MAX),
+}
+
+
+class SpawnTrack:
+    """Apariciones de un tipo ordenadas por frame, consumidas con un cursor."""
+    
+    def __init__(self, kind: str, events: Optional[numpy.ndarray] = None):
+        self.kind = kind
+        self.events = numpy.zeros(0, EVENT_DTYPE)
+        self.frames: List[int] = []
+        self.cursor = 0
+        if events is not None:
+            self.append(events)
+    
+    def append(self, events: numpy.ndarray):
+        """Añade apariciones (en cualquier orden), descartando las ya consumidas."""
+        events = numpy.concatenate((self.events[self.cursor:], events))
+        # Estable: a igual frame se conserva el orden de generación
+        self.events = events[numpy.argsort(events['frame'], kind='stable')]
+        self.frames = self.events['frame'].tolist()
+        self.cursor = 0
+    
+    def take(self, frame: int, room: int = -1) -> list:
+        """
+        Apariciones que tocan hasta `frame` (tuplas de EVENT_DTYPE).
+
+        Args:
+            frame: Frame actual relativo al inicio de la ronda
+            room: Cuántas caben (-1 = sin límite). Si no caben todas se quedan
+                las más recientes; sin sitio, la última vencida espera y las
+                anteriores se descartan (como el spawn por intervalo con tope).
+        """
+        start = end = self.cursor
+        frames = self.frames
+        count = len(frames)
+        while end < count and frames[end] <= frame:
+            end += 1
+        if end == start:
+            return []
+        if 0 <= room < end - start:
+            if room == 0:
+                self.cursor = end - 1
+                return []
+            start = end - room
+        self.cursor = end
+        return self.events[start:end].tolist()
+    
+    def take_next(self, count: int) -> list:
+        """Las `count` apariciones siguientes sin mirar el frame (tanda inicial)."""
+        start = self.cursor
+        self.cursor = min(start + count, len(self.frames))
+        return self.events[start:self.cursor].tolist()
+    
+    @property
+    def remaining(self) -> int:
+        """Apariciones aún sin consumir."""
+        return len(self.frames) - self.cursor
+    
+    @property
+    def last_frame(self) -> int:
+        """Frame de la última aparición generada (-1 si no hay ninguna)."""
+        return self.frames[-1] if self.frames else -1
+
+
+class SpawnTimeline:
+    """Apariciones precalculadas de una ronda, ampliadas por bloques bajo demanda."""
+    
+    def __init__(self, params, seed: int, sizes: Dict[str, Tuple[int, int]]):
+        """
+        Args:
+            params: RoundParams de la ronda (core.round_table)
+            seed: Semilla de la partida
+            sizes: Tamaño (ancho, alto) de la imagen de cada tipo
+        """
+        self.params = params
+        self.seed = seed
+        self.sizes = sizes
+        self.chunk_frames = max(1, int(SpawnConfig.CHUNK_SECONDS * FPS))
+        self.horizon = 0  # Frames ya generados para el goteo y las oleadas
+        self.chunks = 0
+        self.opening = {
+            kind: SpawnTrack(kind, self._opening(kind, index)) for index, kind in enumerate(KINDS)
+        }
+        self.stream = {kind: SpawnTrack(kind) for kind in KINDS}
+        self.waves = {kind: SpawnTrack(kind) for kind in KINDS}
+        self.extend()
+    
+    def _rng(self, *stream: int) -> numpy.random.Generator:
+        # Semilla independiente por ronda, bloque y tipo: reproducible en cualquier orden
+        return numpy.random.default_rng([self.seed, self.params.number, *stream])
+    
+    def _random_events(self, kind: str, rng: numpy.random.Generator, frames: numpy.ndarray) -> numpy.ndarray:
+        """Apariciones al azar (carril, altura, velocidad, giro o fase) en los frames dados."""
+        width, height = self.sizes[kind]
+        top, speed_min, speed_max = SPAWN_RANGES[kind]
+        count = len(frames)
+        events = numpy.zeros(count, EVENT_DTYPE)
+        events['frame'] = frames
+        events['x'] = rng.integers(0, max(1, SCREEN_WIDTH - width + 1), count)
+        events['y'] = rng.integers(top, max(top, -height) + 1, count)
+        events['speed'] = rng.uniform(speed_min, speed_max, count) * self.params.speed_multiplier
+        if kind == 'enemy':
+            events['extra'] = rng.uniform(-2, 2, count)
+        else:
+            events['extra'] = rng.integers(0, 360, count)
+        return events
+    
+    def _opening(self, kind: str, index: int) -> numpy.ndarray:
+        count = self.params.enemy_count if kind == 'enemy' else self.params.collectible_count
+        return self._random_events(kind, self._rng(0, index), numpy.zeros(count, numpy.int32))
+    
+    def extend(self):
+        """Genera el siguiente bloque de goteo y oleadas."""
+        start, end = self.horizon, self.horizon + self.chunk_frames
+        self.chunks += 1
+        for index, kind in enumerate(KINDS):
+            interval = self.params.enemy_spawn_frames if kind == 'enemy' else self.params.collectible_spawn_frames
+            # Primer múltiplo del intervalo dentro del bloque (el frame 0 es la tanda inicial)
+            first = max(interval, -(-start // interval) * interval)
+            frames = numpy.arange(first, end, interval, dtype=numpy.int32)
+            self.stream[kind].append(self._random_events(kind, self._rng(self.chunks, index), frames))
+            self.waves[kind].append(self._wave_events(kind, start, end))
+        self.horizon = end
+    
+    def _wave_events(self, kind: str, start: int, end: int) -> numpy.ndarray:
+        """Apariciones de las oleadas de la ronda que empiezan en [start, end)."""
+        width, height = self.sizes[kind]
+        _, speed_min, speed_max = SPAWN_RANGES[kind]
+        base_speed = (speed_min + speed_max) / 2 * self.params.speed_multiplier
+        chunks = []
+        for at, name, every in self.params.waves:
+            pattern = SpawnConfig.PATTERNS[name]
+            if pattern['kind'] != kind:
+                continue
+            first = int(at * FPS)
+            step = int(every * FPS)
+            if step > 0:
+                occurrences = range(first + max(0, -(-(start - first) // step)) * step, end, step)
+            else:
+                occurrences = [first] if start <= first < end else []
+            lanes = numpy.asarray(pattern['lanes'], numpy.float32)
+            delays = numpy.broadcast_to(numpy.asarray(pattern['delays'], numpy.int32), lanes.shape)
+            for frame in occurrences:
+                events = numpy.zeros(len(lanes), EVENT_DTYPE)
+                events['frame'] = frame + delays
+                events['x'] = lanes * (SCREEN_WIDTH - width)
+                events['y'] = -height  # Justo encima de la pantalla: entran juntas
+                events['speed'] = base_speed * pattern['speed']
+                if kind == 'collectible':
+                    events['extra'] = numpy.arange(len(lanes)) * 30  # Flotación desfasada por carril
+                chunks.append(events)
+        return numpy.concatenate(chunks) if chunks else numpy.zeros(0, EVENT_DTYPE)
+    
+    def ensure(self, frame: int):
+        """Amplía la línea de tiempo si el frame se acerca al final de lo generado."""
+        while frame >= self.horizon - self.chunk_frames // 2:
+            self.extend()
+    
+    def events(self, track: str, kind: str) -> numpy.ndarray:
+        """Apariciones pendientes de una pista ('opening', 'stream' o 'waves') y tipo."""
+        spawn_track = getattr(self, track)[kind]
+        return spawn_track.events[spawn_track.cursor:]
+
+
+def _asset_sizes() -> Dict[str, Tuple[int, int]]:
+    """Tamaño de las imágenes del juego sin abrir ventana."""
+    import os
+    import pygame
+    from ..config import IMAGES_DIR, ASSET_PATHS
+    sizes = {}
+    for kind in KINDS:
+        path = os.path.join(IMAGES_DIR, ASSET_PATHS[kind])
+        sizes[kind] = pygame.image.load(path).get_size() if os.path.exists(path) else (40, 40)
+    return sizes
+
+
+def main(argv: Optional[List[str]] = None):
+    """Muestra (o exporta a CSV) la línea de tiempo de una ronda."""
+    from ..core.round_table import load_round_table
+    
+    parser = argparse.ArgumentParser(description='Línea de tiempo de apariciones de una ronda')
+    parser.add_argument('--round', type=int, default=1, help='Número de ronda')
+    parser.add_argument('--seed', type=int, default=0, help='Semilla de la partida')
+    parser.add_argument('--seconds', type=float, default=60.0, help='Segundos de juego a mostrar')
+    parser.add_argument('--csv', help='Exportar todas las apariciones a este archivo')
+    args = parser.parse_args(argv)
+    
+    params = load_round_table().get(args.round)
+    timeline = SpawnTimeline(params, args.seed, _asset_sizes())
+    limit = int(args.seconds * FPS)
+    timeline.ensure(limit)
+    
+    print(params)
+    rows = []
+    for track in ('opening', 'stream', 'waves'):
+        for kind in KINDS:
+            events = timeline.events(track, kind)
+            events = events[events['frame'] < limit]
+            rows.extend((track, kind, *event) for event in events.tolist())
+            if len(events):
+                print(
+                    f"{track:<8}{kind:<12}{len(events):>5} apariciones  "
+                    f"velocidad {events['speed'].min():.2f}-{events['speed'].max():.2f}  "
+                    f"x {events['x'].min():.0f}-{events['x'].max():.0f}"
+                )
+    
+    # Apariciones por cada 10 s (sin contar la tanda inicial)
+    print(f"\n{'segundo':<10}{'enemigos':>10}{'items':>10}")
+    for second in range(0, int(args.seconds), 10):
+        window = (second * FPS, (second + 10) * FPS)
+        counts = [
+            sum(1 for track, row_kind, frame, *_ in rows
+                if track != 'opening' and row_kind == kind and window[0] <= frame < window[1])
+            for kind in KINDS
+        ]
+        print(f"{second:<10}{counts[0]:>10}{counts[1]:>10}")
+    
+    if args.csv:
+        with open(args.csv, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(('track', 'kind') + EVENT_DTYPE.names)
+            writer.writerows(rows)
+        print(f"\n{len(rows)} apariciones escritas en {args.csv}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
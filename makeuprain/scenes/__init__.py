@@ -1,14 +1,31 @@
 """
 __init__.py para el paquete scenes.
+Las escenas se importan de forma diferida para acelerar el arranque.
 """
-from .base_scene import Scene
-from .menu_scene import MenuScene
-from .game_scene import GameScene
-from .gameover_scene import GameOverScene
+import importlib
+
+_SCENE_MODULES = {
+    'Scene': '.base_scene',
+    'MenuScene': '.menu_scene',
+    'GameScene': '.game_scene',
+    'RemoteGameScene': '.remote_game_scene',
+    'GameOverScene': '.gameover_scene',
+}
+
+
+def __getattr__(name):
+    module_name = _SCENE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     'Scene',
     'MenuScene',
     'GameScene',
+    'RemoteGameScene',
     'GameOverScene'
 ]
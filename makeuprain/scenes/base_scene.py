@@ -3,18 +3,26 @@ Clase base para todas las escenas del juego.
 """
 import pygame
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Optional, Tuple
+from ..config import IdleConfig
+from ..core.renderer import SurfaceRenderer
 
 
 class Scene(ABC):
     """Clase abstracta base para escenas."""
     
+    # Eventos opcionales (ratón, KEYUP, ejes de mando...) que la escena necesita;
+    # el resto se bloquea mientras está activa (ver core.input.InputSystem)
+    EVENT_TYPES: Tuple[int, ...] = ()
+    
     def __init__(self, game_manager):
         self.game_manager = game_manager
         self.next_scene: Optional[str] = None
         self.transition_alpha = 0
         self.transitioning_out = False
-        
+        self._transition_overlay: Optional[pygame.Surface] = None
+        self._surface_renderer: Optional[SurfaceRenderer] = None
+    
     @abstractmethod
     def handle_events(self, events: list):
         """Maneja eventos de pygame."""
@@ -30,6 +38,19 @@ class Scene(ABC):
         """Dibuja la escena."""
         pass
     
+    def render(self, renderer):
+        """
+        Envía la escena al backend de dibujo. Por defecto dibuja libremente
+        sobre su lienzo; las escenas con muchos sprites envían cada uno.
+        """
+        self.draw(renderer.canvas())
+    
+    def surface_renderer(self, screen: pygame.Surface) -> SurfaceRenderer:
+        """Backend que dibuja sobre `screen` (para implementar draw() con render())."""
+        if self._surface_renderer is None or self._surface_renderer.surface is not screen:
+            self._surface_renderer = SurfaceRenderer(screen)
+        return self._surface_renderer
+    
     def on_enter(self):
         """Llamado cuando la escena se vuelve activa."""
         self.transition_alpha = 255
@@ -40,6 +61,43 @@ class Scene(ABC):
         """Llamado cuando la escena va a ser reemplazada."""
         pass
     
+    def on_focus_lost(self):
+        """Llamado cuando la ventana pierde el foco."""
+        pass
+    
+    def in_gameplay(self) -> bool:
+        """True mientras se juega: las tareas en segundo plano no pueden pasarse del presupuesto."""
+        return False
+    
+    def is_static(self) -> bool:
+        """
+        True si la escena no cambiará hasta el próximo evento; el bucle principal
+        puede entonces bloquearse esperándolo (ver IdleConfig).
+        """
+        return False
+    
+    def metrics(self) -> list:
+        """
+        Valores en vivo de la escena para el servidor de métricas: tuplas
+        (nombre, etiquetas, valor). Se llama desde otro hilo: solo lecturas.
+        """
+        return []
+    
+    def transition_idle(self) -> bool:
+        """True si no hay ningún fundido en curso."""
+        return self.transition_alpha <= 0 and not self.transitioning_out
+    
+    def ambient_active(self) -> bool:
+        """Las animaciones decorativas siguen mientras haya actividad reciente del usuario."""
+        return self.game_manager.idle_seconds() < IdleConfig.AMBIENT_TIMEOUT_S
+    
+    def run_coroutine(self, coroutine, name: Optional[str] = None):
+        """
+        Programa una corrutina (p. ej. E/S no bloqueante) sin detener el juego.
+        Devuelve la asyncio.Task, que se puede cancelar al salir de la escena.
+        """
+        return self.game_manager.create_task(coroutine, name)
+    
     def start_transition(self, next_scene: str):
         """Inicia transición a otra escena."""
         self.next_scene = next_scene
@@ -59,7 +117,14 @@ class Scene(ABC):
     def draw_transition(self, screen: pygame.Surface):
         """Dibuja el overlay de transición."""
         if self.transition_alpha > 0:
-            overlay = pygame.Surface(screen.get_size())
-            overlay.fill((0, 0, 0))
+            overlay = self._transition_overlay
+            if overlay is None or overlay.get_size() != screen.get_size():
+                overlay = self._transition_overlay = pygame.Surface(screen.get_size())
+                overlay.fill((0, 0, 0))
             overlay.set_alpha(self.transition_alpha)
             screen.blit(overlay, (0, 0))
+    
+    def render_transition(self, renderer):
+        """Envía el overlay de transición al backend de dibujo."""
+        if self.transition_alpha > 0:
+            renderer.fill((0, 0, 0, min(255, self.transition_alpha)))
@@ -3,17 +3,25 @@ Escena principal del juego.
 """
 import pygame
 import random
-from typing import List
+from typing import List, Optional
 from .base_scene import Scene
 from ..config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, Colors,
     EnemyConfig, CollectibleConfig, GameConfig, ASSET_PATHS,
-    PlayerConfig, RoundConfig
+    PlayerConfig, RoundConfig, CollisionConfig, StarfieldConfig, JobConfig, IdleConfig, SpawnConfig
 )
-from ..entities import Player, Enemy, Collectible, Particle, create_particle_burst
-from ..ui import Panel, ProgressBar
+from ..entities import (
+    Player, Enemy, Collectible, Particle, create_particle_burst, EntityPool, FallingStore, PendingSpawnQueue,
+    register_hull, collide_hull, collide_swept
+)
+from ..entities.spawn_timeline import SpawnTimeline
+from ..ui import Panel, ProgressBar, Starfield
 from ..utils import asset_manager, draw_text_with_shadow, create_gradient_surface
 from ..core.round_manager import RoundManager
+from ..core.jobs import JobPriority
+from ..core.input import Action
+from ..core.renderer import SurfaceRenderer
+from ..core.telemetry import telemetry, EventType
 
 
 class GameScene(Scene):
@@ -28,6 +36,13 @@ class GameScene(Scene):
         self.collectible_img = asset_manager.load_image(ASSET_PATHS['collectible'])
         self.life_img = asset_manager.load_image(ASSET_PATHS['life'])
         
+        # Formas de colisión generadas desde el canal alfa
+        register_hull(self.player_img, CollisionConfig.HULLS['player'])
+        register_hull(self.enemy_img, CollisionConfig.HULLS['enemy'])
+        register_hull(self.collectible_img, CollisionConfig.HULLS['collectible'])
+        # Test continuo sobre el recorrido del frame o discreto en la posición final
+        self.collide = collide_swept if CollisionConfig.SWEPT else collide_hull
+        
         # Fondo con gradiente animado
         self.background = create_gradient_surface(
             SCREEN_WIDTH,
@@ -37,19 +52,42 @@ class GameScene(Scene):
             vertical=True
         )
         
+        # Estrellas parallax pre-renderizadas
+        self.starfield = Starfield()
+        
         # Entidades
         self.players: List[Player] = []  # Lista de jugadores (1 o 2)
         self.enemies: pygame.sprite.Group = pygame.sprite.Group()
         self.collectibles: pygame.sprite.Group = pygame.sprite.Group()
         self.particles: List[Particle] = []
         
+        # Pools para reutilizar enemigos y coleccionables entre rondas
+        self.enemy_pool = EntityPool(Enemy)
+        self.collectible_pool = EntityPool(Collectible)
+        self.enemy_pool.prewarm(EnemyConfig.INITIAL_COUNT * 2, self.enemy_img)
+        self.collectible_pool.prewarm(CollectibleConfig.INITIAL_COUNT * 2, self.collectible_img)
+        
+        # Estado vectorizado (posición, velocidad, flotación) de todo lo que cae
+        self.falling = FallingStore()
+        
+        # Entidades generadas por encima de la pantalla esperan aquí hasta estar por entrar
+        self.pending = PendingSpawnQueue()
+        self.spawn_job = None  # Generación de ronda repartida entre frames
+        self.entry_y = {
+            'enemy': -self.enemy_img.get_height() - GameConfig.ACTIVATION_MARGIN,
+            'collectible': -self.collectible_img.get_height() - GameConfig.ACTIVATION_MARGIN,
+        }
+        
         # Sistema de rondas
-        self.round_manager = RoundManager()
+        self.round_manager = RoundManager(game_manager.clock)
         self.showing_round_transition = False
-        self.transition_timer = 0
-        # Timers de spawn continuo
-        self.last_enemy_spawn_frame = 0
-        self.last_collectible_spawn_frame = 0
+        self.transition_ends = 0.0  # Tiempo simulado en que termina la pantalla entre rondas
+        self.round_bonus = 0  # Bonus de la última ronda completada
+        # Apariciones de la ronda precalculadas (ver entities.spawn_timeline)
+        self.timeline = None
+        self.timeline_start = 0  # frame_count al empezar la ronda
+        self.spawn_seed = 0
+        self.spawn_sizes = {'enemy': self.enemy_img.get_size(), 'collectible': self.collectible_img.get_size()}
         
         # Estado del juego
         self.paused = False
@@ -80,19 +118,68 @@ class GameScene(Scene):
             alpha=230
         )
         
+        # Oscurecido de pausa y transición de ronda (el alfa se fija al usarlo)
+        self.dim_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.dim_overlay.fill((0, 0, 0))
+        
+        # HUD compuesto en su propia superficie; se redibuja cuando cambia lo que muestra
+        self.hud_surface = pygame.Surface((SCREEN_WIDTH, GameConfig.HUD_HEIGHT), pygame.SRCALPHA)
+        self.hud_state = None
+        
+        # Frame congelado durante la pausa: el mundo y la tarjeta se componen una vez
+        self.freeze_frame = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.frozen = False
+    
     def on_enter(self):
         """Inicializa el juego al entrar a la escena."""
         super().on_enter()
         self.game_mode = self.game_manager.game_mode
         self.reset_game()
         
-        # Iniciar música
-        asset_manager.load_music(ASSET_PATHS['music'])
-        asset_manager.play_music()
+        # Música desde el principio (el stream queda cargado entre partidas)
+        self.game_manager.audio.play_music(ASSET_PATHS['music'])
+    
+    def on_exit(self):
+        """Detiene la generación de ronda pendiente al salir de la escena."""
+        super().on_exit()
+        self._cancel_spawn_job()
     
     def reset_game(self):
         """Reinicia el estado del juego."""
         # Reiniciar jugadores según modo
+        self._create_players()
+        
+        # Limpiar entidades (vuelven a sus pools)
+        self._cancel_spawn_job()
+        self.enemy_pool.release_group(self.enemies)
+        self.collectible_pool.release_group(self.collectibles)
+        self.pending.clear()
+        self.particles.clear()
+        
+        # Reiniciar sistema de rondas
+        self.round_manager.reset()
+        self.showing_round_transition = False
+        self.round_bonus = 0
+        
+        # Reiniciar contadores (antes de generar: la cola pendiente usa frame_count)
+        self.frame_count = 0
+        self.paused = False
+        
+        # Semilla de la partida: fija (SpawnConfig.SEED) para reproducirla, si no al azar
+        self.spawn_seed = SpawnConfig.SEED if SpawnConfig.SEED is not None else random.randrange(2 ** 32)
+        telemetry.emit(EventType.GAME_START, self.game_manager.game_mode, self.spawn_seed)
+        
+        # Generar enemigos y coleccionables de la ronda inicial
+        self.spawn_round_entities()
+        
+        # Reiniciar sistema de puntuación
+        self.game_manager.score_system.reset()
+        
+        # Ronda en marcha: sin recolecciones completas hasta la próxima pausa o transición
+        self.game_manager.gc_policy.enter_gameplay()
+    
+    def _create_players(self):
+        """Crea los jugadores del modo actual en su posición inicial."""
         self.players.clear()
         
         if self.game_mode == 1:  # Single player
@@ -100,9 +187,8 @@ class GameScene(Scene):
                 SCREEN_WIDTH // 2 - self.player_img.get_width() // 2,
                 SCREEN_HEIGHT - self.player_img.get_height() - 20,
                 self.player_img,
-                player_id=1,
-                controls_left=PlayerConfig.PLAYER1_LEFT,
-                controls_right=PlayerConfig.PLAYER1_RIGHT
+                self.game_manager.clock,
+                player_id=1
             )
             self.players.append(player1)
         else:  # Cooperative (2 jugadores)
@@ -111,9 +197,8 @@ class GameScene(Scene):
                 SCREEN_WIDTH // 3 - self.player_img.get_width() // 2,
                 SCREEN_HEIGHT - self.player_img.get_height() - 20,
                 self.player_img,
+                self.game_manager.clock,
                 player_id=1,
-                controls_left=PlayerConfig.PLAYER1_LEFT,
-                controls_right=PlayerConfig.PLAYER1_RIGHT,
                 tint_color=PlayerConfig.PLAYER1_TINT
             )
             # Jugador 2 (derecha, rosa, A/D)
@@ -121,112 +206,152 @@ class GameScene(Scene):
                 2 * SCREEN_WIDTH // 3 - self.player_img.get_width() // 2,
                 SCREEN_HEIGHT - self.player_img.get_height() - 20,
                 self.player_img,
+                self.game_manager.clock,
                 player_id=2,
-                controls_left=PlayerConfig.PLAYER2_LEFT,
-                controls_right=PlayerConfig.PLAYER2_RIGHT,
                 tint_color=PlayerConfig.PLAYER2_TINT
             )
             self.players.append(player1)
             self.players.append(player2)
-        
-        # Limpiar entidades
-        self.enemies.empty()
-        self.collectibles.empty()
-        self.particles.clear()
-        
-        # Reiniciar sistema de rondas
-        self.round_manager.reset()
-        self.showing_round_transition = False
-        self.transition_timer = 0
-        self.last_enemy_spawn_frame = 0
-        self.last_collectible_spawn_frame = 0
-        
-        # Generar enemigos y coleccionables de la ronda inicial
-        self.spawn_round_entities()
-        
-        # Reiniciar contadores
-        self.frame_count = 0
-        self.paused = False
-        
-        # Reiniciar sistema de puntuación
-        self.game_manager.score_system.reset()
     
     def spawn_round_entities(self):
-        """Genera enemigos y coleccionables para la ronda actual."""
-        speed_mult = self.round_manager.get_speed_multiplier()
-        enemy_count = self.round_manager.get_enemy_count()
-        collectible_count = self.round_manager.get_collectible_count()
-        
-        self.spawn_enemies(enemy_count, speed_mult)
-        self.spawn_collectibles(collectible_count, speed_mult)
-    
-    def spawn_enemies(self, count: int, speed_multiplier: float = 1.0):
-        """Genera enemigos con multiplicador de velocidad."""
-        for _ in range(count):
-            x = random.randint(0, SCREEN_WIDTH - self.enemy_img.get_width())
-            y = random.randint(-500, -self.enemy_img.get_height())
-            speed = random.uniform(EnemyConfig.SPEED_MIN, EnemyConfig.SPEED_MAX) * speed_multiplier
-            enemy = Enemy(x, y, self.enemy_img, speed)
-            self.enemies.add(enemy)
+        """Genera la línea de tiempo de la ronda y reparte su tanda inicial en varios frames."""
+        self._cancel_spawn_job()
+        self.timeline = SpawnTimeline(self.round_manager.params, self.spawn_seed, self.spawn_sizes)
+        self.timeline_start = self.frame_count
+        self.spawn_job = self.game_manager.jobs.submit(self._spawn_round_job(), JobPriority.HIGH, 'spawn_round')
+    
+    def _spawn_round_job(self):
+        """Tarea: activa la tanda inicial en lotes de JobConfig.SPAWN_BATCH entidades por paso."""
+        enemies = self.timeline.opening['enemy']
+        collectibles = self.timeline.opening['collectible']
+        batch = JobConfig.SPAWN_BATCH
+        
+        while enemies.remaining or collectibles.remaining:
+            taken = enemies.take_next(batch)
+            for _, x, y, speed, spin in taken:
+                self._spawn('enemy', x, y, speed, spin)
+            for _, x, y, speed, phase in collectibles.take_next(batch - len(taken)):
+                self._spawn('collectible', x, y, speed, phase)
+            yield
     
-    def spawn_collectibles(self, count: int, speed_multiplier: float = 1.0):
-        """Genera coleccionables con multiplicador de velocidad."""
-        for _ in range(count):
-            x = random.randint(0, SCREEN_WIDTH - self.collectible_img.get_width())
-            y = random.randint(-800, -self.collectible_img.get_height())
-            speed = random.uniform(CollectibleConfig.SPEED_MIN, CollectibleConfig.SPEED_MAX) * speed_multiplier
-            collectible = Collectible(x, y, self.collectible_img, speed)
+    def _cancel_spawn_job(self):
+        """Cancela la generación de ronda en curso (reinicio o cambio de ronda)."""
+        if self.spawn_job is not None:
+            self.spawn_job.cancel()
+            self.spawn_job = None
+    
+    def _spawn(self, kind: str, x: float, y: float, speed: float, extra: float):
+        """Encola una aparición por encima de la pantalla o la activa si ya está por entrar."""
+        if not self.pending.push(kind, x, y, speed, self.frame_count, self.entry_y[kind], extra):
+            self._activate(kind, x, y, speed, extra)
+    
+    def _activate(self, kind: str, x: float, y: float, speed: float, extra: Optional[float] = None):
+        """Crea (o recicla) una entidad y la añade a los sistemas activos."""
+        if kind == 'enemy':
+            enemy = self.enemy_pool.acquire(x, y, self.enemy_img, speed, extra)
+            self.enemies.add(enemy)
+            self.falling.add(enemy, speed, spin=enemy.rotation)
+        else:
+            collectible = self.collectible_pool.acquire(x, y, self.collectible_img, speed, extra)
             self.collectibles.add(collectible)
+            self.falling.add(collectible, speed, phase=collectible.phase, bob=CollectibleConfig.BOB_AMPLITUDE)
+    
+    def _activate_pending(self):
+        """Activa las entidades pendientes que están a punto de entrar en pantalla."""
+        for kind, x, y, speed, extra in self.pending.pop_due(self.frame_count):
+            self._activate(kind, x, y, speed, extra)
     
     def handle_events(self, events: list):
-        """Maneja eventos del juego."""
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_p:
-                    self.paused = not self.paused
-                    if self.paused:
-                        asset_manager.stop_music()
-                    else:
-                        asset_manager.play_music()
-                elif event.key == pygame.K_ESCAPE:
-                    self.start_transition('menu')
+        """Pausa y salida a partir de las acciones pulsadas en este frame."""
+        pressed = self.game_manager.input.snapshot.pressed
+        if pressed & Action.PAUSE:
+            self.set_paused(not self.paused)
+        elif pressed & Action.BACK:
+            self.start_transition('menu')
+    
+    def set_paused(self, paused: bool):
+        """Pausa o reanuda la partida (música y política del GC incluidas)."""
+        if paused == self.paused:
+            return
+        self.paused = paused
+        telemetry.emit(EventType.PAUSE if paused else EventType.RESUME)
+        if paused:
+            self.game_manager.audio.pause_music()
+            self.game_manager.gc_policy.idle('pause')
+        else:
+            self.game_manager.audio.resume_music()
+            self.game_manager.gc_policy.enter_gameplay()
+    
+    def on_focus_lost(self):
+        """Pausa la partida si la ventana pierde el foco."""
+        if IdleConfig.PAUSE_ON_FOCUS_LOSS:
+            self.set_paused(True)
+    
+    def metrics(self) -> list:
+        """Entidades, partículas, textos flotantes y ronda actuales."""
+        return [
+            ('entities', {'kind': 'enemy'}, len(self.enemies)),
+            ('entities', {'kind': 'collectible'}, len(self.collectibles)),
+            ('entities', {'kind': 'pending'}, len(self.pending)),
+            ('particles', {}, len(self.particles)),
+            ('floating_texts', {}, len(self.game_manager.score_system.floating_texts)),
+            ('round', {}, self.round_manager.current_round),
+        ]
+    
+    def in_gameplay(self) -> bool:
+        """En juego salvo en pausa o durante la transición entre rondas."""
+        return not self.paused and not self.showing_round_transition
+    
+    def is_static(self) -> bool:
+        """En pausa, con el frame ya congelado y sin fundido, nada cambia hasta un evento."""
+        return self.paused and self.frozen and self.transition_idle()
     
     def update(self):
         """Actualiza la lógica del juego."""
         if self.paused:
             return
         
+        # Un tick de simulación: el reloj del juego no avanza en pausa
+        clock = self.game_manager.clock
+        clock.tick()
+        
+        # Aplicar el nivel de calidad actual y desplazar el fondo de estrellas
+        self._apply_quality()
+        self.starfield.update()
+        
         # Manejar transición de ronda
         if self.showing_round_transition:
-            self.transition_timer -= 1
-            if self.transition_timer <= 0:
+            if clock.now() >= self.transition_ends:
                 self.showing_round_transition = False
                 self.spawn_round_entities()
+                self.game_manager.gc_policy.enter_gameplay()
             return
         
         # Actualizar contador de frames
         self.frame_count += 1
         
-        # Actualizar jugadores
+        # Actualizar jugadores con las acciones del frame (teclado, mando, grabación u otro proceso)
+        actions = self.game_manager.input.snapshot.held
         for player in self.players:
-            player.update()
+            player.update(actions)
         
-        # Actualizar enemigos
-        self.enemies.update()
+        # Activar las entidades que llegan al borde superior
+        self._activate_pending()
         
-        # Actualizar coleccionables
-        self.collectibles.update()
+        # Mover enemigos y coleccionables en un solo paso vectorizado
+        self.falling.step()
 
         # Spawn continuo dependiente de ronda
         self._continuous_spawn()
         
         # Detectar colisiones para cada jugador
+        audio = self.game_manager.audio
         for player in self.players:
             if player.lives <= 0 or player.dying:
                 continue  # Jugador ya muerto o muriendo
             
-            # Colisiones con coleccionables (más precisas con máscaras)
-            collected = pygame.sprite.spritecollide(player, self.collectibles, True, pygame.sprite.collide_mask)
+            # Colisiones con coleccionables (rect del recorrido primero, después la forma del asset)
+            collected = pygame.sprite.spritecollide(player, self.collectibles, True, self.collide)
             for item in collected:
                 # Añadir puntos al jugador individual
                 points = self.game_manager.score_system.add_points(
@@ -234,53 +359,51 @@ class GameScene(Scene):
                     item.rect.centery
                 )
                 player.score += points
+                combo = self.game_manager.score_system.combo
+                telemetry.emit(EventType.PICKUP, player.player_id, combo)
+                
+                # Sonido: el tono sube con el combo; más bajo si se recogen varios a la vez
+                audio.play('pickup', pitch=combo - 1, volume=0 if len(collected) > 1 else -1)
+                if combo >= 5 and combo % 5 == 0:
+                    audio.play('combo')
                 
                 # Notificar al round manager
                 round_complete = self.round_manager.on_item_collected()
                 
                 # Crear partículas con el color del jugador
                 particle_color = player.tint_color if player.tint_color else Colors.PINK
-                particles = create_particle_burst(
-                    item.rect.centerx,
-                    item.rect.centery,
-                    particle_color,
-                    count=20
-                )
-                self.particles.extend(particles[:GameConfig.MAX_PARTICLES - len(self.particles)])
+                self._emit_particles(item.rect.centerx, item.rect.centery, particle_color, 20)
                 
                 # Verificar si completó la ronda
                 if round_complete:
+                    audio.play('round_clear')
                     self._start_round_transition()
             
-            # Colisiones con enemigos (más precisas con máscaras)
+            # Colisiones con enemigos (la cápsula del cactus sigue su rotación)
             if not player.invulnerable:
-                hit_enemies = pygame.sprite.spritecollide(player, self.enemies, True, pygame.sprite.collide_mask)
+                hit_enemies = pygame.sprite.spritecollide(player, self.enemies, True, self.collide)
                 if hit_enemies:
                     died = player.take_damage()
+                    if player.dying:
+                        telemetry.emit(EventType.DEATH, player.player_id, player.score)
+                    else:
+                        telemetry.emit(EventType.HIT, player.player_id, player.lives)
                     self.game_manager.score_system.break_combo()
+                    audio.play('death' if player.dying else 'hit')
                     
                     # Crear partículas (explosión grande si murió, pequeña si solo daño)
                     if player.dying:  # Murió
                         particle_color = player.tint_color if player.tint_color else Colors.WHITE
-                        particles = create_particle_burst(
-                            player.rect.centerx,
-                            player.rect.centery,
-                            particle_color,
-                            count=50
-                        )
+                        self._emit_particles(player.rect.centerx, player.rect.centery, particle_color, 50)
                     else:  # Solo daño
-                        particles = create_particle_burst(
-                            player.rect.centerx,
-                            player.rect.centery,
-                            Colors.DANGER,
-                            count=25
-                        )
-                    self.particles.extend(particles[:GameConfig.MAX_PARTICLES - len(self.particles)])
+                        self._emit_particles(player.rect.centerx, player.rect.centery, Colors.DANGER, 25)
         
         # Verificar si todos los jugadores murieron (incluyendo animación)
         all_dead = all(player.is_dead() for player in self.players)
         if all_dead:
-            asset_manager.stop_music()
+            if self.next_scene != 'gameover':
+                telemetry.emit(EventType.GAME_OVER, self.game_manager.score_system.score, self.round_manager.current_round)
+            self.game_manager.audio.stop_music()
             self.start_transition('gameover')
         
         # Actualizar partículas
@@ -300,77 +423,169 @@ class GameScene(Scene):
         # Actualizar transición
         if self.update_transition() and self.next_scene:
             self.game_manager.change_scene(self.next_scene)
-
+    
+    def _apply_quality(self):
+        """Ajusta estrellas, textos flotantes y giro de enemigos al nivel del gobernador de calidad."""
+        quality = self.game_manager.quality.settings
+        # El mismo ángulo para dibujar y para colisionar: sin rotación, el cactus es vertical en ambos
+        self.falling.rotate = quality['rotation']
+        self.starfield.set_density(StarfieldConfig.DENSITY * quality['star_density'])
+        self.game_manager.score_system.max_floating_texts = quality['floating_texts']
+    
+    def _emit_particles(self, x: float, y: float, color, count: int):
+        """Crea una explosión de partículas escalada y limitada por el nivel de calidad."""
+        quality = self.game_manager.quality.settings
+        room = min(GameConfig.MAX_PARTICLES, quality['max_particles']) - len(self.particles)
+        count = min(room, max(1, int(count * quality['particle_scale'])))
+        if count > 0:
+            self.particles.extend(create_particle_burst(x, y, color, count=count))
+    
     def _continuous_spawn(self):
-        """Genera enemigos y coleccionables de forma continua durante la ronda."""
-        speed_mult = self.round_manager.get_speed_multiplier()
-        # Enemigos
-        enemy_interval = self.round_manager.get_enemy_spawn_frames()
-        enemy_cap = self.round_manager.get_enemy_cap()
-        if (self.frame_count - self.last_enemy_spawn_frame) >= enemy_interval and len(self.enemies) < enemy_cap:
-            self.spawn_enemies(1, speed_mult)
-            self.last_enemy_spawn_frame = self.frame_count
+        """Aparece lo que toca en este frame según la línea de tiempo de la ronda."""
+        params = self.round_manager.params
+        timeline = self.timeline
+        frame = self.frame_count - self.timeline_start
+        timeline.ensure(frame)
+        
+        # Enemigos: el goteo respeta el tope en pantalla, las oleadas no
+        room = params.enemy_cap - len(self.enemies) - self.pending.count('enemy')
+        for _, x, y, speed, spin in timeline.stream['enemy'].take(frame, max(0, room)):
+            self._spawn('enemy', x, y, speed, spin)
+        for _, x, y, speed, spin in timeline.waves['enemy'].take(frame):
+            self._spawn('enemy', x, y, speed, spin)
         
         # Coleccionables: solo si aún faltan para el objetivo
-        goal = self.round_manager.get_items_goal()
-        if self.round_manager.items_collected_this_round < goal:
-            col_interval = self.round_manager.get_collectible_spawn_frames()
-            col_cap = self.round_manager.get_collectible_cap()
-            if (self.frame_count - self.last_collectible_spawn_frame) >= col_interval and len(self.collectibles) < col_cap:
-                self.spawn_collectibles(1, speed_mult)
-                self.last_collectible_spawn_frame = self.frame_count
+        if self.round_manager.items_collected_this_round < params.items_goal:
+            room = params.collectible_cap - len(self.collectibles) - self.pending.count('collectible')
+            for _, x, y, speed, phase in timeline.stream['collectible'].take(frame, max(0, room)):
+                self._spawn('collectible', x, y, speed, phase)
+            for _, x, y, speed, phase in timeline.waves['collectible'].take(frame):
+                self._spawn('collectible', x, y, speed, phase)
     
     def _start_round_transition(self):
         """Inicia la transición entre rondas."""
         self.showing_round_transition = True
-        self.transition_timer = 120  # 2 segundos a 60 FPS
+        self.transition_ends = self.game_manager.clock.now() + RoundConfig.ROUND_TRANSITION_TIME
         
-        # Limpiar entidades
-        self.enemies.empty()
-        self.collectibles.empty()
+        # Limpiar entidades (vuelven a sus pools)
+        self._cancel_spawn_job()
+        self.enemy_pool.release_group(self.enemies)
+        self.collectible_pool.release_group(self.collectibles)
+        self.pending.clear()
+        
+        # Bonus con el tiempo de la ronda terminada (antes de que empiece la siguiente)
+        self.round_bonus = self.round_manager.get_round_bonus()
         
         # Avanzar de ronda
         self.round_manager.advance_round()
         
+        # Recolectar mientras se muestra la pantalla de transición
+        self.game_manager.gc_policy.idle('round_transition')
+        
         # Aplicar bonus a jugadores vivos
-        bonus = self.round_manager.get_round_bonus()
         for player in self.players:
             if player.lives > 0:
-                player.score += bonus
+                player.score += self.round_bonus
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja el juego."""
+    def render(self, renderer):
+        """Envía el mundo al backend de dibujo sprite a sprite y dibuja el HUD en su lienzo."""
+        if self.paused:
+            # El mundo no cambia en pausa: se reutiliza el frame congelado
+            if not self.frozen:
+                self._capture_pause_frame()
+            renderer.blit(self.freeze_frame, (0, 0))
+        else:
+            self.frozen = False
+            self.render_world(renderer)
+            self.render_overlay(renderer)
+        
+        # Efecto de transición
+        self.render_transition(renderer)
+    
+    def _capture_pause_frame(self):
+        """Compone el último frame de juego con la tarjeta de pausa encima."""
+        frame_renderer = SurfaceRenderer(self.freeze_frame)
+        frame_renderer.begin_frame(Colors.DARK_BG)
+        self.render_world(frame_renderer)
+        self.render_overlay(frame_renderer)
+        # El backend de texturas debe volver a subirlo
+        self.game_manager.renderer.forget(self.freeze_frame)
+        self.frozen = True
+    
+    def render_world(self, renderer):
+        """Fondo, estrellas, partículas y entidades."""
         # Fondo
-        screen.blit(self.background, (0, 0))
+        renderer.blit(self.background, (0, 0))
         
-        # Dibujar estrellas de fondo (efecto simple)
-        if self.frame_count % 3 == 0:
-            for _ in range(2):
-                x = random.randint(0, SCREEN_WIDTH)
-                y = random.randint(0, SCREEN_HEIGHT)
-                size = random.randint(1, 2)
-                pygame.draw.circle(screen, Colors.WHITE, (x, y), size)
+        # Estrellas de fondo (capas parallax)
+        self.starfield.render(renderer)
+        
+        # Solo se dibuja lo que intersecta el viewport (con margen para rotaciones)
+        viewport = renderer.get_rect().inflate(GameConfig.DRAW_MARGIN * 2, GameConfig.DRAW_MARGIN * 2)
         
         # Dibujar partículas
         for particle in self.particles:
-            particle.draw(screen)
+            if viewport.collidepoint(particle.x, particle.y):
+                particle.render(renderer)
         
         # Dibujar coleccionables
         for collectible in self.collectibles:
-            collectible.draw(screen)
+            if viewport.colliderect(collectible.rect):
+                collectible.render(renderer)
         
-        # Dibujar enemigos
+        # Dibujar enemigos (sin rotación en los niveles de calidad bajos, ver _apply_quality)
         for enemy in self.enemies:
-            enemy.draw(screen)
+            if viewport.colliderect(enemy.rect):
+                enemy.render(renderer)
         
         # Dibujar jugadores
         for player in self.players:
-            player.draw(screen)
-        
+            player.render(renderer)
+    
+    def draw(self, screen: pygame.Surface):
+        """Dibuja el juego sobre una superficie."""
+        self.render(self.surface_renderer(screen))
+    
+    def render_overlay(self, renderer):
+        """Textos flotantes y HUD como sprites; transición de ronda y pausa en el lienzo."""
         # Dibujar textos flotantes del score system
-        self.game_manager.score_system.draw(screen)
+        self.game_manager.score_system.render(renderer)
+        
+        # HUD cacheado: el backend de texturas solo lo vuelve a subir cuando cambia
+        renderer.blit(self._hud_surface(), (0, 0))
         
-        # === HUD ===
+        if self.showing_round_transition or self.paused:
+            self.draw_overlay(renderer.canvas())
+    
+    def _hud_state(self) -> tuple:
+        """Todo lo que muestra el HUD (mientras no cambie, la superficie cacheada vale)."""
+        combo, multiplier, _ = self.game_manager.score_system.get_combo_info()
+        bar = self.combo_bar
+        return (
+            self.game_mode,
+            self.round_manager.current_round,
+            self.round_manager.get_progress(),
+            self.round_manager.items_collected_this_round,
+            self.round_manager.get_items_goal(),
+            tuple((player.score, player.lives) for player in self.players),
+            combo,
+            multiplier,
+            int(bar.rect.width * bar.display_value / bar.max_value) if combo > 0 else 0
+        )
+    
+    def _hud_surface(self) -> pygame.Surface:
+        """Superficie del HUD, recompuesta solo cuando cambia su estado."""
+        state = self._hud_state()
+        if state != self.hud_state:
+            self.hud_state = state
+            self.hud_surface.fill((0, 0, 0, 0))
+            self.draw_hud(self.hud_surface)
+            # El backend de texturas debe volver a subirla
+            self.game_manager.renderer.forget(self.hud_surface)
+        return self.hud_surface
+    
+    def draw_hud(self, screen: pygame.Surface):
+        """Dibuja el panel superior con ronda, puntuaciones, vidas y combo."""
         # Panel superior semi-transparente
         hud_height = 120 if self.game_mode == 2 else 80
         hud_panel = Panel(10, 10, SCREEN_WIDTH - 20, hud_height, alpha=150)
@@ -462,7 +677,9 @@ class GameScene(Scene):
             
             # Barra de combo abajo del texto
             self.combo_bar.draw(screen)
-        
+    
+    def draw_overlay(self, screen: pygame.Surface):
+        """Dibuja la transición de ronda y la pausa sobre el mundo y el HUD."""
         # Pantalla de transición de ronda
         if self.showing_round_transition:
             self._draw_round_transition(screen)
@@ -470,10 +687,8 @@ class GameScene(Scene):
         # Pantalla de pausa
         if self.paused:
             # Overlay oscuro
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            overlay.fill((0, 0, 0))
-            overlay.set_alpha(150)
-            screen.blit(overlay, (0, 0))
+            self.dim_overlay.set_alpha(150)
+            screen.blit(self.dim_overlay, (0, 0))
             
             # Panel de pausa
             self.pause_panel.draw(screen)
@@ -498,17 +713,12 @@ class GameScene(Scene):
             )
             menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
             screen.blit(menu_text, menu_rect)
-        
-        # Efecto de transición
-        self.draw_transition(screen)
     
     def _draw_round_transition(self, screen: pygame.Surface):
         """Dibuja la pantalla de transición entre rondas."""
         # Overlay oscuro
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.fill((0, 0, 0))
-        overlay.set_alpha(180)
-        screen.blit(overlay, (0, 0))
+        self.dim_overlay.set_alpha(180)
+        screen.blit(self.dim_overlay, (0, 0))
         
         # Panel central
         panel_width = 500
@@ -532,9 +742,8 @@ class GameScene(Scene):
         screen.blit(complete_text, complete_rect)
         
         # Bonus
-        bonus = self.round_manager.get_round_bonus()
         bonus_text = self.font_medium.render(
-            f"Bonus: +{bonus} puntos",
+            f"Bonus: +{self.round_bonus} puntos",
             True,
             Colors.PINK
         )
@@ -2,6 +2,7 @@
 Escena de Game Over.
 """
 import pygame
+from typing import Dict, Optional, Tuple
 from .base_scene import Scene
 from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, Colors
 from ..ui import Button, Panel
@@ -11,6 +12,8 @@ from ..utils import create_gradient_surface
 class GameOverScene(Scene):
     """Escena mostrada al perder el juego."""
     
+    EVENT_TYPES = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         
@@ -64,10 +67,15 @@ class GameOverScene(Scene):
             hover_color=Colors.PURPLE_LIGHT
         )
         
+        # Capa estática (se compone al entrar) y texto con pulso por tamaño de fuente
+        self.static_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.pulse_label: Optional[Tuple[str, int, Tuple[int, int]]] = None  # (texto, tamaño base, centro)
+        self.pulse_surfaces: Dict[int, pygame.Surface] = {}
+        
         # Animación
         self.pulse = 0
         self.is_new_record = False
-        
+    
     def retry_game(self):
         """Reinicia el juego."""
         self.start_transition('game')
@@ -79,6 +87,9 @@ class GameOverScene(Scene):
     def on_enter(self):
         """Al entrar, verifica si hay nuevo récord."""
         super().on_enter()
+        mouse_pos = pygame.mouse.get_pos()
+        self.retry_button.update(mouse_pos)
+        self.menu_button.update(mouse_pos)
         score_system = self.game_manager.score_system
         self.is_new_record = score_system.score == score_system.high_score and score_system.score > 0
         
@@ -109,11 +120,11 @@ class GameOverScene(Scene):
                 elif self.player_scores[1]['score'] > self.player_scores[0]['score']:
                     self.winner_id = 2
                 # Si empatan, winner_id queda None
+        
+        self._build_static_layer()
     
     def handle_events(self, events: list):
         """Maneja eventos de Game Over."""
-        mouse_pos = pygame.mouse.get_pos()
-        
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_r or event.key == pygame.K_SPACE:
@@ -124,32 +135,55 @@ class GameOverScene(Scene):
             self.retry_button.handle_event(event)
             self.menu_button.handle_event(event)
         
-        self.retry_button.update(mouse_pos)
-        self.menu_button.update(mouse_pos)
+        self.retry_button.update()
+        self.menu_button.update()
+    
+    def _pulse_scale(self) -> float:
+        return 1.0 + 0.1 * abs(pygame.math.Vector2(1, 0).rotate(self.pulse * 100).y)
+    
+    def _pulse_at_rest(self) -> bool:
+        """True si el texto con pulso (si lo hay) está en su tamaño base."""
+        return self.pulse_label is None or int(self.pulse_label[1] * self._pulse_scale()) == self.pulse_label[1]
+    
+    def is_static(self) -> bool:
+        """Estático sin fundido, con los botones quietos y el pulso en reposo."""
+        return (
+            self.transition_idle()
+            and not self.retry_button.animating
+            and not self.menu_button.animating
+            and (self.pulse_label is None or (not self.ambient_active() and self._pulse_at_rest()))
+        )
     
     def update(self):
         """Actualiza la escena."""
-        self.pulse += 0.05
+        # Sin actividad, el pulso termina en el tamaño base y se detiene
+        if self.ambient_active() or not self._pulse_at_rest():
+            self.pulse += 0.05
         
         # Actualizar transición
         if self.update_transition() and self.next_scene:
             self.game_manager.change_scene(self.next_scene)
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja la pantalla de Game Over."""
-        # Fondo
-        screen.blit(self.background, (0, 0))
+    def _build_static_layer(self):
+        """
+        Compone en una sola superficie lo que no se anima (fondo, panel, título,
+        puntajes e indicaciones) y prepara el texto con pulso, si lo hay.
+        """
+        layer = self.static_layer
+        layer.blit(self.background, (0, 0))
+        self.pulse_label = None
+        self.pulse_surfaces.clear()
         
         # Panel principal
-        self.main_panel.draw(screen)
+        self.main_panel.draw(layer)
         
         # Título "GAME OVER"
         title_color = Colors.DANGER if not self.is_new_record else Colors.GOLD
         title_text = self.title_font.render("GAME OVER", True, title_color)
         title_shadow = self.title_font.render("GAME OVER", True, Colors.BLACK)
         title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 120))
-        screen.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
-        screen.blit(title_text, title_rect)
+        layer.blit(title_shadow, (title_rect.x + 3, title_rect.y + 3))
+        layer.blit(title_text, title_rect)
         
         # Mostrar puntajes según modo de juego
         if len(self.player_scores) == 2:
@@ -158,18 +192,8 @@ class GameOverScene(Scene):
             
             # Anunciar ganador
             if self.winner_id:
-                # Efecto de pulso para el ganador
-                pulse_scale = 1.0 + 0.1 * abs(pygame.math.Vector2(1, 0).rotate(self.pulse * 100).y)
-                winner_font_size = int(48 * pulse_scale)
-                winner_font = pygame.font.Font(None, winner_font_size)
-                
-                winner_text = winner_font.render(
-                    f"¡Jugador {self.winner_id} Gana! 🏆",
-                    True,
-                    Colors.GOLD
-                )
-                winner_rect = winner_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                screen.blit(winner_text, winner_rect)
+                # Con efecto de pulso: se dibuja cada frame
+                self.pulse_label = (f"¡Jugador {self.winner_id} Gana! 🏆", 48, (SCREEN_WIDTH // 2, y_pos))
                 y_pos += 60
             else:
                 # Empate
@@ -179,7 +203,7 @@ class GameOverScene(Scene):
                     Colors.CYAN
                 )
                 tie_rect = tie_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                screen.blit(tie_text, tie_rect)
+                layer.blit(tie_text, tie_rect)
                 y_pos += 60
             
             # Puntajes individuales
@@ -191,7 +215,7 @@ class GameOverScene(Scene):
                     player_color
                 )
                 score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                screen.blit(score_text, score_rect)
+                layer.blit(score_text, score_rect)
                 y_pos += 40
         else:
             # Modo un jugador - puntaje tradicional
@@ -202,22 +226,12 @@ class GameOverScene(Scene):
                 Colors.PINK
             )
             score_rect = score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-            screen.blit(score_text, score_rect)
+            layer.blit(score_text, score_rect)
             
             # Mejor puntuación
             if self.is_new_record:
-                # Efecto de pulso para nuevo récord
-                pulse_scale = 1.0 + 0.1 * abs(pygame.math.Vector2(1, 0).rotate(self.pulse * 100).y)
-                record_font_size = int(36 * pulse_scale)
-                record_font = pygame.font.Font(None, record_font_size)
-                
-                record_text = record_font.render(
-                    "¡NUEVO RÉCORD! 🏆",
-                    True,
-                    Colors.GOLD
-                )
-                record_rect = record_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-                screen.blit(record_text, record_rect)
+                # Con efecto de pulso: se dibuja cada frame
+                self.pulse_label = ("¡NUEVO RÉCORD! 🏆", 36, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
             else:
                 high_score_text = self.text_font.render(
                     f"Mejor puntaje: {score_system.high_score}",
@@ -225,11 +239,7 @@ class GameOverScene(Scene):
                     Colors.GOLD
                 )
                 high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-                screen.blit(high_score_text, high_score_rect)
-        
-        # Botones
-        self.retry_button.draw(screen)
-        self.menu_button.draw(screen)
+                layer.blit(high_score_text, high_score_rect)
         
         # Hints de teclado
         hint_font = pygame.font.Font(None, 20)
@@ -241,8 +251,37 @@ class GameOverScene(Scene):
         for hint in hints:
             hint_text = hint_font.render(hint, True, Colors.TEXT_SECONDARY)
             hint_rect = hint_text.get_rect(center=(SCREEN_WIDTH // 2, y_offset))
-            screen.blit(hint_text, hint_rect)
+            layer.blit(hint_text, hint_rect)
             y_offset += 25
         
+        # El backend de texturas debe volver a subir la capa
+        self.game_manager.renderer.forget(layer)
+    
+    def _pulse_surface(self) -> pygame.Surface:
+        """Texto con pulso en el tamaño de fuente de este frame (cacheado por tamaño)."""
+        text, base_size, _ = self.pulse_label
+        font_size = int(base_size * self._pulse_scale())
+        surface = self.pulse_surfaces.get(font_size)
+        if surface is None:
+            surface = pygame.font.Font(None, font_size).render(text, True, Colors.GOLD)
+            self.pulse_surfaces[font_size] = surface
+        return surface
+    
+    def render(self, renderer):
+        """Envía la pantalla al backend: capa estática, texto con pulso y botones."""
+        renderer.blit(self.static_layer, (0, 0))
+        
+        if self.pulse_label is not None:
+            surface = self._pulse_surface()
+            renderer.blit(surface, surface.get_rect(center=self.pulse_label[2]))
+        
+        # Botones
+        self.retry_button.render(renderer)
+        self.menu_button.render(renderer)
+        
         # Efecto de transición
-        self.draw_transition(screen)
+        self.render_transition(renderer)
+    
+    def draw(self, screen: pygame.Surface):
+        """Dibuja la pantalla de Game Over."""
+        self.render(self.surface_renderer(screen))
@@ -11,6 +11,8 @@ from ..utils import create_gradient_surface, draw_text_with_shadow
 class MenuScene(Scene):
     """Menú principal del juego."""
     
+    EVENT_TYPES = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+    
     def __init__(self, game_manager):
         super().__init__(game_manager)
         
@@ -28,6 +30,11 @@ class MenuScene(Scene):
         self.subtitle_font = pygame.font.Font(None, 32)
         self.controls_font = pygame.font.Font(None, 24)
         
+        # Título prerenderizado (solo se mueve) y capa estática (se compone al entrar)
+        self.title_text = self.title_font.render("Makeup Rain", True, Colors.PINK)
+        self.title_shadow = self.title_font.render("Makeup Rain", True, Colors.PURPLE_DARK)
+        self.static_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        
         # Botones (columna derecha)
         button_width = 240
         button_height = 55
@@ -68,7 +75,7 @@ class MenuScene(Scene):
         
         # Animación del título
         self.title_bounce = 0
-        
+    
     def start_single_player(self):
         """Inicia el juego en modo 1 jugador."""
         self.game_manager.game_mode = 1  # Single player
@@ -84,10 +91,16 @@ class MenuScene(Scene):
         pygame.quit()
         raise SystemExit
     
+    def on_enter(self):
+        """Compone la capa estática y sincroniza el hover con la posición del ratón."""
+        super().on_enter()
+        self._build_static_layer()
+        mouse_pos = pygame.mouse.get_pos()
+        for button in (self.single_player_button, self.coop_button, self.quit_button):
+            button.update(mouse_pos)
+    
     def handle_events(self, events: list):
         """Maneja eventos del menú."""
-        mouse_pos = pygame.mouse.get_pos()
-        
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
@@ -103,30 +116,40 @@ class MenuScene(Scene):
             self.coop_button.handle_event(event)
             self.quit_button.handle_event(event)
         
-        self.single_player_button.update(mouse_pos)
-        self.coop_button.update(mouse_pos)
-        self.quit_button.update(mouse_pos)
+        self.single_player_button.update()
+        self.coop_button.update()
+        self.quit_button.update()
+    
+    def _bounce_offset(self) -> int:
+        """Desplazamiento vertical del título (píxeles)."""
+        return int(pygame.math.Vector2(0, 10).rotate(self.title_bounce * 50).y)
+    
+    def is_static(self) -> bool:
+        """Estático con el título en reposo, los botones quietos y sin fundido."""
+        return (
+            self.transition_idle()
+            and not self.ambient_active()
+            and self._bounce_offset() == 0
+            and not any(button.animating for button in (self.single_player_button, self.coop_button, self.quit_button))
+        )
     
     def update(self):
         """Actualiza el menú."""
-        self.title_bounce += 0.05
+        # Sin actividad, el título termina su rebote en la posición de reposo y se detiene
+        if self.ambient_active() or self._bounce_offset() != 0:
+            self.title_bounce += 0.05
         
         # Actualizar transición
         if self.update_transition() and self.next_scene:
             self.game_manager.change_scene(self.next_scene)
     
-    def draw(self, screen: pygame.Surface):
-        """Dibuja el menú."""
-        # Fondo
-        screen.blit(self.background, (0, 0))
-        
-        # Título con animación de rebote
-        bounce_offset = int(pygame.math.Vector2(0, 10).rotate(self.title_bounce * 50).y)
-        title_text = self.title_font.render("Makeup Rain", True, Colors.PINK)
-        title_shadow = self.title_font.render("Makeup Rain", True, Colors.PURPLE_DARK)
-        title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 80 + bounce_offset))
-        screen.blit(title_shadow, (title_rect.x + 4, title_rect.y + 4))
-        screen.blit(title_text, title_rect)
+    def _build_static_layer(self):
+        """
+        Compone en una sola superficie todo lo que no se anima: fondo, récord,
+        paneles, reglas y títulos de columna. Se rehace al entrar (el récord cambia).
+        """
+        layer = self.static_layer
+        layer.blit(self.background, (0, 0))
         
         # High score debajo del título
         high_score_text = self.subtitle_font.render(
@@ -135,7 +158,7 @@ class MenuScene(Scene):
             Colors.GOLD
         )
         high_score_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, 150))
-        screen.blit(high_score_text, high_score_rect)
+        layer.blit(high_score_text, high_score_rect)
         
         # === LAYOUT DE 2 COLUMNAS ===
         
@@ -145,11 +168,11 @@ class MenuScene(Scene):
         
         # Panel de reglas
         rules_panel = Panel(left_x - 20, rules_y - 10, 280, 340, alpha=150)
-        rules_panel.draw(screen)
+        rules_panel.draw(layer)
         
         # Título de reglas
         rules_title = self.subtitle_font.render("COMO JUGAR", True, Colors.CYAN)
-        screen.blit(rules_title, (left_x, rules_y))
+        layer.blit(rules_title, (left_x, rules_y))
         
         # Reglas del juego
         rules = [
@@ -168,14 +191,16 @@ class MenuScene(Scene):
             "ESC - Salir"
         ]
         
+        heading_font = pygame.font.Font(None, 22)
+        rule_font = pygame.font.Font(None, 20)
         rule_y = rules_y + 10
         for rule in rules:
             if rule:  # Solo renderizar si no está vacío
-                color = Colors.PINK_LIGHT if rule.endswith(":") else Colors.TEXT_SECONDARY
-                size = 22 if rule.endswith(":") else 20
-                rule_font = pygame.font.Font(None, size)
-                rule_text = rule_font.render(rule, True, color)
-                screen.blit(rule_text, (left_x + 10, rule_y))
+                if rule.endswith(":"):
+                    rule_text = heading_font.render(rule, True, Colors.PINK_LIGHT)
+                else:
+                    rule_text = rule_font.render(rule, True, Colors.TEXT_SECONDARY)
+                layer.blit(rule_text, (left_x + 10, rule_y))
             rule_y += 24
         
         # COLUMNA DERECHA: Botones de juego
@@ -183,16 +208,32 @@ class MenuScene(Scene):
         
         # Panel de opciones
         options_panel = Panel(right_x - 20, rules_y - 10, 280, 340, alpha=150)
-        options_panel.draw(screen)
+        options_panel.draw(layer)
         
         # Título de opciones
         options_title = self.subtitle_font.render("MODOS DE JUEGO", True, Colors.PINK)
-        screen.blit(options_title, (right_x, rules_y))
+        layer.blit(options_title, (right_x, rules_y))
+        
+        # El backend de texturas debe volver a subir la capa
+        self.game_manager.renderer.forget(layer)
+    
+    def render(self, renderer):
+        """Envía el menú al backend: capa estática, título animado y botones."""
+        renderer.blit(self.static_layer, (0, 0))
+        
+        # Título con animación de rebote
+        title_rect = self.title_text.get_rect(center=(SCREEN_WIDTH // 2, 80 + self._bounce_offset()))
+        renderer.blit(self.title_shadow, (title_rect.x + 4, title_rect.y + 4))
+        renderer.blit(self.title_text, title_rect)
         
         # Botones centrados en columna derecha
-        self.single_player_button.draw(screen)
-        self.coop_button.draw(screen)
-        self.quit_button.draw(screen)
+        self.single_player_button.render(renderer)
+        self.coop_button.render(renderer)
+        self.quit_button.render(renderer)
         
         # Efecto de transición
-        self.draw_transition(screen)
+        self.render_transition(renderer)
+    
+    def draw(self, screen: pygame.Surface):
+        """Dibuja el menú."""
+        self.render(self.surface_renderer(screen))
@@ -0,0 +1,244 @@
+"""
+Escena de juego del modo de dos procesos.
+La simulación corre en otro proceso (core.simulation_process); esta escena
+solo envía la entrada, copia la última instantánea publicada en memoria
+compartida a sus sprites de vista y los dibuja con GameScene.draw.
+"""
+import multiprocessing
+from typing import List, Optional
+import pygame
+from .game_scene import GameScene
+from ..config import ASSET_PATHS, ProcessConfig, IdleConfig
+from ..entities import Particle
+from ..core.shared_state import (
+    SharedFrameBuffer, NEXT_SCENE_NAMES, pack_input
+)
+from ..core.simulation_process import simulation_main
+from ..core.audio import SFX_NAMES
+
+
+class RemoteGameScene(GameScene):
+    """GameScene cuya lógica se ejecuta en un proceso de simulación aparte."""
+    
+    def __init__(self, game_manager):
+        super().__init__(game_manager)
+        self.process = None
+        self.conn = None
+        self.buffer = None
+        self.last_seq = 0
+        self.enemy_views = []
+        self.collectible_views = []
+        # La ventana perdió el foco: se pide la pausa a la simulación con la próxima entrada
+        self.pause_requested = False
+        # Contadores de efectos de la simulación ya reproducidos y los de la última lectura
+        self.cues_heard: Optional[List[int]] = None
+        self.cues_read: List[int] = []
+    
+    def on_enter(self):
+        """Arranca el proceso de simulación (la partida empieza allí)."""
+        self.transition_alpha = 255
+        self.transitioning_out = False
+        self.next_scene = None
+        self.pause_requested = False
+        self.game_mode = self.game_manager.game_mode
+        
+        # Estado de vista vacío hasta la primera instantánea
+        self._create_players()
+        self._sync_falling(self.enemies, self.enemy_views, self.enemy_pool, self.enemy_img, [], 'angle')
+        self._sync_falling(self.collectibles, self.collectible_views, self.collectible_pool, self.collectible_img, [], 'phase')
+        self.particles.clear()
+        self.round_manager.reset()
+        self.showing_round_transition = False
+        self.paused = False
+        self.game_manager.score_system.reset()
+        
+        self._start_simulation()
+        
+        # Música desde el principio (el stream queda cargado entre partidas)
+        self.game_manager.audio.play_music(ASSET_PATHS['music'])
+        self.cues_heard = None
+    
+    def on_exit(self):
+        """Detiene el proceso de simulación y libera la memoria compartida."""
+        super().on_exit()
+        self._stop_simulation()
+    
+    def _start_simulation(self):
+        context = multiprocessing.get_context(ProcessConfig.START_METHOD)
+        self.buffer = SharedFrameBuffer()
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=simulation_main,
+            args=(self.buffer.name, child_conn, self.game_mode, self.game_manager.quality.tier),
+            name='makeuprain-simulation',
+            daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.last_seq = 0
+    
+    def _stop_simulation(self):
+        if self.process is None:
+            return
+        try:
+            self.conn.send_bytes(b'')
+        except OSError:
+            pass  # El proceso ya terminó
+        self.process.join(ProcessConfig.JOIN_TIMEOUT)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+        self.buffer.close()
+        self.process = None
+        self.conn = None
+        self.buffer = None
+    
+    def handle_events(self, events: list):
+        """La pausa y la salida las decide la simulación al recibir la entrada."""
+    
+    def on_focus_lost(self):
+        """Pide la pausa a la simulación, que si no seguiría a su ritmo con la ventana en segundo plano."""
+        if IdleConfig.PAUSE_ON_FOCUS_LOSS:
+            self.pause_requested = True
+    
+    def is_static(self) -> bool:
+        """Nunca: las instantáneas de la simulación llegan sin eventos de pygame."""
+        return False
+    
+    def update(self):
+        """Envía la entrada y aplica la última instantánea de la simulación."""
+        if self.conn is not None:
+            snapshot = self.game_manager.input.snapshot
+            try:
+                self.conn.send_bytes(pack_input(
+                    snapshot.held, snapshot.pressed, self.game_manager.quality.tier, self.pause_requested
+                ))
+            except OSError:
+                pass  # La simulación terminó; su última instantánea indica a dónde ir
+            self.pause_requested = False
+        
+        self._apply_quality()
+        if not self.paused:
+            self.starfield.update()
+        
+        self._read_snapshot()
+        
+        combo, multiplier, time_ratio = self.game_manager.score_system.get_combo_info()
+        self.combo_bar.set_value(time_ratio * 100)
+        self.combo_bar.update()
+        
+        # La simulación ya hizo el fundido: cambiar de escena al terminar
+        if self.next_scene:
+            self.game_manager.change_scene(self.next_scene)
+    
+    def _read_snapshot(self):
+        """
+        Copia la última instantánea completa; reintenta si se reescribió durante la lectura.
+        Solo se aplica (estado, música, cambio de escena) una copia ya validada.
+        """
+        if self.buffer is None:
+            return
+        for _ in range(ProcessConfig.READ_RETRIES):
+            latest = self.buffer.latest()
+            if latest is None:
+                return
+            frame, seq = latest
+            if seq == self.last_seq:
+                return  # Sin tick nuevo desde el último frame
+            snapshot = frame.copy()
+            if self.buffer.is_intact(frame, seq):
+                self._apply_snapshot(snapshot)
+                self.last_seq = seq
+                self._play_cues()
+                return
+    
+    def _play_cues(self):
+        """Reproduce los efectos que la simulación pidió desde la última instantánea."""
+        if self.cues_heard is not None:
+            audio = self.game_manager.audio
+            for name, heard, count in zip(SFX_NAMES, self.cues_heard, self.cues_read):
+                # Como mucho dos por tick: el resto se solaparía igualmente
+                for _ in range(min(count - heard, 2)):
+                    audio.play(name)
+        self.cues_heard = self.cues_read
+    
+    def _apply_snapshot(self, frame):
+        paused = bool(frame['paused'])
+        if paused != self.paused:
+            if paused:
+                self.game_manager.audio.pause_music()
+            else:
+                self.game_manager.audio.resume_music()
+            self.paused = paused
+        self.showing_round_transition = bool(frame['round_transition'])
+        self.transition_alpha = int(frame['transition_alpha'])
+        
+        self.round_manager.current_round = int(frame['round'])
+        self.round_manager.items_collected_this_round = int(frame['items'])
+        self.round_bonus = int(frame['round_bonus'])
+        
+        score_system = self.game_manager.score_system
+        score_system.score = int(frame['score'])
+        score_system.high_score = int(frame['high_score'])
+        score_system.combo = int(frame['combo'])
+        score_system.combo_timer = float(frame['combo_timer'])
+        score_system.multiplier = float(frame['multiplier'])
+        
+        for player, record in zip(self.players, frame['players'][:int(frame['n_players'])]):
+            player.prev_x = player.rect.x
+            player.rect.topleft = (int(record['x']), int(record['y']))
+            player.lives = int(record['lives'])
+            player.score = int(record['score'])
+            player.alpha = int(record['alpha'])
+            player.dying = bool(record['dying'])
+            player.death_timer = int(record['death_timer'])
+        
+        self._sync_falling(
+            self.enemies, self.enemy_views, self.enemy_pool, self.enemy_img,
+            frame['enemies'][:int(frame['n_enemies'])], 'angle'
+        )
+        self._sync_falling(
+            self.collectibles, self.collectible_views, self.collectible_pool, self.collectible_img,
+            frame['collectibles'][:int(frame['n_collectibles'])], 'phase'
+        )
+        self._sync_particles(frame['particles'][:int(frame['n_particles'])])
+        self.cues_read = frame['sfx'].tolist()
+        
+        next_scene = NEXT_SCENE_NAMES.get(int(frame['next_scene']))
+        if next_scene and self.next_scene is None:
+            self.game_manager.audio.stop_music()
+            self.next_scene = next_scene
+    
+    @staticmethod
+    def _sync_falling(group, views: list, pool, image: pygame.Surface, records, attribute: str):
+        """Ajusta los sprites de vista (reciclados del pool) a los registros de la instantánea."""
+        count = len(records)
+        while len(views) < count:
+            sprite = pool.acquire(0, 0, image, 0.0)
+            group.add(sprite)
+            views.append(sprite)
+        while len(views) > count:
+            views.pop().kill()
+        if count:
+            for sprite, x, y, value in zip(views, records['x'].tolist(), records['y'].tolist(), records['value'].tolist()):
+                sprite.rect.topleft = (x, y)
+                setattr(sprite, attribute, value)
+    
+    def _sync_particles(self, records):
+        count = len(records)
+        while len(self.particles) < count:
+            self.particles.append(Particle(0, 0, (0, 0, 0), (0, 0)))
+        del self.particles[count:]
+        if count:
+            for particle, x, y, color, size, lifetime, max_lifetime in zip(
+                self.particles,
+                records['x'].tolist(), records['y'].tolist(), records['color'].tolist(),
+                records['size'].tolist(), records['lifetime'].tolist(), records['max_lifetime'].tolist()
+            ):
+                particle.x = x
+                particle.y = y
+                particle.color = tuple(color)
+                particle.size = size
+                particle.lifetime = lifetime
+                particle.max_lifetime = max_lifetime
@@ -3,11 +3,13 @@ __init__.py para el paquete ui.
 """
 from .components import Button, ProgressBar, FloatingText, Panel
 from .score_system import ScoreSystem
+from .starfield import Starfield
 
 __all__ = [
     'Button',
     'ProgressBar',
     'FloatingText',
     'Panel',
-    'ScoreSystem'
+    'ScoreSystem',
+    'Starfield'
 ]
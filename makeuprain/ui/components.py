@@ -2,13 +2,20 @@
 Componentes de UI modernos y reutilizables.
 """
 import pygame
-from typing import Tuple, Optional, Callable
+from typing import Dict, Tuple, Optional, Callable
 from ..config import Colors
 from ..utils import draw_text_with_shadow, draw_rounded_rect
 
 
 class Button:
-    """Botón interactivo con hover y animaciones."""
+    """
+    Botón interactivo con hover y animaciones.
+    Cada estado (normal / hover) se prerenderiza en SCALE_STEPS escalas entre
+    1.0 y HOVER_SCALE; dibujar el botón es un único blit.
+    """
+    
+    HOVER_SCALE = 1.05
+    SCALE_STEPS = 6
     
     def __init__(
         self,
@@ -31,44 +38,68 @@ class Button:
         self.is_hovered = False
         self.scale = 1.0
         self.font = pygame.font.Font(None, 32)
+        # (hover, paso de escala) -> superficie ya dibujada
+        self.surfaces: Dict[Tuple[bool, int], pygame.Surface] = {}
+        for hovered in (False, True):
+            for step in range(self.SCALE_STEPS + 1):
+                self.surfaces[(hovered, step)] = self._prerender(hovered, step)
+    
+    def _prerender(self, hovered: bool, step: int) -> pygame.Surface:
+        """Dibuja el botón en un estado y paso de escala."""
+        scale = 1.0 + (self.HOVER_SCALE - 1.0) * step / self.SCALE_STEPS
+        surface = pygame.Surface((int(self.rect.width * scale), int(self.rect.height * scale)), pygame.SRCALPHA)
+        rect = surface.get_rect()
         
-    def update(self, mouse_pos: Tuple[int, int]):
-        """Actualiza el estado del botón."""
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        # Rectángulo redondeado con el color del estado y borde
+        color = self.hover_color if hovered else self.color
+        draw_rounded_rect(surface, rect, color, radius=15)
+        pygame.draw.rect(surface, Colors.WHITE, rect, 2, border_radius=15)
+        
+        # Texto
+        text_surf = self.font.render(self.text, True, self.text_color)
+        surface.blit(text_surf, text_surf.get_rect(center=rect.center))
+        return surface
+    
+    @property
+    def animating(self) -> bool:
+        """True mientras la escala no haya llegado a la del estado actual."""
+        return self.scale != (self.HOVER_SCALE if self.is_hovered else 1.0)
+    
+    def update(self, mouse_pos: Optional[Tuple[int, int]] = None):
+        """
+        Anima el botón. El hover se actualiza con los eventos de ratón; mouse_pos
+        solo hace falta para fijarlo sin eventos (p. ej. al entrar en la escena).
+        """
+        if mouse_pos is not None:
+            self.is_hovered = self.rect.collidepoint(mouse_pos)
         
-        # Animación de escala
-        target_scale = 1.05 if self.is_hovered else 1.0
+        # Animación de escala (se fija al llegar, por debajo de un paso no se ve)
+        target_scale = self.HOVER_SCALE if self.is_hovered else 1.0
         self.scale += (target_scale - self.scale) * 0.2
+        if abs(target_scale - self.scale) < 0.001:
+            self.scale = target_scale
+    
+    def current_surface(self) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """Superficie prerenderizada del estado actual y su posición."""
+        step = round((self.scale - 1.0) / (self.HOVER_SCALE - 1.0) * self.SCALE_STEPS)
+        surface = self.surfaces[(self.is_hovered, max(0, min(self.SCALE_STEPS, step)))]
+        width, height = surface.get_size()
+        return surface, (self.rect.centerx - width // 2, self.rect.centery - height // 2)
     
     def draw(self, surface: pygame.Surface):
         """Dibuja el botón."""
-        # Calcular rectángulo con escala
-        scaled_width = int(self.rect.width * self.scale)
-        scaled_height = int(self.rect.height * self.scale)
-        scaled_rect = pygame.Rect(
-            self.rect.centerx - scaled_width // 2,
-            self.rect.centery - scaled_height // 2,
-            scaled_width,
-            scaled_height
-        )
-        
-        # Color basado en hover
-        color = self.hover_color if self.is_hovered else self.color
-        
-        # Dibujar rectángulo redondeado
-        draw_rounded_rect(surface, scaled_rect, color, radius=15)
-        
-        # Dibujar borde
-        pygame.draw.rect(surface, Colors.WHITE, scaled_rect, 2, border_radius=15)
-        
-        # Dibujar texto
-        text_surf = self.font.render(self.text, True, self.text_color)
-        text_rect = text_surf.get_rect(center=scaled_rect.center)
-        surface.blit(text_surf, text_rect)
+        surface.blit(*self.current_surface())
+    
+    def render(self, renderer):
+        """Envía el botón al backend de dibujo."""
+        renderer.blit(*self.current_surface())
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Maneja eventos del botón. Retorna True si fue clickeado."""
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+        if event.type == pygame.MOUSEMOTION:
+            self.is_hovered = self.rect.collidepoint(event.pos)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            self.is_hovered = self.rect.collidepoint(event.pos)
             if self.is_hovered and self.callback:
                 self.callback()
                 return True
@@ -140,27 +171,27 @@ class FloatingText:
         self.font = pygame.font.Font(None, size)
         self.vy = -2  # Velocidad vertical
         
+        # El texto no cambia: se renderiza una vez (el fade es el alfa del blit)
+        self.text_surf = self.font.render(text, True, color)
+        self.shadow = self.font.render(text, True, (0, 0, 0))
+    
     def update(self):
         """Actualiza el texto flotante."""
         self.y += self.vy
         self.vy += 0.05  # Desaceleración
         self.lifetime -= 1
     
-    def draw(self, surface: pygame.Surface):
-        """Dibuja el texto con fade out."""
+    def render(self, renderer):
+        """Envía el texto con fade out al backend de dibujo."""
         if self.lifetime > 0:
             alpha = int(255 * (self.lifetime / self.max_lifetime))
-            text_surf = self.font.render(self.text, True, self.color)
-            text_surf.set_alpha(alpha)
-            text_rect = text_surf.get_rect(center=(int(self.x), int(self.y)))
+            text_rect = self.text_surf.get_rect(center=(int(self.x), int(self.y)))
             
             # Sombra
-            shadow = self.font.render(self.text, True, (0, 0, 0))
-            shadow.set_alpha(alpha // 2)
-            surface.blit(shadow, (text_rect.x + 2, text_rect.y + 2))
+            renderer.blit(self.shadow, (text_rect.x + 2, text_rect.y + 2), alpha // 2)
             
             # Texto
-            surface.blit(text_surf, text_rect)
+            renderer.blit(self.text_surf, text_rect, alpha)
     
     def is_dead(self) -> bool:
         """Verifica si el texto debe ser eliminado."""
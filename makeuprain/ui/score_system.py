@@ -5,20 +5,30 @@ import pygame
 from typing import List
 from ..config import ScoreConfig, CollectibleConfig, Colors
 from ..utils import save_high_score, load_high_score
+from ..core.telemetry import telemetry, EventType
 from .components import FloatingText
 
 
 class ScoreSystem:
     """Gestiona el sistema de puntuación con combos."""
     
-    def __init__(self):
+    def __init__(self, clock):
+        """
+        Args:
+            clock: Reloj de la simulación (core.clock.GameClock) que mide la ventana de combo
+        """
+        self.clock = clock
+        self.combo_window = ScoreConfig.COMBO_TIME_WINDOW / 1000
         self.score = 0
         self.combo = 0
-        self.combo_timer = 0
+        self.combo_timer = 0.0  # Segundos simulados que le quedan al combo
+        self.combo_expires = 0.0
         self.multiplier = 1.0
         self.high_score = load_high_score(ScoreConfig.HIGH_SCORE_FILE)
+        self.high_score_dirty = False  # Récord nuevo pendiente de guardar en disco
         self.floating_texts: List[FloatingText] = []
-        
+        self.max_floating_texts = None  # Límite fijado por el gobernador de calidad
+    
     def add_points(self, x: float, y: float) -> int:
         """
         Añade puntos por recoger un item.
@@ -30,7 +40,8 @@ class ScoreSystem:
             Puntos ganados
         """
         self.combo += 1
-        self.combo_timer = ScoreConfig.COMBO_TIME_WINDOW // (1000 / 60)  # Convertir ms a frames
+        self.combo_expires = self.clock.now() + self.combo_window
+        self.combo_timer = self.combo_window
         
         # Calcular multiplicador basado en combo
         self.multiplier = 1.0
@@ -49,7 +60,7 @@ class ScoreSystem:
             text += f" x{self.multiplier:.1f}!"
         
         color = Colors.GOLD if self.multiplier == 1.0 else Colors.PINK
-        self.floating_texts.append(FloatingText(text, x, y, color, size=28))
+        self._add_floating_text(FloatingText(text, x, y, color, size=28))
         
         # Mostrar combo si es alto
         if self.combo >= 5 and self.combo % 5 == 0:
@@ -61,18 +72,31 @@ class ScoreSystem:
                 size=36,
                 lifetime=90
             )
-            self.floating_texts.append(combo_text)
+            self._add_floating_text(combo_text)
         
         # Actualizar high score
         if self.score > self.high_score:
             self.high_score = self.score
-            save_high_score(self.high_score, ScoreConfig.HIGH_SCORE_FILE)
+            # Se guarda fuera del frame (tarea en segundo plano de GameManager)
+            self.high_score_dirty = True
         
         return points_earned
     
+    def save_high_score(self):
+        """Escribe el récord actual en disco."""
+        self.high_score_dirty = False
+        save_high_score(self.high_score, ScoreConfig.HIGH_SCORE_FILE)
+    
+    def _add_floating_text(self, text: FloatingText):
+        """Añade un texto flotante descartando los más antiguos si se supera el límite."""
+        self.floating_texts.append(text)
+        if self.max_floating_texts is not None and len(self.floating_texts) > self.max_floating_texts:
+            del self.floating_texts[:len(self.floating_texts) - self.max_floating_texts]
+    
     def break_combo(self):
         """Rompe el combo actual."""
         if self.combo > 0:
+            telemetry.emit(EventType.COMBO_BREAK, self.combo, self.score)
             self.combo = 0
             self.multiplier = 1.0
     
@@ -80,7 +104,7 @@ class ScoreSystem:
         """Actualiza el sistema de puntuación."""
         # Actualizar timer de combo
         if self.combo > 0:
-            self.combo_timer -= 1
+            self.combo_timer = self.combo_expires - self.clock.now()
             if self.combo_timer <= 0:
                 self.break_combo()
         
@@ -90,20 +114,21 @@ class ScoreSystem:
             if text.is_dead():
                 self.floating_texts.remove(text)
     
-    def draw(self, surface: pygame.Surface):
-        """Dibuja los textos flotantes."""
+    def render(self, renderer):
+        """Envía los textos flotantes al backend de dibujo."""
         for text in self.floating_texts:
-            text.draw(surface)
+            text.render(renderer)
     
     def reset(self):
         """Reinicia el sistema de puntuación."""
         self.score = 0
         self.combo = 0
-        self.combo_timer = 0
+        self.combo_timer = 0.0
+        self.combo_expires = 0.0
         self.multiplier = 1.0
         self.floating_texts.clear()
     
     def get_combo_info(self) -> tuple:
         """Retorna (combo, multiplier, time_left_ratio)."""
-        time_ratio = self.combo_timer / (ScoreConfig.COMBO_TIME_WINDOW // (1000 / 60))
+        time_ratio = self.combo_timer / self.combo_window
         return (self.combo, self.multiplier, max(0, time_ratio))
@@ -0,0 +1,85 @@
+"""
+Fondo de estrellas con efecto parallax.
+Cada capa se pre-renderiza una vez en una superficie que se repite
+verticalmente, así el coste por frame es fijo (dos blits por capa).
+"""
+import pygame
+import random
+from typing import List
+from ..config import SCREEN_WIDTH, SCREEN_HEIGHT, StarfieldConfig
+
+
+class StarLayer:
+    """Capa de estrellas pre-renderizada que se desplaza hacia abajo."""
+    
+    def __init__(self, width: int, height: int, count: int, speed: float, radius: int, brightness: int, rng: random.Random):
+        self.height = height
+        self.speed = speed
+        self.offset = 0.0
+        
+        # Fondo negro con colorkey RLE: el blit solo recorre los píxeles de las estrellas
+        self.surface = pygame.Surface((width, height))
+        self.surface.set_colorkey((0, 0, 0), pygame.RLEACCEL)
+        color = (brightness, brightness, min(255, brightness + 20))
+        for _ in range(count):
+            x = rng.randrange(width)
+            y = rng.randrange(height)
+            pygame.draw.circle(self.surface, color, (x, y), radius)
+            # Repetir estrellas que tocan el borde para que la textura sea continua
+            if y < radius:
+                pygame.draw.circle(self.surface, color, (x, y + height), radius)
+            elif y > height - radius:
+                pygame.draw.circle(self.surface, color, (x, y - height), radius)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+    
+    def update(self, speed_scale: float = 1.0):
+        """Avanza el desplazamiento de la capa."""
+        self.offset = (self.offset + self.speed * speed_scale) % self.height
+    
+    def render(self, renderer):
+        """Dibuja la capa con dos blits (parte superior e inferior del mosaico)."""
+        y = int(self.offset)
+        renderer.blit(self.surface, (0, y))
+        if y > 0:
+            renderer.blit(self.surface, (0, y - self.height))
+
+
+class Starfield:
+    """Conjunto de capas de estrellas con distintas velocidades."""
+    
+    def __init__(
+        self,
+        width: int = SCREEN_WIDTH,
+        height: int = SCREEN_HEIGHT,
+        density: float = StarfieldConfig.DENSITY,
+        speed: float = StarfieldConfig.SPEED
+    ):
+        self.width = width
+        self.height = height
+        self.speed = speed
+        self.density = None
+        self.layers: List[StarLayer] = []
+        self.set_density(density)
+    
+    def set_density(self, density: float):
+        """Regenera las capas con una nueva densidad (solo si cambia)."""
+        if density == self.density:
+            return
+        self.density = density
+        rng = random.Random(StarfieldConfig.SEED)
+        self.layers = [
+            StarLayer(self.width, self.height, int(count * density), speed, radius, brightness, rng)
+            for count, speed, radius, brightness in StarfieldConfig.LAYERS
+            if int(count * density) > 0
+        ]
+    
+    def update(self, speed_scale: float = 1.0):
+        """Desplaza todas las capas."""
+        for layer in self.layers:
+            layer.update(self.speed * speed_scale)
+    
+    def render(self, renderer):
+        """Dibuja las capas de la más lejana a la más cercana."""
+        for layer in self.layers:
+            layer.render(renderer)
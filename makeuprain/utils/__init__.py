@@ -11,7 +11,10 @@ from .helpers import (
     draw_rounded_rect,
     save_high_score,
     load_high_score,
-    create_gradient_surface
+    create_gradient_surface,
+    create_multistop_gradient,
+    gradient_cache_info,
+    clear_gradient_cache
 )
 
 __all__ = [
@@ -25,5 +28,8 @@ __all__ = [
     'draw_rounded_rect',
     'save_high_score',
     'load_high_score',
-    'create_gradient_surface'
+    'create_gradient_surface',
+    'create_multistop_gradient',
+    'gradient_cache_info',
+    'clear_gradient_cache'
 ]
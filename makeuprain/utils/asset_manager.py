@@ -14,8 +14,8 @@ class AssetManager:
     def __init__(self):
         self._images: Dict[str, pygame.Surface] = {}
         self._sounds: Dict[str, pygame.mixer.Sound] = {}
-        self._music_loaded = False
-        
+        self._stats = {'hits': 0, 'misses': 0}
+    
     def load_image(self, filename: str, scale: Optional[tuple] = None) -> Optional[pygame.Surface]:
         """
         Carga una imagen desde la carpeta de assets.
@@ -28,7 +28,9 @@ class AssetManager:
             Surface de pygame o None si falla
         """
         if filename in self._images:
+            self._stats['hits'] += 1
             return self._images[filename]
+        self._stats['misses'] += 1
         
         # Intentar desde assets/images primero
         path = os.path.join(IMAGES_DIR, filename)
@@ -37,7 +39,10 @@ class AssetManager:
             path = os.path.join(BASE_DIR, filename)
         
         try:
-            image = pygame.image.load(path).convert_alpha()
+            image = pygame.image.load(path)
+            # Sin pantalla de pygame.display (backend de texturas) se conserva el formato del PNG
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha()
             if scale:
                 image = pygame.transform.scale(image, scale)
             self._images[filename] = image
@@ -50,6 +55,14 @@ class AssetManager:
             self._images[filename] = placeholder
             return placeholder
     
+    def find_sound(self, filename: str) -> Optional[str]:
+        """Ruta de un sonido o música (assets/sounds o la raíz del proyecto), o None si no existe."""
+        for directory in (SOUNDS_DIR, BASE_DIR):
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                return path
+        return None
+    
     def load_sound(self, filename: str) -> Optional[pygame.mixer.Sound]:
         """
         Carga un efecto de sonido.
@@ -63,9 +76,7 @@ class AssetManager:
         if filename in self._sounds:
             return self._sounds[filename]
         
-        path = os.path.join(SOUNDS_DIR, filename)
-        if not os.path.exists(path):
-            path = os.path.join(BASE_DIR, filename)
+        path = self.find_sound(filename) or os.path.join(SOUNDS_DIR, filename)
         
         try:
             sound = pygame.mixer.Sound(path)
@@ -75,48 +86,14 @@ class AssetManager:
             print(f"⚠️ No se pudo cargar sonido {filename}: {e}")
             return None
     
-    def load_music(self, filename: str) -> bool:
-        """
-        Carga música de fondo.
-        
-        Args:
-            filename: Nombre del archivo de música
-            
-        Returns:
-            True si se cargó correctamente
-        """
-        path = os.path.join(SOUNDS_DIR, filename)
-        if not os.path.exists(path):
-            path = os.path.join(BASE_DIR, filename)
-        
-        try:
-            pygame.mixer.music.load(path)
-            self._music_loaded = True
-            return True
-        except (pygame.error, FileNotFoundError) as e:
-            print(f"⚠️ No se pudo cargar música {filename}: {e}")
-            return False
-    
-    def play_music(self, loops: int = -1, volume: float = 0.6):
-        """Reproduce la música de fondo."""
-        if self._music_loaded:
-            try:
-                pygame.mixer.music.set_volume(volume)
-                pygame.mixer.music.play(loops)
-            except pygame.error:
-                pass
-    
-    def stop_music(self):
-        """Detiene la música de fondo."""
-        try:
-            pygame.mixer.music.stop()
-        except pygame.error:
-            pass
-    
     def get_image(self, filename: str) -> Optional[pygame.Surface]:
         """Obtiene una imagen cacheada."""
         return self._images.get(filename)
     
+    def cache_info(self) -> dict:
+        """Devuelve aciertos, fallos y tamaño actual del caché de imágenes."""
+        return {**self._stats, 'size': len(self._images)}
+    
     def clear_cache(self):
         """Limpia el caché de recursos."""
         self._images.clear()
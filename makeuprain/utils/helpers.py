@@ -5,7 +5,15 @@ import pygame
 import math
 import json
 import os
-from typing import Tuple
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+import numpy
+
+# Caché LRU de gradientes: (tamaño, colores, posiciones, dirección) -> Surface
+GRADIENT_CACHE_SIZE = 16
+_gradient_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+_gradient_stats = {'hits': 0, 'misses': 0}
 
 
 def lerp(start: float, end: float, t: float) -> float:
@@ -93,26 +101,75 @@ def create_gradient_surface(
     color2: Tuple[int, int, int],
     vertical: bool = True
 ) -> pygame.Surface:
-    """Crea una superficie con gradiente de color."""
-    surface = pygame.Surface((width, height))
+    """Crea una superficie con gradiente de color (cacheada, no modificar)."""
+    return create_multistop_gradient(width, height, (color1, color2), vertical=vertical)
+
+
+def create_multistop_gradient(
+    width: int,
+    height: int,
+    colors: Sequence[Tuple[int, int, int]],
+    vertical: bool = True,
+    positions: Optional[Sequence[float]] = None
+) -> pygame.Surface:
+    """
+    Crea un gradiente con varias paradas de color en una sola pasada vectorizada.
     
+    Args:
+        width, height: Tamaño de la superficie
+        colors: Colores de cada parada (al menos dos)
+        vertical: True = de arriba a abajo, False = de izquierda a derecha
+        positions: Posición (0.0 a 1.0) de cada parada; por defecto equiespaciadas
+        
+    Returns:
+        Surface en formato de pantalla. Es compartida por el caché: no modificarla.
+    """
+    colors = tuple(tuple(color[:3]) for color in colors)
+    if len(colors) < 2:
+        raise ValueError("Un gradiente necesita al menos dos colores")
+    if positions is None:
+        positions = tuple(i / (len(colors) - 1) for i in range(len(colors)))
+    else:
+        positions = tuple(positions)
+        if len(positions) != len(colors):
+            raise ValueError("Debe haber una posición por cada color")
+    
+    key = (width, height, colors, positions, vertical)
+    surface = _gradient_cache.get(key)
+    if surface is not None:
+        _gradient_cache.move_to_end(key)
+        _gradient_stats['hits'] += 1
+        return surface
+    _gradient_stats['misses'] += 1
+    
+    # Rampa 1D interpolada por canal y expandida a todo el array (w, h, 3)
+    length = height if vertical else width
+    t = numpy.linspace(0.0, 1.0, length, endpoint=False)
+    stops = numpy.array(colors, dtype=numpy.float64)
+    ramp = numpy.empty((length, 3), dtype=numpy.uint8)
+    for channel in range(3):
+        ramp[:, channel] = numpy.interp(t, positions, stops[:, channel])
     if vertical:
-        for y in range(height):
-            t = y / height
-            color = (
-                int(lerp(color1[0], color2[0], t)),
-                int(lerp(color1[1], color2[1], t)),
-                int(lerp(color1[2], color2[2], t))
-            )
-            pygame.draw.line(surface, color, (0, y), (width, y))
+        pixels = numpy.broadcast_to(ramp[numpy.newaxis, :, :], (width, height, 3))
     else:
-        for x in range(width):
-            t = x / width
-            color = (
-                int(lerp(color1[0], color2[0], t)),
-                int(lerp(color1[1], color2[1], t)),
-                int(lerp(color1[2], color2[2], t))
-            )
-            pygame.draw.line(surface, color, (x, 0), (x, height))
+        pixels = numpy.broadcast_to(ramp[:, numpy.newaxis, :], (width, height, 3))
+    surface = pygame.surfarray.make_surface(numpy.ascontiguousarray(pixels))
     
+    # Convertir al formato de la pantalla para que el blit sea rápido
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert()
+    
+    _gradient_cache[key] = surface
+    while len(_gradient_cache) > GRADIENT_CACHE_SIZE:
+        _gradient_cache.popitem(last=False)
     return surface
+
+
+def gradient_cache_info() -> dict:
+    """Devuelve aciertos, fallos y tamaño actual del caché de gradientes."""
+    return {**_gradient_stats, 'size': len(_gradient_cache)}
+
+
+def clear_gradient_cache():
+    """Vacía el caché de gradientes (p. ej. tras cambiar el modo de vídeo)."""
+    _gradient_cache.clear()